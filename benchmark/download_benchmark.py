@@ -0,0 +1,356 @@
+#  Copyright 2020 IBM Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Benchmarks of dg.utils.download and dg.utils.compression against a local
+HTTP server
+
+Execute the following command to print the results as JSON:
+
+python -m benchmark.download_benchmark [--output results.json]
+
+Each measurement is executed in a separate process so that its peak resident
+set size (RSS) and CPU time (of all threads) are not affected by other
+measurements or by the HTTP server.
+"""
+
+import concurrent.futures
+import io
+import multiprocessing
+import os
+import pathlib
+import re as regex
+import resource
+import shutil
+import tarfile
+import tempfile
+import time
+import urllib.parse
+import zipfile
+
+from typing import Any, Callable, Union
+
+import click
+
+import dg.utils.compression
+import dg.utils.download
+import dg.utils.download_cache
+
+from benchmark.utils import get_duration_statistics, get_environment, write_results
+from test.utils.local_http_server import LocalHTTPServer
+
+# function executing one iteration of a measurement (arguments: URL of the
+# artifact, path of a local copy of the artifact, and path of an empty
+# working directory)
+Measurement = Callable[[urllib.parse.SplitResult, pathlib.Path, pathlib.Path], None]
+
+
+def _download_and_extract_archive(url: urllib.parse.SplitResult, _: pathlib.Path, working_directory_path: pathlib.Path):
+    dg.utils.download.download_and_extract_archive(url, working_directory_path)
+
+
+def _download_file(
+    url: urllib.parse.SplitResult, _: pathlib.Path, working_directory_path: pathlib.Path, connection_count: int
+):
+    dg.utils.download.download_file(
+        url, connection_count=connection_count, target_directory_path=working_directory_path
+    )
+
+
+def _download_file_and_extract_archive(
+    url: urllib.parse.SplitResult, _: pathlib.Path, working_directory_path: pathlib.Path
+):
+    archive_path = dg.utils.download.download_file(url, target_directory_path=working_directory_path)
+
+    dg.utils.compression.extract_archive(archive_path, working_directory_path / "extracted")
+
+
+def _download_file_into_buffer(url: urllib.parse.SplitResult, _: pathlib.Path, working_directory_path: pathlib.Path):
+    with io.BytesIO() as buffer:
+        dg.utils.download.download_file_into_buffer(url, buffer, silent=True)
+
+
+def _extract_archive(_: urllib.parse.SplitResult, archive_path: pathlib.Path, working_directory_path: pathlib.Path):
+    dg.utils.compression.extract_archive(archive_path, working_directory_path)
+
+
+def _get_peak_rss() -> int:
+    """Returns the peak resident set size of the current process [bytes]"""
+
+    status_file_path = pathlib.Path("/proc/self/status")
+
+    if status_file_path.exists():
+        # on Linux, the maximum RSS reported by getrusage() includes the RSS
+        # of the parent process at the time the process was spawned
+        search_result = regex.search("^VmHWM:\\s+(\\d+) kB$", status_file_path.read_text(), regex.MULTILINE)
+
+        if search_result is not None:
+            return int(search_result.group(1)) * 1024
+
+    # macOS reports bytes
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _run_measurement(
+    measurement_name: str,
+    url: str,
+    archive_path: pathlib.Path,
+    iterations: int,
+    cache_directory_path: Union[pathlib.Path, None],
+    kwargs: dict[str, Any],
+) -> dict[str, Any]:
+    """Executes all iterations of a measurement (in a separate process)"""
+
+    measurement: Measurement = lambda *args: _measurements[measurement_name](*args, **kwargs)
+    split_url = urllib.parse.urlsplit(url)
+
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        working_directory_path = pathlib.Path(temporary_directory) / "working"
+
+        if cache_directory_path is not None:
+            dg.utils.download_cache.set_download_cache(dg.utils.download_cache.DownloadCache(cache_directory_path))
+
+            # populate the cache
+            working_directory_path.mkdir()
+            measurement(split_url, archive_path, working_directory_path)
+            shutil.rmtree(working_directory_path)
+
+        cpu_times: list[float] = []
+        durations: list[float] = []
+
+        for _ in range(iterations):
+            working_directory_path.mkdir()
+
+            start_cpu_time = time.process_time()
+            start_time = time.perf_counter()
+
+            measurement(split_url, archive_path, working_directory_path)
+
+            durations.append(time.perf_counter() - start_time)
+            cpu_times.append(time.process_time() - start_cpu_time)
+
+            shutil.rmtree(working_directory_path)
+
+    result = get_duration_statistics(durations)
+    result["cpu_time"] = get_duration_statistics(cpu_times)["median"]
+    result["peak_rss_mebibytes"] = _get_peak_rss() / 1048576
+
+    return result
+
+
+_measurements: dict[str, Callable[..., None]] = {
+    "download_and_extract_archive": _download_and_extract_archive,
+    "download_file": _download_file,
+    "download_file_and_extract_archive": _download_file_and_extract_archive,
+    "download_file_into_buffer": _download_file_into_buffer,
+    "extract_archive": _extract_archive,
+}
+
+
+class DownloadBenchmark:
+    """Measures the throughput, peak RSS, and CPU time of downloading and
+    extracting synthetic tar.gz and zip archives
+
+    Single-stream downloads are compared with parallel (segmented)
+    downloads, uncached downloads with cached downloads (validated using
+    conditional requests), and extracting tar.gz archives while they are
+    downloaded (streaming) with downloading them before extracting them
+    (two-phase).
+    """
+
+    def __init__(self, server: LocalHTTPServer, artifacts_directory_path: pathlib.Path, iterations: int):
+        self._artifacts_directory_path = artifacts_directory_path
+        self._iterations = iterations
+        self._server = server
+
+    def measure_archive(self, path: str) -> dict[str, Any]:
+        result: dict[str, Any] = {
+            "download_file": {
+                "single_stream": self._measure(path, "download_file", connection_count=1),
+                "parallel": self._measure(path, "download_file", connection_count=4),
+                "cached": self._measure(path, "download_file", cached=True, connection_count=4),
+            },
+            "download_file_into_buffer": {
+                "uncached": self._measure(path, "download_file_into_buffer"),
+                "cached": self._measure(path, "download_file_into_buffer", cached=True),
+            },
+            "extract_archive": self._measure(path, "extract_archive"),
+            "download_and_extract_archive": {
+                "two_phase": self._measure(path, "download_file_and_extract_archive"),
+            },
+        }
+
+        if path.endswith(".tar.gz"):
+            result["download_and_extract_archive"]["streaming"] = self._measure(path, "download_and_extract_archive")
+            result["download_and_extract_archive"]["streaming_cached"] = self._measure(
+                path, "download_and_extract_archive", cached=True
+            )
+
+        return result
+
+    def _measure(self, path: str, measurement_name: str, cached: bool = False, **kwargs: Any) -> dict[str, Any]:
+        archive_path = self._artifacts_directory_path / path.lstrip("/")
+
+        with tempfile.TemporaryDirectory() as cache_directory:
+            # a new process is spawned for each measurement to measure its
+            # peak RSS
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=1, mp_context=multiprocessing.get_context("spawn")
+            ) as executor:
+                result = executor.submit(
+                    _run_measurement,
+                    measurement_name,
+                    self._server.get_url(path).geturl(),
+                    archive_path,
+                    self._iterations,
+                    pathlib.Path(cache_directory) if cached else None,
+                    kwargs,
+                ).result()
+
+        result["megabytes_per_second"] = archive_path.stat().st_size / 1048576 / result["median"]
+
+        return result
+
+
+def create_artifacts(directory_path: pathlib.Path, size: int) -> dict[str, bytes]:
+    """Creates synthetic tar.gz and zip archives
+
+    Each archive contains four files whose total size is the given size. Half
+    of the contents are random (i.e., the archives are compressed by a factor
+    of about two, similar to archives containing binaries).
+
+    Parameters
+    ----------
+    directory_path
+        path of the directory the archives are stored in
+    size
+        total size of the files contained in each archive [bytes]
+
+    Returns
+    -------
+    dict[str, bytes]
+        dictionary associating URL paths with the contents of the archives
+    """
+
+    file_size = size // 4
+    files = {
+        f"artifact/file-{index}": b"".join(
+            os.urandom(min(65536, file_size - offset) // 2) + bytes(min(65536, file_size - offset) // 2)
+            for offset in range(0, file_size, 65536)
+        )
+        for index in range(4)
+    }
+
+    size_in_mebibytes = size // 1048576
+    tar_gz_archive_path = directory_path / f"artifact-{size_in_mebibytes}.tar.gz"
+    zip_archive_path = directory_path / f"artifact-{size_in_mebibytes}.zip"
+
+    with tarfile.open(tar_gz_archive_path, "w:gz") as tar_file:
+        for name, contents in files.items():
+            tar_info = tarfile.TarInfo(name)
+            tar_info.size = len(contents)
+
+            tar_file.addfile(tar_info, io.BytesIO(contents))
+
+    with zipfile.ZipFile(zip_archive_path, "w", compression=zipfile.ZIP_DEFLATED) as zip_file:
+        for name, contents in files.items():
+            zip_file.writestr(name, contents)
+
+    return {f"/{path.name}": path.read_bytes() for path in [tar_gz_archive_path, zip_archive_path]}
+
+
+def run_download_benchmark(
+    iterations: int, sizes: list[int], latency: float, bandwidth: Union[int, None]
+) -> dict[str, Any]:
+    """Runs all download benchmarks
+
+    Parameters
+    ----------
+    iterations
+        number of iterations of each measurement
+    sizes
+        total sizes of the files contained in the synthetic archives [bytes]
+    latency
+        number of seconds each response of the HTTP server is delayed
+    bandwidth
+        maximum number of bytes per second sent by the HTTP server on each
+        connection (unlimited if None)
+
+    Returns
+    -------
+    dict[str, Any]
+        benchmark results
+    """
+
+    result: dict[str, Any] = {}
+
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        artifacts_directory_path = pathlib.Path(temporary_directory)
+        files: dict[str, bytes] = {}
+
+        for size in sizes:
+            files.update(create_artifacts(artifacts_directory_path, size))
+
+        with LocalHTTPServer(files, bandwidth=bandwidth, latency=latency) as server:
+            benchmark = DownloadBenchmark(server, artifacts_directory_path, iterations)
+
+            for path, contents in files.items():
+                result[path.lstrip("/")] = {"size": len(contents), **benchmark.measure_archive(path)}
+
+    return result
+
+
+@click.command()
+@click.option(
+    "--bandwidth",
+    help="Maximum bandwidth of each connection to the HTTP server [MiB/s] (default: unlimited)",
+    type=float,
+)
+@click.option("--iterations", default=5, help="Number of iterations of each measurement", show_default=True)
+@click.option("--latency", default=0.0, help="Latency of each response of the HTTP server [ms]", show_default=True)
+@click.option("--output", help="Path of the JSON file the results are written to (stdout if not set)")
+@click.option(
+    "--size",
+    default=[16, 128],
+    help="Total size of the files contained in an archive [MiB] (may be passed multiple times)",
+    multiple=True,
+    show_default=True,
+    type=click.IntRange(min=1),
+)
+def main(bandwidth: Union[float, None], iterations: int, latency: float, output: Union[str, None], size: tuple[int]):
+    """Benchmark dg.utils.download and dg.utils.compression against a local
+    HTTP server"""
+
+    # disable progress bars of downloads (tqdm reads environment variables
+    # when it is imported by processes executing measurements)
+    os.environ["TQDM_DISABLE"] = "1"
+
+    results = run_download_benchmark(
+        iterations,
+        [mebibytes * 1048576 for mebibytes in size],
+        latency / 1000,
+        int(bandwidth * 1048576) if bandwidth is not None else None,
+    )
+
+    write_results(
+        {
+            "environment": get_environment(),
+            "server": {"bandwidth": bandwidth, "latency": latency},
+            "download": results,
+        },
+        output,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+#  Copyright 2020 IBM Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Benchmarks of dg.utils.ssh.RemoteClient against a local SSH server
+
+Execute the following command to print the results as JSON:
+
+python -m benchmark.ssh_benchmark [--output results.json]
+"""
+
+import asyncio
+import os
+import pathlib
+import tempfile
+import time
+
+from typing import Any, Awaitable, Callable, Union
+
+import click
+
+import dg.utils.ssh
+
+from benchmark.utils import get_duration_statistics, get_environment, write_results
+from test.utils.local_ssh_server import LocalSSHServer
+
+
+class SSHBenchmark:
+    """Measures connection setup time, command latency, output and upload
+    throughput, and the scaling of concurrent command executions"""
+
+    def __init__(self, server: LocalSSHServer, iterations: int):
+        self._iterations = iterations
+        self._server = server
+
+    async def measure_command_latency(self) -> dict[str, Any]:
+        async with self._create_client() as remote_client:
+            await remote_client.connect()
+
+            return await self._measure(lambda: remote_client.execute("true", print_output=False))
+
+    async def measure_concurrency_scaling(self, concurrencies: list[int]) -> dict[str, Any]:
+        result: dict[str, Any] = {}
+
+        async with self._create_client() as remote_client:
+            await remote_client.connect()
+
+            for concurrency in concurrencies:
+                command_count = concurrency * self._iterations
+                start_time = time.perf_counter()
+
+                semaphore = asyncio.Semaphore(concurrency)
+
+                async def execute():
+                    async with semaphore:
+                        await remote_client.execute("true", print_output=False)
+
+                await asyncio.gather(*[execute() for _ in range(command_count)])
+
+                duration = time.perf_counter() - start_time
+
+                result[str(concurrency)] = {
+                    "commands": command_count,
+                    "commands_per_second": command_count / duration,
+                    "duration": duration,
+                }
+
+        return result
+
+    async def measure_connection_setup(self) -> dict[str, Any]:
+        async def connect():
+            # a separate pool forces a new SSH handshake for each connection
+            connection_pool = self._create_connection_pool()
+
+            async with dg.utils.ssh.RemoteClient("127.0.0.1", connection_pool=connection_pool) as remote_client:
+                await remote_client.connect()
+
+            await connection_pool.close()
+
+        return await self._measure(connect)
+
+    async def measure_output_throughput(self, size: int, max_captured_size: Union[int, None]) -> dict[str, Any]:
+        async with self._create_client() as remote_client:
+            await remote_client.connect()
+
+            result = await self._measure(
+                lambda: remote_client.execute(
+                    f"head -c {size} /dev/zero | tr '\\0' x", max_captured_size=max_captured_size, print_output=False
+                )
+            )
+
+        return self._add_throughput(result, size)
+
+    async def measure_upload_throughput(
+        self, local_directory_path: pathlib.Path, size: int, compress: bool
+    ) -> dict[str, Any]:
+        file_path = local_directory_path / "upload.bin"
+
+        with open(file_path, "wb") as file:
+            for _ in range(size // 1048576):
+                file.write(os.urandom(1048576))
+
+        async with self._create_client() as remote_client:
+            await remote_client.connect()
+
+            result = await self._measure(
+                lambda: remote_client.upload(file_path, compress=compress, skip_identical_files=False)
+            )
+
+            skipped_result = await self._measure(lambda: remote_client.upload(file_path, compress=compress))
+
+        return {"transfer": self._add_throughput(result, size), "identical_file_skipped": skipped_result}
+
+    def _add_throughput(self, result: dict[str, Any], size: int) -> dict[str, Any]:
+        result["megabytes_per_second"] = size / 1048576 / result["median"]
+
+        return result
+
+    def _create_client(self) -> dg.utils.ssh.RemoteClient:
+        return dg.utils.ssh.RemoteClient("127.0.0.1", connection_pool=self._create_connection_pool())
+
+    def _create_connection_pool(self) -> dg.utils.ssh.SSHConnectionPool:
+        return dg.utils.ssh.SSHConnectionPool(connect_options=self._server.get_connect_options())
+
+    async def _measure(self, execute: Callable[[], Awaitable[Any]]) -> dict[str, Any]:
+        durations: list[float] = []
+
+        for _ in range(self._iterations):
+            start_time = time.perf_counter()
+
+            await execute()
+
+            durations.append(time.perf_counter() - start_time)
+
+        return get_duration_statistics(durations)
+
+
+async def run_ssh_benchmark(iterations: int, output_size: int, upload_size: int) -> dict[str, Any]:
+    """Runs all SSH benchmarks
+
+    Parameters
+    ----------
+    iterations
+        number of iterations of each measurement
+    output_size
+        number of bytes written to stdout by the command measuring output
+        throughput
+    upload_size
+        number of bytes of the file measuring upload throughput
+
+    Returns
+    -------
+    dict[str, Any]
+        benchmark results
+    """
+
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        local_directory_path = pathlib.Path(temporary_directory) / "local"
+        local_directory_path.mkdir()
+        remote_root_directory_path = pathlib.Path(temporary_directory) / "remote"
+        remote_root_directory_path.mkdir()
+
+        async with LocalSSHServer(remote_root_directory_path) as server:
+            benchmark = SSHBenchmark(server, iterations)
+
+            return {
+                "connection_setup": await benchmark.measure_connection_setup(),
+                "command_latency": await benchmark.measure_command_latency(),
+                "output_throughput": {
+                    "captured": await benchmark.measure_output_throughput(output_size, None),
+                    "tail_captured": await benchmark.measure_output_throughput(output_size, 65536),
+                },
+                "upload_throughput": {
+                    "sftp": await benchmark.measure_upload_throughput(local_directory_path, upload_size, False),
+                    "compressed": await benchmark.measure_upload_throughput(local_directory_path, upload_size, True),
+                },
+                "concurrency_scaling": await benchmark.measure_concurrency_scaling([1, 2, 4, 8, 16]),
+            }
+
+
+@click.command()
+@click.option("--iterations", default=10, help="Number of iterations of each measurement", show_default=True)
+@click.option("--output", help="Path of the JSON file the results are written to (stdout if not set)")
+@click.option("--output-size", default=64, help="Size of the output of a command [MiB]", show_default=True)
+@click.option("--upload-size", default=64, help="Size of the uploaded file [MiB]", show_default=True)
+def main(iterations: int, output: Union[str, None], output_size: int, upload_size: int):
+    """Benchmark dg.utils.ssh.RemoteClient against a local SSH server"""
+
+    results = asyncio.run(run_ssh_benchmark(iterations, output_size * 1048576, upload_size * 1048576))
+
+    write_results({"environment": get_environment(), "ssh": results}, output)
+
+
+if __name__ == "__main__":
+    main()
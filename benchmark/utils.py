@@ -0,0 +1,87 @@
+#  Copyright 2020 IBM Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import datetime
+import json
+import platform
+import statistics
+
+from typing import Any, Union
+
+import asyncssh
+import click
+
+
+def get_duration_statistics(durations: list[float]) -> dict[str, Any]:
+    """Returns statistics of the given durations
+
+    Parameters
+    ----------
+    durations
+        durations of several iterations of a measurement [s]
+
+    Returns
+    -------
+    dict[str, Any]
+        number of iterations as well as minimum, median, mean, 95th
+        percentile, and maximum duration [s]
+    """
+
+    sorted_durations = sorted(durations)
+
+    return {
+        "iterations": len(durations),
+        "min": sorted_durations[0],
+        "median": statistics.median(sorted_durations),
+        "mean": statistics.mean(sorted_durations),
+        "p95": sorted_durations[min(len(sorted_durations) - 1, int(len(sorted_durations) * 0.95))],
+        "max": sorted_durations[-1],
+    }
+
+
+def get_environment() -> dict[str, Any]:
+    """Returns information about the environment benchmarks are executed in
+
+    Returns
+    -------
+    dict[str, Any]
+        timestamp and versions of relevant software
+    """
+
+    return {
+        "asyncssh": asyncssh.__version__,
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+    }
+
+
+def write_results(results: dict[str, Any], output: Union[str, None]):
+    """Writes benchmark results as JSON to the given file or stdout
+
+    Parameters
+    ----------
+    results
+        benchmark results
+    output
+        path of the file the results are written to (stdout if None)
+    """
+
+    results_as_json = json.dumps(results, indent=4)
+
+    if output is not None:
+        with open(output, "w") as output_file:
+            output_file.write(results_as_json + "\n")
+    else:
+        click.echo(results_as_json)
@@ -0,0 +1,26 @@
+#  Copyright 2020 IBM Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import sys
+
+import click
+
+from dg.lib.click.lazy_loading_multi_command import create_click_multi_command_class
+
+
+@click.command(cls=create_click_multi_command_class(sys.modules[__name__]))
+def bundle():
+    """Create and install bundles of dependencies for offline installation"""
+
+    pass
@@ -0,0 +1,66 @@
+#  Copyright 2020 IBM Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import pathlib
+
+import click
+import semver
+
+import dg.lib.bundle
+import dg.lib.download_manager
+
+from dg.lib.cloud_pak_for_data.cpd_manager import CloudPakForDataAssemblyBuildType
+from dg.lib.cloud_pak_for_data.cpd_manager_factory import CloudPakForDataManagerFactory
+from dg.utils.logging import loglevel_command
+
+
+@loglevel_command()
+@click.option(
+    "--build-type",
+    default=[CloudPakForDataAssemblyBuildType.RELEASE.name.lower()],
+    help="Build type of bundled IBM Cloud Pak for Data installers (may be passed multiple times)",
+    multiple=True,
+    show_default=True,
+    type=click.Choice(
+        list(map(lambda x: x.name.lower(), CloudPakForDataAssemblyBuildType)),
+        case_sensitive=False,
+    ),
+)
+@click.option(
+    "--cpd-version",
+    help="Version of IBM Cloud Pak for Data whose installer shall be bundled (may be passed multiple times)",
+    multiple=True,
+)
+@click.argument("bundle_path", type=click.Path(dir_okay=False))
+def create(build_type: tuple[str, ...], cpd_version: tuple[str, ...], bundle_path: str):
+    """Create a bundle of all dependencies for offline installation
+
+    Dependencies are downloaded if required. The bundle may be installed
+    without network access using "dg adm bundle install".
+    """
+
+    cloud_pak_for_data_managers = [
+        CloudPakForDataManagerFactory.get_cloud_pak_for_data_manager(semver.VersionInfo.parse(version))(
+            CloudPakForDataAssemblyBuildType[build_type_name.upper()]
+        )
+        for version in cpd_version
+        for build_type_name in build_type
+    ]
+
+    manifest = dg.lib.bundle.create_bundle(
+        pathlib.Path(bundle_path), dg.lib.download_manager.download_manager, cloud_pak_for_data_managers
+    )
+
+    for binary_alias, binary in manifest["binaries"].items():
+        click.echo(f"Bundled {binary_alias} {binary['version']}")
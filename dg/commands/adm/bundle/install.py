@@ -0,0 +1,33 @@
+#  Copyright 2020 IBM Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import pathlib
+
+import click
+
+import dg.lib.bundle
+
+from dg.utils.logging import loglevel_command
+
+
+@loglevel_command()
+@click.argument("bundle_path", type=click.Path(dir_okay=False, exists=True))
+def install(bundle_path: str):
+    """Install the dependencies contained in a bundle created by "dg adm
+    bundle create" without network access"""
+
+    manifest = dg.lib.bundle.install_bundle(pathlib.Path(bundle_path))
+
+    for binary_alias, binary in manifest["binaries"].items():
+        click.echo(f"Installed {binary_alias} {binary['version']}")
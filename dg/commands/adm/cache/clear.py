@@ -0,0 +1,31 @@
+#  Copyright 2020 IBM Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import click
+
+import dg.config
+import dg.utils.download_cache
+
+from dg.utils.logging import loglevel_command
+
+
+@loglevel_command()
+def clear():
+    """Remove all cached files"""
+
+    dg.utils.download_cache.DownloadCache(
+        dg.config.data_gate_configuration_manager.get_dg_download_cache_directory_path()
+    ).clear()
+
+    click.echo("Download cache cleared")
@@ -0,0 +1,65 @@
+#  Copyright 2020 IBM Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import datetime
+import json as json_module
+
+import click
+
+from tabulate import tabulate
+
+import dg.config
+import dg.utils.download_cache
+
+from dg.utils.logging import loglevel_command
+
+
+@loglevel_command(default_log_level="WARNING")
+@click.option(
+    "--json",
+    required=False,
+    help="Prints the command output in JSON format.",
+    is_flag=True,
+)
+def ls(json: bool):
+    """List cached files"""
+
+    download_cache = dg.utils.download_cache.DownloadCache(
+        dg.config.data_gate_configuration_manager.get_dg_download_cache_directory_path()
+    )
+
+    entries = sorted(download_cache.get_entries().values(), key=lambda entry: entry.last_access_time, reverse=True)
+
+    if json:
+        click.echo(json_module.dumps([entry.to_dict() for entry in entries], indent=4))
+    else:
+        click.echo(
+            tabulate(
+                [
+                    [
+                        entry.url,
+                        entry.file_name,
+                        f"{entry.size / 1048576:.1f}",
+                        datetime.datetime.fromtimestamp(entry.last_access_time).isoformat(timespec="seconds"),
+                    ]
+                    for entry in entries
+                ],
+                headers=["URL", "File name", "Size (MiB)", "Last access"],
+            )
+        )
+
+        click.echo(
+            f"\nTotal size: {download_cache.get_size() / 1048576:.1f} MiB "
+            f"(maximum: {download_cache.max_size / 1048576:.1f} MiB)"
+        )
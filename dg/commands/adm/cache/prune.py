@@ -0,0 +1,39 @@
+#  Copyright 2020 IBM Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from typing import Union
+
+import click
+
+import dg.config
+import dg.utils.download_cache
+
+from dg.utils.logging import loglevel_command
+
+
+@loglevel_command()
+@click.option(
+    "--max-size",
+    help="Maximum total size of cached files in MiB (default: maximum size of the cache)",
+    type=click.IntRange(min=0),
+)
+def prune(max_size: Union[int, None]):
+    """Evict least recently used files until the cache does not exceed the
+    given size"""
+
+    removed_blob_count = dg.utils.download_cache.DownloadCache(
+        dg.config.data_gate_configuration_manager.get_dg_download_cache_directory_path()
+    ).prune(max_size * 1048576 if max_size is not None else None)
+
+    click.echo(f"Removed {removed_blob_count} cached file(s)")
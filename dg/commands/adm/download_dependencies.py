@@ -12,13 +12,23 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import click
+
 import dg.lib.download_manager
 
+from dg.lib.download_manager.download_manager import DEFAULT_MAX_PARALLELISM
 from dg.utils.logging import loglevel_command
 
 
 @loglevel_command()
-def download_dependencies():
+@click.option(
+    "--max-parallelism",
+    default=DEFAULT_MAX_PARALLELISM,
+    help="Maximum number of dependencies downloaded at the same time",
+    show_default=True,
+    type=click.IntRange(min=1),
+)
+def download_dependencies(max_parallelism: int):
     """Download dependencies"""
 
-    dg.lib.download_manager.download_manager.download_dependencies_if_required()
+    dg.lib.download_manager.download_manager.download_dependencies_if_required(max_parallelism)
@@ -0,0 +1,43 @@
+#  Copyright 2020 IBM Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import asyncio
+
+import click
+
+import dg.config
+import dg.utils.ssh
+import dg.utils.ssh_agent
+
+from dg.lib.error import DataGateCLIException
+from dg.utils.logging import loglevel_command
+
+
+@loglevel_command()
+@click.option(
+    "--lifetime",
+    default=dg.utils.ssh.DEFAULT_SSH_AGENT_LIFETIME,
+    help="Number of seconds after which the agent exits if it is not used",
+    show_default=True,
+    type=float,
+)
+def start(lifetime: float):
+    """Start the SSH agent in the background"""
+
+    socket_path = dg.config.data_gate_configuration_manager.get_dg_ssh_agent_socket_path()
+
+    if asyncio.get_event_loop().run_until_complete(dg.utils.ssh_agent.get_ssh_agent_status(socket_path)) is not None:
+        raise DataGateCLIException("SSH agent is already running")
+
+    dg.utils.ssh.start_ssh_agent(socket_path, lifetime)
@@ -0,0 +1,32 @@
+#  Copyright 2020 IBM Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import asyncio
+
+import click
+
+import dg.config
+import dg.utils.ssh_agent
+
+from dg.utils.logging import loglevel_command
+
+
+@loglevel_command()
+def stop():
+    """Stop the SSH agent and close all connections held by it"""
+
+    if not asyncio.get_event_loop().run_until_complete(
+        dg.utils.ssh_agent.stop_ssh_agent(dg.config.data_gate_configuration_manager.get_dg_ssh_agent_socket_path())
+    ):
+        click.echo("SSH agent is not running")
@@ -24,6 +24,7 @@ from dg.utils.logging import loglevel_command
 @loglevel_command()
 @click.option("--artifactory-api-key", help="Artifactory API key")
 @click.option("--artifactory-user-name", help="Artifactory user name")
+@click.option("--github-api-key", help="GitHub personal access token (increases the GitHub API rate limit)")
 @click.option("--ibm-cloud-api-key", help="IBM Cloud API key")
 @click.option(
     "--ibm-cloud-pak-for-data-entitlement-key",
@@ -33,6 +34,7 @@ from dg.utils.logging import loglevel_command
 def store_credentials(
     artifactory_api_key: Union[str, None],
     artifactory_user_name: Union[str, None],
+    github_api_key: Union[str, None],
     ibm_cloud_api_key: Union[str, None],
     ibm_cloud_pak_for_data_entitlement_key: Union[str, None],
     ibm_github_api_key: Union[str, None],
@@ -0,0 +1,76 @@
+#  Copyright 2020 IBM Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from typing import Union
+
+import click
+
+import dg.config.cluster_credentials_manager
+import dg.lib.fyre.cluster
+import dg.lib.ibmcloud.cluster
+
+from dg.lib.cluster.multi_cluster_executor import CLUSTER_OPERATIONS, MultiClusterExecutor
+from dg.lib.error import DataGateCLIException
+from dg.utils.logging import loglevel_command
+
+CLUSTER_TYPES = {
+    "fyre": dg.lib.fyre.cluster.CLUSTER_TYPE,
+    "ibmcloud": dg.lib.ibmcloud.cluster.CLUSTER_TYPE,
+}
+
+
+@loglevel_command(name="exec", context_settings={"ignore_unknown_options": True})
+@click.option("--alias", help="Shell-style wildcard pattern matching aliases or server URLs (e.g., 'fyre-*')")
+@click.option("--type", "cluster_type", help="Cluster type", type=click.Choice(sorted(CLUSTER_TYPES.keys())))
+@click.option("--operation", help="Library operation", type=click.Choice(sorted(CLUSTER_OPERATIONS.keys())))
+@click.option("--max-parallelism", default=8, help="Maximum number of clusters processed at the same time")
+@click.option("--quiet", is_flag=True, help="Only print the result table")
+@click.argument("oc_args", nargs=-1, type=click.UNPROCESSED)
+@click.pass_context
+def exec_command(
+    ctx: click.Context,
+    alias: Union[str, None],
+    cluster_type: Union[str, None],
+    operation: Union[str, None],
+    max_parallelism: int,
+    quiet: bool,
+    oc_args: tuple[str, ...],
+):
+    """Execute an oc command or a library operation for several registered
+    OpenShift clusters
+
+    Example: dg cluster exec --alias 'fyre-*' -- get nodes
+    """
+
+    if (operation is None) == (len(oc_args) == 0):
+        raise click.UsageError("You must either set option '--operation' or pass oc arguments.", ctx)
+
+    clusters = dg.config.cluster_credentials_manager.cluster_credentials_manager.get_clusters(
+        alias, CLUSTER_TYPES[cluster_type] if cluster_type is not None else None
+    )
+
+    if len(clusters) == 0:
+        raise DataGateCLIException("No registered cluster matches the given criteria")
+
+    multi_cluster_executor = MultiClusterExecutor(clusters, max_parallelism)
+    results = (
+        multi_cluster_executor.execute_operation(operation)
+        if operation is not None
+        else multi_cluster_executor.execute_oc_command(list(oc_args), print_output=not quiet)
+    )
+
+    click.echo(MultiClusterExecutor.get_results_as_str(results))
+
+    if any(result.return_code != 0 for result in results):
+        ctx.exit(1)
@@ -16,6 +16,7 @@ import dg.config.cluster_credentials_manager
 import dg.lib.click.utils
 import dg.lib.fyre.cluster.fyre_cluster_factory  # required to register FYREClusterFactory object
 import dg.lib.ibmcloud.cluster.ibmcloud_cluster_factory  # required to register IBMCloudClusterFactory object
+import dg.lib.openshift
 
 from dg.lib.error import DataGateCLIException
 from dg.utils.logging import loglevel_command
@@ -35,3 +36,5 @@ def login():
         raise DataGateCLIException("No current cluster selected")
 
     current_cluster.login()
+
+    dg.lib.openshift.log_kubeconfig_file_hint(current_cluster.get_server())
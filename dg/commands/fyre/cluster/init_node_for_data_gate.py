@@ -14,12 +14,14 @@
 
 import asyncio
 
+from typing import Union
+
 import click
 
 import dg.config
 import dg.config.cluster_credentials_manager
 import dg.lib.click.utils
-import dg.utils.ssh
+import dg.lib.fyre.openshift
 
 from dg.utils.logging import loglevel_command
 
@@ -30,50 +32,47 @@ from dg.utils.logging import loglevel_command
     )
 )
 @click.option("--infrastructure-node-hostname", required=True, help="Infrastructure node hostname")
-@click.option("--node", required=True, help="Worker node to be initialized")
+@click.option("--server", help="OpenShift API server URL (required for '--node-selector' and '--all-workers')")
+@click.option("--username", help="OpenShift username")
+@click.option("--password", help="OpenShift password")
+@click.option("--token", help="OpenShift OAuth access token")
+@click.option("--node", "nodes", help="Hostname of a worker node to be initialized (may be repeated)", multiple=True)
+@click.option("--node-selector", help="Label selector identifying worker nodes to be initialized")
+@click.option("--all-workers", is_flag=True, help="Initialize all worker nodes")
+@click.option(
+    "--max-parallelism",
+    default=dg.lib.fyre.openshift.DEFAULT_MAX_PARALLELISM,
+    help="Maximum number of worker nodes initialized at the same time",
+    show_default=True,
+)
+@click.pass_context
 def init_node_for_data_gate(
+    ctx: click.Context,
     infrastructure_node_hostname: str,
-    node: str,
+    server: Union[str, None],
+    username: Union[str, None],
+    password: Union[str, None],
+    token: Union[str, None],
+    nodes: tuple[str, ...],
+    node_selector: Union[str, None],
+    all_workers: bool,
+    max_parallelism: int,
 ):
-    """Initialize a worker node before creating a Data Gate instance"""
-
-    asyncio.get_event_loop().run_until_complete(_init_node_for_data_gate(infrastructure_node_hostname, node))
-
+    """Initialize worker nodes before creating a Data Gate instance"""
 
-async def _compile_selinux_policy_module(remoteClient: dg.utils.ssh.RemoteClient, node: str):
-    await remoteClient.execute("ssh core@{} sudo checkmodule -m --mls --output db2u-nfs.mod db2u-nfs.te".format(node))
-
-
-async def _copy_type_enforcement_file_to_infrastructure_node(
-    remoteClient: dg.utils.ssh.RemoteClient,
-):
-    await remoteClient.upload(
-        dg.config.data_gate_configuration_manager.get_deps_directory_path() / "db2u-nfs" / "db2u-nfs.te"
+    node_selector = dg.lib.click.utils.get_node_selector(ctx, nodes, node_selector, all_workers)
+    oc_login_command_for_remote_host = (
+        dg.lib.click.utils.get_oc_login_command_for_remote_host(ctx, locals().copy())
+        if node_selector is not None
+        else None
     )
 
-
-async def _copy_type_enforcement_file_to_worker_node(remoteClient: dg.utils.ssh.RemoteClient, node: str):
-    await remoteClient.execute("scp db2u-nfs.te core@{}:".format(node))
-
-
-async def _create_selinux_policy_module_package(remoteClient: dg.utils.ssh.RemoteClient, node: str):
-    await remoteClient.execute(
-        "ssh core@{} sudo semodule_package --module db2u-nfs.mod --outfile db2u-nfs.pp".format(node)
+    asyncio.get_event_loop().run_until_complete(
+        dg.lib.fyre.openshift.init_node_for_data_gate_from_remote_host(
+            infrastructure_node_hostname,
+            list(nodes),
+            oc_login_command_for_remote_host,
+            node_selector,
+            max_parallelism,
+        )
     )
-
-
-async def _init_node_for_data_gate(
-    infrastructure_node_hostname: str,
-    node: str,
-):
-    async with dg.utils.ssh.RemoteClient(infrastructure_node_hostname) as remoteClient:
-        await remoteClient.connect()
-        await _copy_type_enforcement_file_to_infrastructure_node(remoteClient)
-        await _copy_type_enforcement_file_to_worker_node(remoteClient, node)
-        await _compile_selinux_policy_module(remoteClient, node)
-        await _create_selinux_policy_module_package(remoteClient, node)
-        await _install_selinux_policy_module_package(remoteClient, node)
-
-
-async def _install_selinux_policy_module_package(remoteClient: dg.utils.ssh.RemoteClient, node: str):
-    await remoteClient.execute("ssh core@{} sudo semodule --install db2u-nfs.pp".format(node))
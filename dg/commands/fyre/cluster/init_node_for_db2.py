@@ -36,7 +36,9 @@ from dg.utils.logging import loglevel_command
 @click.option("--username", help="OpenShift username")
 @click.option("--password", help="OpenShift password")
 @click.option("--token", help="OpenShift OAuth access token")
-@click.option("--node", required=True, help="Hostname of the worker node to be initialized")
+@click.option("--node", "nodes", help="Hostname of a worker node to be initialized (may be repeated)", multiple=True)
+@click.option("--node-selector", help="Label selector identifying worker nodes to be initialized")
+@click.option("--all-workers", is_flag=True, help="Initialize all worker nodes")
 @click.option(
     "--db2-edition",
     required=True,
@@ -44,6 +46,12 @@ from dg.utils.logging import loglevel_command
     help="Db2 edition",
 )
 @click.option("--use-host-path-storage", is_flag=True, help="Use hostpath storage")
+@click.option(
+    "--max-parallelism",
+    default=dg.lib.fyre.openshift.DEFAULT_MAX_PARALLELISM,
+    help="Maximum number of worker nodes initialized at the same time",
+    show_default=True,
+)
 @click.pass_context
 def init_node_for_db2(
     ctx: click.Context,
@@ -52,24 +60,33 @@ def init_node_for_db2(
     username: Union[str, None],
     password: Union[str, None],
     token: Union[str, None],
-    node: str,
+    nodes: tuple[str, ...],
+    node_selector: Union[str, None],
+    all_workers: bool,
     db2_edition: str,
     use_host_path_storage: bool,
+    max_parallelism: int,
 ):
-    """Initialize a worker node before creating a Db2 instance"""
+    """Initialize worker nodes before creating a Db2 instance"""
+
+    node_selector = dg.lib.click.utils.get_node_selector(ctx, nodes, node_selector, all_workers)
 
     if dg.utils.network.is_hostname_localhost(infrastructure_node_hostname):
         dg.lib.click.utils.log_in_to_openshift_cluster(ctx, locals().copy())
-        dg.lib.fyre.openshift.init_node_for_db2(node, db2_edition, use_host_path_storage)
+        dg.lib.fyre.openshift.init_node_for_db2(
+            list(nodes), db2_edition, use_host_path_storage, node_selector, max_parallelism
+        )
     else:
         oc_login_command_for_remote_host = dg.lib.click.utils.get_oc_login_command_for_remote_host(ctx, locals().copy())
 
         asyncio.get_event_loop().run_until_complete(
             dg.lib.fyre.openshift.init_node_for_db2_from_remote_host(
                 infrastructure_node_hostname,
-                node,
+                list(nodes),
                 db2_edition,
                 use_host_path_storage,
                 oc_login_command_for_remote_host,
+                node_selector,
+                max_parallelism,
             )
         )
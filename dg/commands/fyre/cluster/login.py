@@ -18,6 +18,7 @@ import click
 
 import dg.config.cluster_credentials_manager
 import dg.lib.click.utils
+import dg.lib.openshift
 
 from dg.lib.fyre.cluster.fyre_cluster_factory import fyre_cluster_factory
 from dg.utils.logging import loglevel_command
@@ -42,3 +43,5 @@ def login(
 
     cluster = fyre_cluster_factory.create_cluster_using_cluster_name(cluster_name, locals().copy())
     cluster.login()
+
+    dg.lib.openshift.log_kubeconfig_file_hint(cluster.get_server())
@@ -15,13 +15,12 @@
 from typing import Final
 
 import click
-import requests
 
 from tabulate import tabulate
 
 import dg.config
 import dg.lib.click.utils
-import dg.utils.network
+import dg.utils.http
 
 from dg.lib.error import DataGateCLIException
 from dg.utils.logging import loglevel_command
@@ -41,12 +40,9 @@ IBM_FYRE_SHOW_OPENSHIFT_CLUSTERS_URL: Final[
 def ls(fyre_user_name: str, fyre_api_key: str):
     """List OpenShift clusters on FYRE"""
 
-    dg.utils.network.disable_insecure_request_warning()
-
-    response = requests.get(
+    response = dg.utils.http.get_http_session(verify=False).get(
         IBM_FYRE_SHOW_OPENSHIFT_CLUSTERS_URL,
         auth=(fyre_user_name, fyre_api_key),
-        verify=False,
     )
 
     if not response.ok:
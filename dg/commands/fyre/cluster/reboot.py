@@ -17,11 +17,10 @@ import json
 from typing import Final
 
 import click
-import requests
 
 import dg.config
 import dg.lib.click.utils
-import dg.utils.network
+import dg.utils.http
 
 from dg.lib.error import DataGateCLIException
 from dg.utils.logging import loglevel_command
@@ -46,13 +45,10 @@ def reboot(cluster_name: str, fyre_user_name: str, fyre_api_key: str):
 
     request_specification = {"cluster_name": cluster_name}
 
-    dg.utils.network.disable_insecure_request_warning()
-
-    response = requests.post(
+    response = dg.utils.http.get_http_session(verify=False).post(
         IBM_FYRE_REBOOT_CLUSTER_URL,
         auth=(fyre_user_name, fyre_api_key),
         data=json.dumps(request_specification),
-        verify=False,
     )
 
     if response.ok:
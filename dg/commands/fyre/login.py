@@ -15,10 +15,9 @@
 from typing import Final, Union
 
 import click
-import requests
 
 import dg.config
-import dg.utils.network
+import dg.utils.http
 
 from dg.lib.error import DataGateCLIException
 from dg.utils.logging import loglevel_command
@@ -37,12 +36,9 @@ def login(
 
     credentials_to_be_stored = locals().copy()
 
-    dg.utils.network.disable_insecure_request_warning()
-
-    response = requests.post(
+    response = dg.utils.http.get_http_session(verify=False).post(
         IBM_FYRE_SHOW_CLUSTERS_URL,
         auth=(fyre_user_name, fyre_api_key),
-        verify=False,
     )
 
     if not response.ok:
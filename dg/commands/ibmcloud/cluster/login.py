@@ -15,6 +15,7 @@
 import click
 
 import dg.lib.ibmcloud.status
+import dg.lib.openshift
 
 from dg.lib.error import DataGateCLIException
 from dg.lib.ibmcloud.cluster.ibmcloud_cluster_factory import (
@@ -33,6 +34,8 @@ def login(cluster_name: str):
     if cluster_status.is_ready():
         cluster = ibm_cloud_cluster_factory.create_cluster(cluster_status.get_server_url(), {})
         cluster.login()
+
+        dg.lib.openshift.log_kubeconfig_file_hint(cluster.get_server())
     else:
         raise DataGateCLIException(
             f"The cluster {cluster_name} is not ready yet, hence, it is not possible to log in to it."
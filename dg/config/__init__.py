@@ -58,6 +58,17 @@ class DataGateConfigurationManager:
 
         return self.get_dg_directory_path() / "bin"
 
+    def get_dg_cache_directory_path(self) -> pathlib.Path:
+        """Returns the path of the cache directory
+
+        Returns
+        -------
+        pathlib.Path
+            path of the cache directory
+        """
+
+        return self.get_dg_directory_path() / "cache"
+
     def get_dg_credentials_file_path(self) -> pathlib.Path:
         """Returns the path of the credentials file
 
@@ -69,6 +80,66 @@ class DataGateConfigurationManager:
 
         return self.get_dg_directory_path() / "credentials.json"
 
+    def get_dg_download_cache_directory_path(self) -> pathlib.Path:
+        """Returns the path of the download cache directory
+
+        Returns
+        -------
+        pathlib.Path
+            path of the download cache directory
+        """
+
+        return self.get_dg_cache_directory_path() / "downloads"
+
+    def get_dg_github_cache_directory_path(self) -> pathlib.Path:
+        """Returns the path of the directory containing cached GitHub API
+        responses
+
+        Returns
+        -------
+        pathlib.Path
+            path of the directory containing cached GitHub API responses
+        """
+
+        return self.get_dg_cache_directory_path() / "github"
+
+    def get_dg_kubeconfig_directory_path(self) -> pathlib.Path:
+        """Returns the path of the directory containing a dedicated kubeconfig
+        file for each OpenShift cluster
+
+        Returns
+        -------
+        pathlib.Path
+            path of the directory containing a dedicated kubeconfig file for each
+            OpenShift cluster
+        """
+
+        return self.get_dg_directory_path() / "kubeconfig"
+
+    def get_dg_runs_directory_path(self) -> pathlib.Path:
+        """Returns the path of the directory containing a log directory for
+        each run of a command executing commands on remote hosts
+
+        Returns
+        -------
+        pathlib.Path
+            path of the directory containing run directories
+        """
+
+        return self.get_dg_directory_path() / "runs"
+
+    def get_dg_ssh_agent_socket_path(self) -> pathlib.Path:
+        """Returns the path of the Unix domain socket the Data Gate SSH agent
+        listens on
+
+        Returns
+        -------
+        pathlib.Path
+            path of the Unix domain socket the Data Gate SSH agent listens on
+        """
+
+        return self.get_dg_directory_path() / "ssh-agent.sock"
+
     def get_home_directory_path(self) -> pathlib.Path:
         return pathlib.Path.home()
 
@@ -94,6 +165,39 @@ class DataGateConfigurationManager:
 
         return self.get_dg_bin_directory_path() / "oc"
 
+    def get_pinned_sha256(self, url: str) -> Union[str, None]:
+        """Returns the SHA-256 hash pinned in the settings file for the file
+        downloaded from the given URL
+
+        Hashes are pinned as follows:
+
+        {
+            "sha256": {
+                "https://example.com/archive.tar.gz": "[…]"
+            }
+        }
+
+        Parameters
+        ----------
+        url
+            URL of the downloaded file
+
+        Returns
+        -------
+        Union[str, None]
+            pinned SHA-256 hash or None if no hash was pinned for the given URL
+        """
+
+        result: Union[str, None] = None
+
+        if self.get_dg_settings_file_path().exists():
+            settings = json.loads(self.get_dg_settings_file_path().read_text())
+
+            if isinstance(settings.get("sha256"), dict) and (url in settings["sha256"]):
+                result = str(settings["sha256"][url])
+
+        return result
+
     def get_root_package_path(self) -> pathlib.Path:
         """Returns the path of the root package
 
@@ -218,6 +322,44 @@ class DataGateConfigurationManager:
 
         return not self.get_dg_bool_config_value("nuclear_commands", False)
 
+    def is_download_cache_enabled(self) -> bool:
+        """Returns whether downloaded files shall be cached
+
+        Returns
+        -------
+        bool
+            true, if downloaded files shall be cached
+        """
+
+        return self.get_dg_bool_config_value("download_cache", True)
+
+    def is_oc_proxy_enabled(self) -> bool:
+        """Returns whether Kubernetes API queries shall be sent through a
+        shared "oc proxy" process instead of executing oc for each query
+
+        Returns
+        -------
+        bool
+            true, if Kubernetes API queries shall be sent through a shared "oc
+            proxy" process
+        """
+
+        return self.get_dg_bool_config_value("oc_proxy", False)
+
+    def is_ssh_agent_enabled(self) -> bool:
+        """Returns whether SSH connections shall be established through the
+        persistent Data Gate SSH agent, which is shared by separate Data Gate
+        CLI processes
+
+        Returns
+        -------
+        bool
+            true, if SSH connections shall be established through the Data Gate
+            SSH agent
+        """
+
+        return self.get_dg_bool_config_value("ssh_agent", False)
+
     def get_dg_bool_config_value(self, key: str, default_value: bool) -> bool:
         """Gets the value for a given key from the settings file
 
@@ -13,24 +13,39 @@
 #  limitations under the License.
 
 import json
+import os
 import pathlib
+import tempfile
+import threading
 
-from typing import Union
+from typing import Any, Union
 
 from dg.config import data_gate_configuration_manager
 
-BinariesFileContents = dict[str, str]
+BinariesFileContents = dict[str, dict[str, str]]
 
 
 class BinariesManager:
-    """Manages downloaded binaries"""
+    """Manages downloaded binaries
+
+    The binaries file contains two sections: "versions" maps binary aliases
+    to the versions of the downloaded binaries, and "sha256" maps binary
+    aliases to the SHA-256 hashes of the downloaded files the binaries were
+    installed from.
+    """
 
     def __init__(self):
-        self._binaries_file_contents: Union[dict[str, str], None] = None
+        self._binaries_file_contents: Union[BinariesFileContents, None] = None
+
+        # serializes updates of binaries downloaded concurrently
+        self._lock = threading.RLock()
 
     def get_binaries_file_contents(self) -> Union[BinariesFileContents, None]:
         """Returns the contents of the binaries file
 
+        A binaries file only mapping binary aliases to versions (written by
+        previous versions of the Data Gate CLI) is migrated.
+
         Returns
         -------
         Union[BinariesFileContents, None]
@@ -42,7 +57,7 @@ class BinariesManager:
 
         if dg_binaries_file_path.exists():
             with open(dg_binaries_file_path) as binaries_file:
-                binaries_file_contents = json.load(binaries_file)
+                binaries_file_contents = self._migrate_binaries_file_contents(json.load(binaries_file))
 
         return binaries_file_contents
 
@@ -58,7 +73,7 @@ class BinariesManager:
         binaries_file_contents: Union[BinariesFileContents, None] = self.get_binaries_file_contents()
 
         if binaries_file_contents is None:
-            binaries_file_contents = {}
+            binaries_file_contents = {"sha256": {}, "versions": {}}
 
         return binaries_file_contents
 
@@ -73,43 +88,124 @@ class BinariesManager:
 
         return data_gate_configuration_manager.get_dg_directory_path() / "binaries.json"
 
+    def get_binary_sha256(self, binary_alias: str) -> Union[str, None]:
+        """Returns the SHA-256 hash of the downloaded file (e.g., an archive)
+        the given binary was installed from
+
+        The hash is computed when a binary is downloaded so that the
+        integrity of the download can be checked later without reading the
+        file again.
+
+        Parameters
+        ----------
+        binary_alias
+            alias of a binary
+
+        Returns
+        -------
+        Union[str, None]
+            SHA-256 hash or None if no hash was recorded
+        """
+
+        sha256_hashes = self._get_binaries_file_contents()["sha256"]
+
+        return sha256_hashes[binary_alias] if binary_alias in sha256_hashes else None
+
     def get_binary_version(self, binary_alias: str) -> Union[str, None]:
-        binaries = self._get_binary_versions()
+        binary_versions = self._get_binaries_file_contents()["versions"]
+
+        return binary_versions[binary_alias] if binary_alias in binary_versions else None
+
+    def set_binary_version(self, binary_alias: str, version: str, sha256: Union[str, None] = None):
+        """Stores the version of a downloaded binary and the SHA-256 hash of
+        the downloaded file
+
+        Parameters
+        ----------
+        binary_alias
+            alias of a binary
+        version
+            version of the binary
+        sha256
+            SHA-256 hash of the downloaded file (e.g., an archive) the binary
+            was installed from
+        """
 
-        return binaries[binary_alias] if binary_alias in binaries else None
+        with self._lock:
+            binaries_file_contents = self._get_binaries_file_contents()
+            binaries_file_contents["versions"][binary_alias] = version
 
-    def set_binary_version(self, binary_alias: str, version: str):
-        binary_versions = self._get_binary_versions()
+            if sha256 is not None:
+                binaries_file_contents["sha256"][binary_alias] = sha256
+            else:
+                # a hash recorded for a previous version must not be used
+                binaries_file_contents["sha256"].pop(binary_alias, None)
 
-        binary_versions[binary_alias] = version
-        self._save_binaries_file()
+            self._save_binaries_file()
 
-    def _get_binary_versions(self) -> dict[str, str]:
-        """Returns versions of downloaded binaries
+    def _get_binaries_file_contents(self) -> BinariesFileContents:
+        """Returns versions of downloaded binaries and SHA-256 hashes of the
+        downloaded files
 
         Returns
         -------
-        dict[str, str]
-            versions of downloaded binaries
+        BinariesFileContents
+            versions of downloaded binaries and SHA-256 hashes of the
+            downloaded files
+        """
+
+        with self._lock:
+            if self._binaries_file_contents is None:
+                self._binaries_file_contents = self.get_binaries_file_contents_with_default()
+
+            return self._binaries_file_contents
+
+    def _migrate_binaries_file_contents(self, binaries_file_contents: dict[str, Any]) -> BinariesFileContents:
+        """Migrates the contents of a binaries file only mapping binary
+        aliases to versions
+
+        Parameters
+        ----------
+        binaries_file_contents
+            contents of a binaries file
+
+        Returns
+        -------
+        BinariesFileContents
+            migrated contents of the binaries file
         """
 
-        if self._binaries_file_contents is None:
-            self._binaries_file_contents = self.get_binaries_file_contents_with_default()
+        if isinstance(binaries_file_contents.get("versions"), dict):
+            return {
+                "sha256": binaries_file_contents.get("sha256", {}),
+                "versions": binaries_file_contents["versions"],
+            }
+
+        sha256_hashes = binaries_file_contents.pop("sha256", {})
 
-        return self._binaries_file_contents
+        return {
+            "sha256": sha256_hashes if isinstance(sha256_hashes, dict) else {},
+            "versions": binaries_file_contents,
+        }
 
     def _save_binaries_file(self):
         """Stores versions of downloaded binaries in a configuration file"""
 
         data_gate_configuration_manager.get_dg_directory_path().mkdir(exist_ok=True)
 
-        with open(self.get_dg_binaries_file_path(), "w") as binaries_file:
+        # replace the binaries file atomically so that it is never read while
+        # it is partially written
+        with tempfile.NamedTemporaryFile(
+            "w", delete=False, dir=data_gate_configuration_manager.get_dg_directory_path()
+        ) as binaries_file:
             json.dump(
-                self._get_binary_versions(),
+                self._get_binaries_file_contents(),
                 binaries_file,
                 indent="\t",
                 sort_keys=True,
             )
 
+        os.replace(binaries_file.name, self.get_dg_binaries_file_path())
+
 
 binaries_manager = BinariesManager()
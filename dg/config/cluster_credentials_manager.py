@@ -12,6 +12,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import fnmatch
 import json
 import pathlib
 
@@ -118,6 +119,45 @@ class ClusterCredentialsManager:
 
         return cluster
 
+    def get_clusters(
+        self, alias_pattern: Union[str, None] = None, cluster_type: Union[str, None] = None
+    ) -> list[AbstractCluster]:
+        """Returns metadata of registered OpenShift clusters matching the
+        given criteria
+
+        Parameters
+        ----------
+        alias_pattern
+            shell-style wildcard pattern (e.g., "fyre-*") the alias or server URL
+            of a cluster must match (all clusters match if None)
+        cluster_type
+            type of clusters to be returned (clusters of all types are returned
+            if None)
+
+        Returns
+        -------
+        list[AbstractCluster]
+            metadata of registered OpenShift clusters matching the given criteria
+        """
+
+        clusters: list[AbstractCluster] = []
+
+        for server, cluster_data in self._get_clusters().items():
+            alias = cluster_data["alias"] if "alias" in cluster_data else ""
+
+            if (alias_pattern is not None) and not (
+                fnmatch.fnmatchcase(alias, alias_pattern) or fnmatch.fnmatchcase(server, alias_pattern)
+            ):
+                continue
+
+            if (cluster_type is not None) and (cluster_data["type"] != cluster_type):
+                continue
+
+            cluster_factory = dg.lib.cluster.cluster_factories[cluster_data["type"]]
+            clusters.append(cluster_factory.create_cluster(server, cluster_data))
+
+        return clusters
+
     def get_clusters_as_str(self) -> str:
         """Returns metadata of registered OpenShift clusters as a
         pretty-printed string
@@ -18,7 +18,9 @@ import click
 import pkg_resources
 
 import dg.commands
+import dg.config
 import dg.utils.debugger
+import dg.utils.download_cache
 import dg.utils.logging
 
 from dg.lib.click.lazy_loading_multi_command import (
@@ -46,6 +48,19 @@ if dg.utils.debugger.is_debugpy_running() and (len(sys.argv) == 2):
 @click.option("--version", is_flag=True, help="Show the version number of the Data Gate CLI")
 @click.pass_context
 def cli(ctx: click.Context, version: bool):
+    if dg.config.data_gate_configuration_manager.is_download_cache_enabled():
+        dg.utils.download_cache.set_download_cache(
+            dg.utils.download_cache.DownloadCache(
+                dg.config.data_gate_configuration_manager.get_dg_download_cache_directory_path()
+            )
+        )
+
+    if dg.config.data_gate_configuration_manager.is_ssh_agent_enabled():
+        # asyncssh is only imported if required as importing it is slow
+        from dg.utils.ssh import ssh_connection_pool
+
+        ssh_connection_pool.use_ssh_agent(dg.config.data_gate_configuration_manager.get_dg_ssh_agent_socket_path())
+
     if ctx.invoked_subcommand is None:
         if version:
             click.echo("Data Gate CLI " + pkg_resources.require("dg")[0].version)
@@ -0,0 +1,293 @@
+#  Copyright 2020 IBM Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import datetime
+import hashlib
+import io
+import json
+import logging
+import os
+import pathlib
+import tarfile
+import tempfile
+
+from typing import Any, Final, Union
+
+import dg.config
+import dg.utils.operating_system
+
+from dg.config.binaries_manager import binaries_manager
+from dg.lib.cloud_pak_for_data.cpd_manager import AbstractCloudPakForDataManager
+from dg.lib.download_manager.download_manager import DownloadManager
+from dg.lib.error import DataGateCLIException
+
+logger = logging.getLogger(__name__)
+
+BUNDLE_FORMAT_VERSION: Final[int] = 1
+BUNDLE_MANIFEST_FILE_NAME: Final[str] = "manifest.json"
+
+BundleManifest = dict[str, Any]
+
+
+def create_bundle(
+    bundle_path: pathlib.Path,
+    download_manager: DownloadManager,
+    cloud_pak_for_data_managers: list[AbstractCloudPakForDataManager],
+) -> BundleManifest:
+    """Creates a bundle of all dependencies for offline installation
+
+    Dependencies are downloaded if required. Afterwards, the files installed
+    by all download manager plug-ins, the IBM Cloud Pak for Data installers
+    managed by the given IBM Cloud Pak for Data managers, and the YAML files
+    of the deps directory are stored in a tar.gz archive. The first member of
+    the archive is a manifest containing the versions of all dependencies and
+    the SHA-256 hashes of all files, which are verified when the bundle is
+    installed (see install_bundle()).
+
+    Parameters
+    ----------
+    bundle_path
+        path of the bundle to be created
+    download_manager
+        download manager whose plug-ins determine the dependencies to be
+        bundled
+    cloud_pak_for_data_managers
+        IBM Cloud Pak for Data managers whose installers shall be bundled
+
+    Returns
+    -------
+    BundleManifest
+        manifest of the created bundle
+    """
+
+    download_manager.download_dependencies_if_required()
+
+    for cloud_pak_for_data_manager in cloud_pak_for_data_managers:
+        cloud_pak_for_data_manager.download_cpd_installer()
+
+    home_directory_path = dg.config.data_gate_configuration_manager.get_home_directory_path()
+    binaries: dict[str, list[pathlib.Path]] = {
+        plugin.get_binary_alias(): plugin.get_binary_file_paths() for plugin in download_manager.get_plugins()
+    }
+
+    for cloud_pak_for_data_manager in cloud_pak_for_data_managers:
+        cpd_installer_directory_path = cloud_pak_for_data_manager.get_cloud_pak_for_data_installer_path().parent
+
+        # the workspace contains files downloaded by the installer
+        binaries[cpd_installer_directory_path.name] = sorted(
+            path
+            for path in cpd_installer_directory_path.rglob("*")
+            if path.is_file() and ("cpd-cli-workspace" not in path.relative_to(cpd_installer_directory_path).parts)
+        )
+
+    manifest: BundleManifest = {
+        "binaries": {},
+        "created_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "deps": {},
+        "files": {},
+        "format_version": BUNDLE_FORMAT_VERSION,
+        "operating_system": dg.utils.operating_system.get_operating_system().name,
+    }
+
+    for binary_alias, paths in binaries.items():
+        version = binaries_manager.get_binary_version(binary_alias)
+
+        if version is None:
+            raise DataGateCLIException(f"Version of {binary_alias} is unknown")
+
+        for path in paths:
+            if not path.is_file():
+                raise DataGateCLIException(f"File of {binary_alias} does not exist: {path}")
+
+            manifest["files"][path.relative_to(home_directory_path).as_posix()] = {
+                "mode": path.stat().st_mode & 0o777,
+                "sha256": _get_sha256(path),
+                "size": path.stat().st_size,
+            }
+
+        manifest["binaries"][binary_alias] = {
+            "files": [path.relative_to(home_directory_path).as_posix() for path in paths],
+            "sha256": binaries_manager.get_binary_sha256(binary_alias),
+            "version": version,
+        }
+
+    deps_file_paths = sorted(dg.config.data_gate_configuration_manager.get_deps_directory_path().glob("*.yaml"))
+
+    for path in deps_file_paths:
+        manifest["deps"][path.name] = _get_sha256(path)
+
+    bundle_path.parent.mkdir(exist_ok=True, parents=True)
+
+    # write the bundle to a temporary file first so that a partially written
+    # bundle is never installed
+    with tempfile.NamedTemporaryFile(delete=False, dir=bundle_path.parent, prefix=".") as temporary_file:
+        with tarfile.open(fileobj=temporary_file, mode="w:gz") as tar_file:
+            manifest_contents = json.dumps(manifest, indent="\t", sort_keys=True).encode()
+            manifest_tar_info = tarfile.TarInfo(BUNDLE_MANIFEST_FILE_NAME)
+            manifest_tar_info.size = len(manifest_contents)
+
+            tar_file.addfile(manifest_tar_info, io.BytesIO(manifest_contents))
+
+            for relative_path in manifest["files"].keys():
+                tar_file.add(home_directory_path / relative_path, arcname=f"home/{relative_path}", recursive=False)
+
+            for path in deps_file_paths:
+                tar_file.add(path, arcname=f"deps/{path.name}", recursive=False)
+
+    os.replace(temporary_file.name, bundle_path)
+
+    return manifest
+
+
+def install_bundle(bundle_path: pathlib.Path) -> BundleManifest:
+    """Installs the dependencies contained in a bundle created by
+    create_bundle() without network access
+
+    The bundle is read sequentially. Each file is written to a temporary
+    file, verified against the SHA-256 hash stored in the manifest, and moved
+    to its final location. Afterwards, the versions of the installed
+    dependencies are stored in ~/.dg/binaries.json.
+
+    Parameters
+    ----------
+    bundle_path
+        path of the bundle to be installed
+
+    Returns
+    -------
+    BundleManifest
+        manifest of the installed bundle
+    """
+
+    home_directory_path = dg.config.data_gate_configuration_manager.get_home_directory_path()
+    manifest: Union[BundleManifest, None] = None
+    installed_files: set[str] = set()
+
+    with tarfile.open(bundle_path, mode="r|gz") as tar_file:
+        for member in tar_file:
+            if manifest is None:
+                manifest = _read_manifest(tar_file, member)
+
+                continue
+
+            if not member.isfile():
+                raise DataGateCLIException(f"Unexpected member of bundle: {member.name}")
+
+            if member.name.startswith("deps/") and (member.name.removeprefix("deps/") in manifest["deps"]):
+                file_name = member.name.removeprefix("deps/")
+
+                _check_deps_file(file_name, manifest["deps"][file_name])
+            elif member.name.startswith("home/") and (member.name.removeprefix("home/") in manifest["files"]):
+                relative_path = member.name.removeprefix("home/")
+
+                if pathlib.PurePosixPath(relative_path).is_absolute() or (
+                    ".." in pathlib.PurePosixPath(relative_path).parts
+                ):
+                    raise DataGateCLIException(f"Unexpected member of bundle: {member.name}")
+
+                _install_file(tar_file, member, home_directory_path / relative_path, manifest["files"][relative_path])
+
+                installed_files.add(relative_path)
+            else:
+                raise DataGateCLIException(f"Unexpected member of bundle: {member.name}")
+
+    if manifest is None:
+        raise DataGateCLIException(f"Bundle is empty: {bundle_path}")
+
+    missing_files = set(manifest["files"].keys()) - installed_files
+
+    if len(missing_files) != 0:
+        raise DataGateCLIException(f"Bundle is incomplete (missing files: {', '.join(sorted(missing_files))})")
+
+    for binary_alias, binary in manifest["binaries"].items():
+        binaries_manager.set_binary_version(binary_alias, binary["version"], binary["sha256"])
+
+    return manifest
+
+
+def _check_deps_file(file_name: str, sha256: str):
+    deps_file_path = dg.config.data_gate_configuration_manager.get_deps_directory_path() / file_name
+
+    if (not deps_file_path.exists()) or (_get_sha256(deps_file_path) != sha256):
+        logger.warning(
+            f"{file_name} of the bundle differs from {deps_file_path} (the bundle was created by a different version "
+            f"of the Data Gate CLI)"
+        )
+
+
+def _get_sha256(path: pathlib.Path) -> str:
+    sha256 = hashlib.sha256()
+
+    with open(path, "rb") as file:
+        while len(chunk := file.read(1048576)) != 0:  # 1 MiB
+            sha256.update(chunk)
+
+    return sha256.hexdigest()
+
+
+def _install_file(tar_file: tarfile.TarFile, member: tarfile.TarInfo, path: pathlib.Path, file: dict[str, Any]):
+    extracted_file = tar_file.extractfile(member)
+
+    if extracted_file is None:
+        raise DataGateCLIException(f"Unexpected member of bundle: {member.name}")
+
+    path.parent.mkdir(exist_ok=True, parents=True)
+    sha256 = hashlib.sha256()
+
+    # write the file to a temporary file first so that an existing binary is
+    # only replaced by a verified file
+    with tempfile.NamedTemporaryFile(delete=False, dir=path.parent, prefix=".") as temporary_file:
+        try:
+            while len(chunk := extracted_file.read(1048576)) != 0:  # 1 MiB
+                sha256.update(chunk)
+                temporary_file.write(chunk)
+        except BaseException:
+            os.remove(temporary_file.name)
+
+            raise
+
+    if sha256.hexdigest() != file["sha256"]:
+        os.remove(temporary_file.name)
+
+        raise DataGateCLIException(
+            f"SHA-256 hash of {member.name} does not match the manifest of the bundle (expected: {file['sha256']}, "
+            f"actual: {sha256.hexdigest()})"
+        )
+
+    os.chmod(temporary_file.name, file["mode"])
+    os.replace(temporary_file.name, path)
+
+    logger.debug(f"Installed {path}")
+
+
+def _read_manifest(tar_file: tarfile.TarFile, member: tarfile.TarInfo) -> BundleManifest:
+    extracted_file = tar_file.extractfile(member) if member.name == BUNDLE_MANIFEST_FILE_NAME else None
+
+    if extracted_file is None:
+        raise DataGateCLIException(f"First member of bundle is not {BUNDLE_MANIFEST_FILE_NAME}")
+
+    manifest: BundleManifest = json.load(extracted_file)
+
+    if manifest.get("format_version") != BUNDLE_FORMAT_VERSION:
+        raise DataGateCLIException(f"Unsupported bundle format version: {manifest.get('format_version')}")
+
+    operating_system = dg.utils.operating_system.get_operating_system().name
+
+    if manifest.get("operating_system") != operating_system:
+        raise DataGateCLIException(
+            f"Bundle was created for a different operating system ({manifest.get('operating_system')}) than the "
+            f"current one ({operating_system})"
+        )
+
+    return manifest
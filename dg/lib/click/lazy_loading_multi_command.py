@@ -102,7 +102,9 @@ def create_click_multi_command_class(package: ModuleType) -> type[click.Command]
                 attribute = getattr(module, attributeName)
 
                 if isinstance(attribute, click.Command):
-                    command_name = attributeName.replace("_", "-")
+                    # use the name passed to the decorator (e.g., to avoid
+                    # shadowing a built-in function)
+                    command_name = attribute.name if attribute.name is not None else attributeName.replace("_", "-")
 
                     commands[command_name] = attribute
 
@@ -15,7 +15,7 @@
 import json
 import pathlib
 
-from typing import Any
+from typing import Any, Union
 
 import click
 
@@ -86,6 +86,42 @@ def create_default_map_from_json_file(path: pathlib.Path):
     return default_map_dict
 
 
+def get_node_selector(
+    ctx: click.Context, nodes: tuple[str, ...], node_selector: Union[str, None], all_workers: bool
+) -> Union[str, None]:
+    """Returns the label selector identifying worker nodes to be initialized
+    based on the options passed to a node initialization command
+
+    Parameters
+    ----------
+    ctx
+        Click context
+    nodes
+        value of option '--node'
+    node_selector
+        value of option '--node-selector'
+    all_workers
+        value of option '--all-workers'
+
+    Returns
+    -------
+    Union[str, None]
+        label selector or None if only nodes passed with option '--node' shall
+        be initialized
+    """
+
+    if all_workers:
+        if node_selector is not None:
+            raise click.UsageError("Options '--node-selector' and '--all-workers' are mutually exclusive.", ctx)
+
+        node_selector = dg.lib.openshift.ALL_WORKERS_NODE_SELECTOR
+
+    if (len(nodes) == 0) and (node_selector is None):
+        raise click.UsageError("You must set option '--node', '--node-selector', or '--all-workers'.", ctx)
+
+    return node_selector
+
+
 def get_oc_login_command_for_remote_host(ctx: click.Context, options: dict[str, Any]) -> str:
     result: str
 
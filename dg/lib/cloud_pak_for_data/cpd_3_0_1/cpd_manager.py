@@ -13,7 +13,6 @@
 #  limitations under the License.
 
 import io
-import json
 import os
 import pathlib
 import re as regex
@@ -22,11 +21,11 @@ import urllib.parse
 
 from typing import Any, Union
 
-import requests
 import semver
 
 import dg.config
 import dg.lib.cloud_pak_for_data.cpd_manager
+import dg.lib.github
 import dg.lib.openshift
 import dg.utils.compression
 import dg.utils.download
@@ -196,24 +195,23 @@ class CloudPakForDataManager(AbstractCloudPakForDataManager):
             URL of the IBM Cloud Pak for Data 3.0.1 release build to be downloaded
         """
 
-        archive_path = dg.utils.download.download_file(urllib.parse.urlsplit(download_url))
+        self._download_and_extract_cpd_installer(cloud_pak_for_data_version, urllib.parse.urlsplit(download_url))
 
-        self._extract_cpd_installer(cloud_pak_for_data_version, archive_path)
-
-    def _extract_cpd_installer(
+    def _download_and_extract_cpd_installer(
         self,
         cloud_pak_for_data_version: CloudPakForDataVersion,
-        archive_path: pathlib.Path,
+        url: urllib.parse.SplitResult,
     ):
-        """Extracts the IBM Cloud Pak for Data 3.0.1 release build installer
-        archive
+        """Downloads and extracts the IBM Cloud Pak for Data 3.0.1 release
+        build installer archive (tar.gz archives are extracted while they are
+        downloaded)
 
         Parameters
         ----------
         cloud_pak_for_data_version
             IBM Cloud Pak for Data version information
-        archive_path
-            path of the IBM Cloud Pak for Data 3.0.1 release build installer archive
+        url
+            URL of the IBM Cloud Pak for Data 3.0.1 release build installer archive
         """
 
         cpd_installer_file_name_dict = cloud_pak_for_data_version["cpd_installer_file_name_dict"]
@@ -228,8 +226,8 @@ class CloudPakForDataManager(AbstractCloudPakForDataManager):
             / cloud_pak_for_data_version["release"]["directory_alias"]
         )
 
-        dg.utils.compression.extract_archive(
-            archive_path,
+        dg.utils.download.download_and_extract_archive(
+            url,
             target_directory_path,
             ignoreDirectoryStructure=True,
             memberIdentificationFunc=member_identification_func,
@@ -311,13 +309,12 @@ class CloudPakForDataManager(AbstractCloudPakForDataManager):
             installer and the corresponding URL
         """
 
-        response = requests.get(cloud_pak_for_data_version["release"]["download_url"])
-        response.raise_for_status()
-
-        response_json = json.loads(response.content)
+        releases = dg.lib.github.get_github_api_client().get_pages(
+            cloud_pak_for_data_version["release"]["download_url"]
+        )
         result: Union[tuple[semver.VersionInfo, str], None] = None
 
-        for release in response_json:
+        for release in releases:
             search_result = regex.search(
                 f".*({str(self._cloud_pak_for_data_version)}(-\\d+)*).*",
                 release["name"],
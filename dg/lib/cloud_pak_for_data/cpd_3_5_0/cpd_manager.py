@@ -13,18 +13,17 @@
 #  limitations under the License.
 
 import io
-import json
 import pathlib
 import re as regex
 import urllib.parse
 
 from typing import Any, Union
 
-import requests
 import semver
 
 import dg.config
 import dg.lib.cloud_pak_for_data.cpd_manager
+import dg.lib.github
 import dg.lib.openshift
 import dg.utils.compression
 import dg.utils.download
@@ -191,13 +190,9 @@ class CloudPakForDataManager(AbstractCloudPakForDataManager):
             name of the file to be downloaded
         """
 
-        archive_path = dg.utils.download.download_file(
-            urllib.parse.urlsplit(cloud_pak_for_data_version["development"]["download_url"] + file_name)
-        )
-
-        self._extract_cpd_installer(
+        self._download_and_extract_cpd_installer(
             cloud_pak_for_data_version,
-            archive_path,
+            urllib.parse.urlsplit(cloud_pak_for_data_version["development"]["download_url"] + file_name),
         )
 
     def _download_cpd_installer_release(self, cloud_pak_for_data_version: CloudPakForDataVersion, download_url: str):
@@ -211,24 +206,22 @@ class CloudPakForDataManager(AbstractCloudPakForDataManager):
             URL of the IBM Cloud Pak for Data 3.5.0 release build to be downloaded
         """
 
-        archive_path = dg.utils.download.download_file(urllib.parse.urlsplit(download_url))
-
-        self._extract_cpd_installer(cloud_pak_for_data_version, archive_path)
+        self._download_and_extract_cpd_installer(cloud_pak_for_data_version, urllib.parse.urlsplit(download_url))
 
-    def _extract_cpd_installer(
+    def _download_and_extract_cpd_installer(
         self,
         cloud_pak_for_data_version: CloudPakForDataVersion,
-        archive_path: pathlib.Path,
+        url: urllib.parse.SplitResult,
     ):
-        """Extracts the IBM Cloud Pak for Data 3.5.0 release build installer
-        archive
+        """Downloads and extracts the IBM Cloud Pak for Data 3.5.0 installer
+        archive (tar.gz archives are extracted while they are downloaded)
 
         Parameters
         ----------
         cloud_pak_for_data_version
             IBM Cloud Pak for Data version information
-        archive_path
-            path of the IBM Cloud Pak for Data 3.5.0 release build installer archive
+        url
+            URL of the IBM Cloud Pak for Data 3.5.0 installer archive
         """
 
         target_directory_path = (
@@ -243,14 +236,14 @@ class CloudPakForDataManager(AbstractCloudPakForDataManager):
             cloud_pak_for_data_configuration_data = cloud_pak_for_data_configuration_data_dict[operating_system]
             file_name_infix = cloud_pak_for_data_configuration_data["file_name_infix"]
 
-            dg.utils.compression.extract_archive(
-                archive_path,
+            dg.utils.download.download_and_extract_archive(
+                url,
                 target_directory_path,
                 directoryPathToStartExtraction=f"cpd-cli-{file_name_infix}-EE-\\d+.\\d+.\\d+-\\d+",
             )
         else:
-            dg.utils.compression.extract_archive(
-                archive_path,
+            dg.utils.download.download_and_extract_archive(
+                url,
                 target_directory_path,
             )
 
@@ -332,13 +325,12 @@ class CloudPakForDataManager(AbstractCloudPakForDataManager):
             installer and the corresponding URL
         """
 
-        response = requests.get(cloud_pak_for_data_version["release"]["download_url"])
-        response.raise_for_status()
-
-        response_json = json.loads(response.content)
+        releases = dg.lib.github.get_github_api_client().get_pages(
+            cloud_pak_for_data_version["release"]["download_url"]
+        )
         result: Union[tuple[semver.VersionInfo, str], None] = None
 
-        for release in response_json:
+        for release in releases:
             search_result = regex.search(
                 f".*({self._cloud_pak_for_data_version.major}\\.{self._cloud_pak_for_data_version.minor}"
                 f"\\.\\d+(-\\d+)*).*",
@@ -15,6 +15,8 @@
 from abc import ABC, abstractmethod
 from typing import Any, Dict
 
+from dg.lib.error import DataGateCLIException
+
 ClusterData = Dict[str, Any]
 
 
@@ -30,6 +32,21 @@ class AbstractCluster(ABC):
     def get_cluster_data(self) -> ClusterData:
         return self.cluster_data
 
+    def get_oc_login_args(self) -> list[str]:
+        """Returns the arguments to be passed to oc for logging in to the
+        cluster
+
+        In contrast to login(), the caller decides which kubeconfig file oc
+        uses (e.g., when logging in to several clusters concurrently).
+
+        Returns
+        -------
+        list[str]
+            arguments to be passed to oc
+        """
+
+        raise DataGateCLIException(f"Logging in to clusters of type {type(self).__name__} is not supported")
+
     def get_server(self) -> str:
         return self.server
 
@@ -0,0 +1,336 @@
+#  Copyright 2020 IBM Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import asyncio
+import json
+import os
+import time
+
+from typing import Any, Callable, Final, Union
+
+import click
+
+from tabulate import tabulate
+
+import dg.config
+import dg.lib.openshift
+import dg.utils.process
+
+from dg.lib.cluster.cluster import AbstractCluster
+from dg.lib.error import DataGateCLIException
+
+
+class ClusterOperation:
+    """Library operation executed for a cluster by querying a Kubernetes API
+    resource"""
+
+    def __init__(
+        self,
+        path: str,
+        get_result: Callable[[Any], str],
+        fallback_args: Union[list[str], None] = None,
+        get_fallback_result: Union[Callable[[str], str], None] = None,
+    ):
+        """Constructor
+
+        Parameters
+        ----------
+        path
+            Kubernetes API path of the resource to be queried
+        get_result
+            callable returning the result of the operation given the queried
+            resource
+        fallback_args
+            arguments passed to oc if the resource cannot be queried (e.g.,
+            because it does not exist on older clusters)
+        get_fallback_result
+            callable returning the result of the operation given the output
+            of oc executed with fallback_args
+        """
+
+        self.fallback_args = fallback_args
+        self.get_fallback_result = get_fallback_result
+        self.get_result = get_result
+        self.path = path
+
+
+class ClusterExecutionResult:
+    """Result of executing a command or operation for a cluster"""
+
+    def __init__(self, cluster: AbstractCluster, return_code: int, output: str, duration: float):
+        self.cluster = cluster
+        self.duration = duration
+        self.output = output
+        self.return_code = return_code
+
+    def get_name(self) -> str:
+        return get_cluster_name(self.cluster)
+
+
+def get_cluster_name(cluster: AbstractCluster) -> str:
+    """Returns the alias of the given cluster or its server URL if no alias
+    is set
+
+    Parameters
+    ----------
+    cluster
+        registered OpenShift cluster
+
+    Returns
+    -------
+    str
+        alias or server URL of the cluster
+    """
+
+    cluster_data = cluster.get_cluster_data()
+
+    return cluster_data["alias"] if cluster_data.get("alias", "") != "" else cluster.get_server()
+
+
+def _get_node_readiness(nodes: Any) -> str:
+    ready_node_count = 0
+
+    for node in nodes["items"]:
+        for condition in node.get("status", {}).get("conditions", []):
+            if (condition["type"] == "Ready") and (condition["status"] == "True"):
+                ready_node_count += 1
+
+    return f"{ready_node_count}/{len(nodes['items'])} nodes ready"
+
+
+def _get_storage_classes(storage_classes: Any) -> str:
+    storage_class_names: list[str] = []
+
+    for storage_class in storage_classes["items"]:
+        annotations = storage_class["metadata"].get("annotations", {})
+        storage_class_name = storage_class["metadata"]["name"]
+
+        if annotations.get("storageclass.kubernetes.io/is-default-class") == "true":
+            storage_class_name += " (default)"
+
+        storage_class_names.append(storage_class_name)
+
+    return ", ".join(storage_class_names)
+
+
+CLUSTER_OPERATIONS: Final[dict[str, ClusterOperation]] = {
+    "node-readiness": ClusterOperation("/api/v1/nodes", _get_node_readiness),
+    "storage-classes": ClusterOperation("/apis/storage.k8s.io/v1/storageclasses", _get_storage_classes),
+    # same sources as dg.lib.openshift.get_openshift_version(), which cannot
+    # be called as it uses the kubeconfig file of the current cluster
+    "version": ClusterOperation(
+        dg.lib.openshift.CLUSTER_VERSION_PATH,
+        lambda cluster_version: str(dg.lib.openshift.get_openshift_version_from_cluster_version(cluster_version)),
+        dg.lib.openshift.OC_VERSION_ARGS,
+        lambda oc_version_output: str(dg.lib.openshift.get_openshift_version_from_oc_version_output(oc_version_output)),
+    ),
+}
+
+
+class MultiClusterExecutor:
+    """Executes oc commands or library operations for several registered
+    OpenShift clusters concurrently
+
+    Each cluster uses its dedicated kubeconfig file, which is passed to oc
+    using the KUBECONFIG environment variable of the child process. Thus,
+    neither the current cluster nor the environment of the Data Gate CLI
+    process is modified.
+    """
+
+    def __init__(self, clusters: list[AbstractCluster], max_parallelism: int = 8):
+        """Constructor
+
+        Parameters
+        ----------
+        clusters
+            registered OpenShift clusters
+        max_parallelism
+            maximum number of clusters for which commands are executed at the
+            same time
+        """
+
+        if max_parallelism < 1:
+            raise DataGateCLIException("Maximum parallelism must be greater than 0")
+
+        self._clusters = clusters
+        self._max_parallelism = max_parallelism
+
+    def execute_oc_command(self, args: list[str], print_output: bool = True) -> list[ClusterExecutionResult]:
+        """Executes oc for each cluster
+
+        Parameters
+        ----------
+        args
+            arguments to be passed to oc
+        print_output
+            flag indicating whether output shall be printed line by line,
+            prefixed with the alias of the cluster
+
+        Returns
+        -------
+        list[ClusterExecutionResult]
+            results in the order of the clusters passed to the constructor
+        """
+
+        return asyncio.run(
+            self._execute_for_clusters(lambda cluster, env: self._execute_oc(cluster, env, args, print_output))
+        )
+
+    def execute_operation(self, operation_name: str) -> list[ClusterExecutionResult]:
+        """Executes a library operation (see CLUSTER_OPERATIONS) for each
+        cluster
+
+        Parameters
+        ----------
+        operation_name
+            name of the operation
+
+        Returns
+        -------
+        list[ClusterExecutionResult]
+            results in the order of the clusters passed to the constructor
+        """
+
+        if operation_name not in CLUSTER_OPERATIONS:
+            raise DataGateCLIException(f"Unknown operation: {operation_name}")
+
+        operation = CLUSTER_OPERATIONS[operation_name]
+
+        return asyncio.run(
+            self._execute_for_clusters(lambda cluster, env: self._execute_operation(cluster, env, operation))
+        )
+
+    @staticmethod
+    def get_results_as_str(results: list[ClusterExecutionResult]) -> str:
+        """Returns the given results as a pretty-printed table
+
+        Parameters
+        ----------
+        results
+            results returned by execute_oc_command() or execute_operation()
+
+        Returns
+        -------
+        str
+            results as a pretty-printed table
+        """
+
+        result_list: list[list[str]] = []
+
+        for result in results:
+            output_lines = result.output.strip().splitlines()
+
+            result_list.append(
+                [
+                    result.get_name(),
+                    "OK" if result.return_code == 0 else f"failed ({result.return_code})",
+                    f"{result.duration:.1f}s",
+                    output_lines[-1] if len(output_lines) != 0 else "",
+                ]
+            )
+
+        return tabulate(result_list, headers=["cluster", "status", "duration", "result"])
+
+    async def _execute_for_clusters(
+        self, execute: Callable[[AbstractCluster, dict[str, str]], Any]
+    ) -> list[ClusterExecutionResult]:
+        semaphore = asyncio.Semaphore(self._max_parallelism)
+
+        async def execute_for_cluster(cluster: AbstractCluster) -> ClusterExecutionResult:
+            async with semaphore:
+                start_time = time.monotonic()
+
+                try:
+                    env = await self._log_in(cluster)
+                    return_code, output = await execute(cluster, env)
+                except Exception as exception:
+                    return_code, output = 1, str(exception)
+
+                return ClusterExecutionResult(cluster, return_code, output, time.monotonic() - start_time)
+
+        return list(await asyncio.gather(*[execute_for_cluster(cluster) for cluster in self._clusters]))
+
+    async def _execute_oc(
+        self, cluster: AbstractCluster, env: dict[str, str], args: list[str], print_output: bool
+    ) -> tuple[int, str]:
+        name = get_cluster_name(cluster)
+        process_result = await dg.utils.process.execute_command_async(
+            dg.config.data_gate_configuration_manager.get_oc_cli_path(),
+            args,
+            env=env,
+            stderr_callback=(lambda line: click.echo(f"[{name}] {line}", err=True, nl=False)) if print_output else None,
+            stdout_callback=(lambda line: click.echo(f"[{name}] {line}", nl=False)) if print_output else None,
+        )
+
+        return (
+            process_result.return_code,
+            process_result.stdout if process_result.return_code == 0 else process_result.stderr,
+        )
+
+    async def _execute_operation(
+        self, cluster: AbstractCluster, env: dict[str, str], operation: ClusterOperation
+    ) -> tuple[int, str]:
+        process_result = await dg.utils.process.execute_command_async(
+            dg.config.data_gate_configuration_manager.get_oc_cli_path(), ["get", "--raw", operation.path], env=env
+        )
+
+        if process_result.return_code != 0:
+            if (operation.fallback_args is None) or (operation.get_fallback_result is None):
+                return process_result.return_code, process_result.stderr
+
+            process_result = await dg.utils.process.execute_command_async(
+                dg.config.data_gate_configuration_manager.get_oc_cli_path(), operation.fallback_args, env=env
+            )
+
+            if process_result.return_code != 0:
+                return process_result.return_code, process_result.stderr
+
+            return 0, operation.get_fallback_result(process_result.stdout)
+
+        return 0, operation.get_result(json.loads(process_result.stdout))
+
+    async def _log_in(self, cluster: AbstractCluster) -> dict[str, str]:
+        """Logs in to the given cluster using its dedicated kubeconfig file
+        unless the stored OAuth access token is still valid
+
+        Parameters
+        ----------
+        cluster
+            registered OpenShift cluster
+
+        Returns
+        -------
+        dict[str, str]
+            environment variables to be passed to oc
+        """
+
+        kubeconfig_file_path = dg.lib.openshift.get_kubeconfig_file_path(cluster.get_server())
+        kubeconfig_file_path.parent.mkdir(mode=0o700, exist_ok=True, parents=True)
+
+        env = dict(os.environ, KUBECONFIG=str(kubeconfig_file_path))
+        stored_token: Union[str, None] = dg.lib.openshift.get_token_from_kubeconfig_file(kubeconfig_file_path)
+
+        if (stored_token is None) or not await asyncio.get_running_loop().run_in_executor(
+            None, dg.lib.openshift.is_token_valid, cluster.get_server(), stored_token
+        ):
+            process_result = await dg.utils.process.execute_command_async(
+                dg.config.data_gate_configuration_manager.get_oc_cli_path(), cluster.get_oc_login_args(), env=env
+            )
+
+            if process_result.return_code != 0:
+                raise DataGateCLIException(
+                    f"Login to {cluster.get_server()} failed: {process_result.stderr}", stderr=process_result.stderr
+                )
+
+        return env
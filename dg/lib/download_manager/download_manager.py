@@ -12,10 +12,22 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import concurrent.futures
+import logging
+
+from typing import Final, Union
+
+import semver
+
 from dg.config.binaries_manager import binaries_manager
 from dg.lib.download_manager.download_manager_plugin import (
     AbstractDownloadManagerPlugIn,
 )
+from dg.lib.error import DataGateCLIException
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_PARALLELISM: Final[int] = 4
 
 
 class DownloadManager:
@@ -24,6 +36,17 @@ class DownloadManager:
     def __init__(self):
         self._download_manager_plugins: list[AbstractDownloadManagerPlugIn] = []
 
+    def get_plugins(self) -> list[AbstractDownloadManagerPlugIn]:
+        """Returns the registered download manager plug-ins
+
+        Returns
+        -------
+        list[AbstractDownloadManagerPlugIn]
+            registered download manager plug-ins
+        """
+
+        return self._download_manager_plugins
+
     def register_plugin(self, cls: type[AbstractDownloadManagerPlugIn]):
         """Registers a download manager plug-in responsible for downloading a
         specific dependency
@@ -36,18 +59,78 @@ class DownloadManager:
 
         self._download_manager_plugins.append(cls())
 
-    def download_dependencies_if_required(self):
+    def download_dependencies_if_required(self, max_parallelism: int = DEFAULT_MAX_PARALLELISM):
         """Downloads dependencies if required
 
-        The versions of the downloaded dependencies are stored in
-        ~/.dg/binaries.json.
+        The latest versions of all dependencies are determined concurrently.
+        Afterwards, outdated dependencies are downloaded and extracted in
+        parallel. A failure of one plug-in does not abort the download of
+        other dependencies.
+
+        The versions of the downloaded dependencies and the SHA-256 hashes of
+        the downloaded files are stored in ~/.dg/binaries.json.
+
+        Parameters
+        ----------
+        max_parallelism
+            maximum number of dependencies downloaded at the same time
         """
 
-        for download_manager_plugin in self._download_manager_plugins:
+        if len(self._download_manager_plugins) == 0:
+            return
+
+        errors: dict[str, Exception] = {}
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(self._download_manager_plugins)) as executor:
+            latest_version_futures = {
+                download_manager_plugin: executor.submit(download_manager_plugin.get_latest_binary_version)
+                for download_manager_plugin in self._download_manager_plugins
+            }
+
+        outdated_download_manager_plugins: list[tuple[AbstractDownloadManagerPlugIn, semver.VersionInfo]] = []
+
+        for download_manager_plugin, future in latest_version_futures.items():
             binary_alias = download_manager_plugin.get_binary_alias()
+
+            if (exception := future.exception()) is not None:
+                errors[binary_alias] = exception
+
+                continue
+
             current_version = binaries_manager.get_binary_version(binary_alias)
-            latest_version = download_manager_plugin.get_latest_binary_version()
+            latest_version = future.result()
 
             if (current_version is None) or (latest_version.compare(current_version) == 1):
-                download_manager_plugin.download_binary_version(latest_version)
-                binaries_manager.set_binary_version(binary_alias, str(latest_version))
+                outdated_download_manager_plugins.append((download_manager_plugin, latest_version))
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(max_parallelism, 1)) as executor:
+            download_futures = {
+                download_manager_plugin.get_binary_alias(): executor.submit(
+                    self._download_binary_version, download_manager_plugin, latest_version
+                )
+                for download_manager_plugin, latest_version in outdated_download_manager_plugins
+            }
+
+        for binary_alias, future in download_futures.items():
+            if (exception := future.exception()) is not None:
+                errors[binary_alias] = exception
+
+        self._raise_if_download_failed(errors)
+
+    def _download_binary_version(
+        self, download_manager_plugin: AbstractDownloadManagerPlugIn, version: semver.VersionInfo
+    ):
+        binary_alias = download_manager_plugin.get_binary_alias()
+
+        logger.info(f"Downloading {binary_alias} {str(version)}")
+
+        sha256: Union[str, None] = download_manager_plugin.download_binary_version(version)
+
+        binaries_manager.set_binary_version(binary_alias, str(version), sha256)
+
+    def _raise_if_download_failed(self, errors: dict[str, Exception]):
+        for binary_alias, exception in errors.items():
+            logger.error(f"Downloading {binary_alias} failed: {exception}")
+
+        if len(errors) != 0:
+            raise DataGateCLIException(f"Downloading dependencies failed: {', '.join(errors.keys())}")
@@ -12,27 +12,40 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-import json
+import itertools
+import logging
+import pathlib
 import re as regex
+import urllib.parse
 
 from abc import ABC, abstractmethod
 from typing import Union
 
-import requests
 import semver
 
+import dg.config
+import dg.lib.github
+import dg.utils.download
+
+logger = logging.getLogger(__name__)
+
 
 class AbstractDownloadManagerPlugIn(ABC):
     """Base class of all download manager plug-in classes"""
 
     @abstractmethod
-    def download_binary_version(self, version: semver.VersionInfo):
+    def download_binary_version(self, version: semver.VersionInfo) -> Union[str, None]:
         """Downloads the given version of a dependency
 
         Parameters
         ----------
         version
             version of a dependency to be downloaded
+
+        Returns
+        -------
+        Union[str, None]
+            SHA-256 hash of the downloaded file or None if it is unknown
         """
 
         pass
@@ -60,6 +73,19 @@ class AbstractDownloadManagerPlugIn(ABC):
 
         pass
 
+    @abstractmethod
+    def get_binary_file_paths(self) -> list[pathlib.Path]:
+        """Returns the paths of the files installed when a dependency is
+        downloaded
+
+        Returns
+        -------
+        list[pathlib.Path]
+            paths of the installed files
+        """
+
+        pass
+
     @abstractmethod
     def get_latest_binary_version(self) -> semver.VersionInfo:
         """Returns the latest version of a dependency available at the official
@@ -74,9 +100,94 @@ class AbstractDownloadManagerPlugIn(ABC):
 
         pass
 
+    def _get_expected_sha256(self, url: str, checksum_file_url: Union[str, None] = None) -> Union[str, None]:
+        """Returns the expected SHA-256 hash of the file downloaded from the
+        given URL
+
+        A hash pinned in the settings file takes precedence over a hash listed
+        in a checksum file published along with the downloaded file.
+
+        Parameters
+        ----------
+        url
+            URL of the file to be downloaded
+        checksum_file_url
+            URL of a checksum file in the format of the output of sha256sum
+
+        Returns
+        -------
+        Union[str, None]
+            expected SHA-256 hash or None if it is unknown
+        """
+
+        result = dg.config.data_gate_configuration_manager.get_pinned_sha256(url)
+
+        if (result is None) and (checksum_file_url is not None):
+            result = dg.utils.download.get_sha256_from_checksum_file(
+                urllib.parse.urlsplit(checksum_file_url), urllib.parse.urlsplit(url).path.split("/")[-1]
+            )
+
+            if result is None:
+                logger.warning(f"SHA-256 hash of {url} is not listed in {checksum_file_url}")
+
+        return result
+
+    def _get_expected_sha256_of_github_release_asset(
+        self, owner: str, repo: str, tag: str, asset_name: str
+    ) -> Union[str, None]:
+        """Returns the expected SHA-256 hash of a GitHub release asset
+
+        A hash pinned in the settings file takes precedence over the digest
+        of the asset returned by the GitHub Releases API. If the API does not
+        return a digest, the hash is looked up in a checksum file published as
+        a release asset (e.g., "<name>_SHA256SUMS" or "checksums.txt").
+
+        Parameters
+        ----------
+        owner
+            GitHub repository owner
+        repo
+            GitHub repository name
+        tag
+            tag of the release
+        asset_name
+            name of the release asset
+
+        Returns
+        -------
+        Union[str, None]
+            expected SHA-256 hash or None if it is unknown
+        """
+
+        result = dg.config.data_gate_configuration_manager.get_pinned_sha256(
+            f"https://github.com/{owner}/{repo}/releases/download/{tag}/{asset_name}"
+        )
+
+        if result is not None:
+            return result
+
+        assets = dg.lib.github.get_github_api_client().get_release_by_tag(owner, repo, tag)["assets"]
+
+        for asset in assets:
+            if (asset["name"] == asset_name) and str(asset.get("digest")).startswith("sha256:"):
+                return asset["digest"].removeprefix("sha256:")
+
+        for asset in assets:
+            if regex.search("(SHA256SUMS|checksums\\.txt)$", asset["name"]) is not None:
+                return dg.utils.download.get_sha256_from_checksum_file(
+                    urllib.parse.urlsplit(asset["browser_download_url"]), asset_name
+                )
+
+        return None
+
     def _get_latest_binary_version_on_github(self, owner: str, repo: str) -> Union[semver.VersionInfo, None]:
         """Returns the latest version of a dependency on GitHub
 
+        The latest full release is requested first. Only if its name does not
+        contain a version, releases are requested page by page until a
+        release with a name containing a version is found (see
+        dg.lib.github.GitHubAPIClient).
+
         This method parses the "name" key of the JSON document returned by the
         GitHub Releases API, which has the following structure:
 
@@ -128,16 +239,18 @@ class AbstractDownloadManagerPlugIn(ABC):
             latest version of a dependency or None if no release was found
         """
 
-        response = requests.get(f"https://api.github.com/repos/{owner}/{repo}/releases")
-        response.raise_for_status()
+        github_api_client = dg.lib.github.get_github_api_client()
+        latest_release = github_api_client.get_latest_release(owner, repo)
+        releases = itertools.chain(
+            [latest_release] if latest_release is not None else [], github_api_client.get_releases(owner, repo)
+        )
 
-        response_json = json.loads(response.content)
         result: Union[semver.VersionInfo, None] = None
 
-        for release in response_json:
+        for release in releases:
             search_result = regex.search(
                 "v(\\d+\\.\\d+\\.\\d+)$",
-                release["name"],
+                str(release["name"]),
             )
 
             if search_result is not None:
@@ -16,6 +16,8 @@ import os
 import pathlib
 import urllib.parse
 
+from typing import Union
+
 import semver
 
 import dg.config
@@ -33,7 +35,7 @@ from dg.utils.operating_system import OperatingSystem
 
 class IBMCloudCLIPlugIn(AbstractDownloadManagerPlugIn):
     # override
-    def download_binary_version(self, version: semver.VersionInfo):
+    def download_binary_version(self, version: semver.VersionInfo) -> Union[str, None]:
         operating_system = dg.utils.operating_system.get_operating_system()
         operating_system_directory_name_pattern_dict = {
             OperatingSystem.LINUX_X86_64: "linux64",
@@ -43,14 +45,25 @@ class IBMCloudCLIPlugIn(AbstractDownloadManagerPlugIn):
 
         directory = operating_system_directory_name_pattern_dict[operating_system]
         url = f"https://clis.cloud.ibm.com/download/bluemix-cli/{str(version)}/{directory}/archive"
-        archive_path = dg.utils.download.download_file(urllib.parse.urlsplit(url))
 
-        self._extract_archive(archive_path)
+        # the IBM Cloud CLI download site does not publish checksums
+        return self._download_and_extract_archive(urllib.parse.urlsplit(url), self._get_expected_sha256(url))
 
     # override
     def get_binary_alias(self) -> str:
         return "ibmcloud"
 
+    # override
+    def get_binary_file_paths(self) -> list[pathlib.Path]:
+        return [
+            dg.config.data_gate_configuration_manager.get_dg_bin_directory_path()
+            / (
+                "ibmcloud.exe"
+                if dg.utils.operating_system.get_operating_system() == OperatingSystem.WINDOWS
+                else "ibmcloud"
+            )
+        ]
+
     # override
     def get_latest_binary_version(self) -> semver.VersionInfo:
         latest_version = self._get_latest_binary_version_on_github("IBM-Cloud", "ibm-cloud-cli-release")
@@ -60,13 +73,21 @@ class IBMCloudCLIPlugIn(AbstractDownloadManagerPlugIn):
 
         return latest_version
 
-    def _extract_archive(self, archive_path: pathlib.Path):
-        """Extracts the given archive in a dependency-specific manner
+    def _download_and_extract_archive(self, url: urllib.parse.SplitResult, expected_sha256: Union[str, None]) -> str:
+        """Downloads and extracts the given archive in a dependency-specific
+        manner (the archive is not kept after it was extracted)
 
         Parameters
         ----------
-        archive_path
-            path of the archive to be extracted
+        url
+            URL of the archive to be downloaded
+        expected_sha256
+            expected SHA-256 hash of the archive
+
+        Returns
+        -------
+        str
+            SHA-256 hash of the archive
         """
 
         member_identification_func: dg.utils.compression.MemberIdentificationFunc = lambda path, file_type: (
@@ -75,10 +96,15 @@ class IBMCloudCLIPlugIn(AbstractDownloadManagerPlugIn):
         )
 
         target_directory_path = dg.config.data_gate_configuration_manager.get_dg_bin_directory_path()
+        sha256_hashes: list[str] = []
 
-        dg.utils.compression.extract_archive(
-            archive_path,
+        dg.utils.download.download_and_extract_archive(
+            url,
             target_directory_path,
+            expected_sha256=expected_sha256,
             ignoreDirectoryStructure=True,
             memberIdentificationFunc=member_identification_func,
+            sha256_func=sha256_hashes.append,
         )
+
+        return sha256_hashes[0]
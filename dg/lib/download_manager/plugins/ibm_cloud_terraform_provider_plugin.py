@@ -16,10 +16,11 @@ import os
 import pathlib
 import urllib.parse
 
+from typing import Union
+
 import semver
 
 import dg.config
-import dg.utils.compression
 import dg.utils.download
 import dg.utils.operating_system
 
@@ -48,22 +49,29 @@ class IBMCloudTerraformProviderPlugIn(AbstractDownloadManagerPlugIn):
         }
 
     # override
-    def download_binary_version(self, version: semver.VersionInfo):
+    def download_binary_version(self, version: semver.VersionInfo) -> Union[str, None]:
         operating_system = dg.utils.operating_system.get_operating_system()
         file_name = self._ibmcloud_terraform_provider_plugin_configuration_data_dict[operating_system][
             "ibm_cloud_terraform_provider_file_name"
         ]
 
         url = f"https://github.com/IBM-Cloud/terraform-provider-ibm/releases/download/v{str(version)}/{file_name}"
-        archive_path = dg.utils.download.download_file(urllib.parse.urlsplit(url))
-        target_directory_path = self.get_terraform_plugins_directory_path()
-
-        self._extract_archive(archive_path, target_directory_path)
+        return self._download_and_extract_archive(
+            urllib.parse.urlsplit(url),
+            self._get_expected_sha256_of_github_release_asset(
+                "IBM-Cloud", "terraform-provider-ibm", f"v{str(version)}", file_name
+            ),
+            self.get_terraform_plugins_directory_path(),
+        )
 
     # override
     def get_binary_alias(self) -> str:
         return "ibmcloud_terraform_provider_plugin"
 
+    # override
+    def get_binary_file_paths(self) -> list[pathlib.Path]:
+        return sorted(self.get_terraform_plugins_directory_path().glob("terraform-provider-ibm*"))
+
     # override
     def get_latest_binary_version(self) -> semver.VersionInfo:
         latest_version = self._get_latest_binary_version_on_github("IBM-Cloud", "terraform-provider-ibm")
@@ -91,18 +99,37 @@ class IBMCloudTerraformProviderPlugIn(AbstractDownloadManagerPlugIn):
             ]
         )
 
-    def _extract_archive(self, archive_path: pathlib.Path, target_directory_path: pathlib.Path):
-        """Extracts the given archive in a dependency-specific manner
+    def _download_and_extract_archive(
+        self,
+        url: urllib.parse.SplitResult,
+        expected_sha256: Union[str, None],
+        target_directory_path: pathlib.Path,
+    ) -> str:
+        """Downloads and extracts the given archive in a dependency-specific
+        manner (the archive is not kept after it was extracted)
 
         Parameters
         ----------
-        archive_path
-            path of the archive to be extracted
+        url
+            URL of the archive to be downloaded
+        expected_sha256
+            expected SHA-256 hash of the archive
         target_directory_path
             path of the directory the archive shall be extracted to
+
+        Returns
+        -------
+        str
+            SHA-256 hash of the archive
         """
 
         for entry in pathlib.Path(target_directory_path).glob("terraform-provider-ibm*"):
             os.remove(entry)
 
-        dg.utils.compression.extract_archive(archive_path, target_directory_path)
+        sha256_hashes: list[str] = []
+
+        dg.utils.download.download_and_extract_archive(
+            url, target_directory_path, expected_sha256=expected_sha256, sha256_func=sha256_hashes.append
+        )
+
+        return sha256_hashes[0]
@@ -18,6 +18,8 @@ import pathlib
 import re as regex
 import urllib.parse
 
+from typing import Union
+
 import semver
 
 import dg.config
@@ -35,7 +37,7 @@ from dg.utils.operating_system import OperatingSystem
 
 class OpenShiftClientCLIPlugIn(AbstractDownloadManagerPlugIn):
     # override
-    def download_binary_version(self, version: semver.VersionInfo):
+    def download_binary_version(self, version: semver.VersionInfo) -> Union[str, None]:
         operating_system = dg.utils.operating_system.get_operating_system()
         operating_system_file_name_pattern_dict = {
             OperatingSystem.LINUX_X86_64: "openshift-client-linux.tar.gz",
@@ -45,14 +47,20 @@ class OpenShiftClientCLIPlugIn(AbstractDownloadManagerPlugIn):
 
         file_name = operating_system_file_name_pattern_dict[operating_system]
         url = f"https://mirror.openshift.com/pub/openshift-v4/clients/ocp/{str(version)}/{file_name}"
-        archive_path = dg.utils.download.download_file(urllib.parse.urlsplit(url))
+        expected_sha256 = self._get_expected_sha256(
+            url, f"https://mirror.openshift.com/pub/openshift-v4/clients/ocp/{str(version)}/sha256sum.txt"
+        )
 
-        self._extract_archive(archive_path)
+        return self._download_and_extract_archive(urllib.parse.urlsplit(url), expected_sha256)
 
     # override
     def get_binary_alias(self) -> str:
         return "oc"
 
+    # override
+    def get_binary_file_paths(self) -> list[pathlib.Path]:
+        return [dg.config.data_gate_configuration_manager.get_dg_bin_directory_path() / "oc"]
+
     # override
     def get_latest_binary_version(self) -> semver.VersionInfo:
         """Returns the latest version of the OpenShift Client CLI
@@ -74,13 +82,21 @@ class OpenShiftClientCLIPlugIn(AbstractDownloadManagerPlugIn):
 
             return latest_version
 
-    def _extract_archive(self, archive_path: pathlib.Path):
-        """Extracts the given archive in a dependency-specific manner
+    def _download_and_extract_archive(self, url: urllib.parse.SplitResult, expected_sha256: Union[str, None]) -> str:
+        """Downloads and extracts the given archive in a dependency-specific
+        manner (tar.gz archives are extracted while they are downloaded)
 
         Parameters
         ----------
-        archive_path
-            path of the archive to be extracted
+        url
+            URL of the archive to be downloaded
+        expected_sha256
+            expected SHA-256 hash of the archive
+
+        Returns
+        -------
+        str
+            SHA-256 hash of the archive
         """
 
         member_identification_func: dg.utils.compression.MemberIdentificationFunc = lambda path, file_type: (
@@ -89,12 +105,18 @@ class OpenShiftClientCLIPlugIn(AbstractDownloadManagerPlugIn):
 
         target_directory_path = dg.config.data_gate_configuration_manager.get_dg_bin_directory_path()
 
-        dg.utils.compression.extract_archive(
-            archive_path,
+        sha256_hashes: list[str] = []
+
+        dg.utils.download.download_and_extract_archive(
+            url,
             target_directory_path,
+            expected_sha256=expected_sha256,
             memberIdentificationFunc=member_identification_func,
+            sha256_func=sha256_hashes.append,
         )
 
+        return sha256_hashes[0]
+
     def _parse_openshift_client_cli_version_from_versions_file(self, file_contents: str) -> semver.VersionInfo:
         """Parses the OpenShift Client CLI version contained in the given file
         contents
@@ -17,6 +17,8 @@ import pathlib
 import stat
 import urllib.parse
 
+from typing import Union
+
 import semver
 
 import dg.config
@@ -33,7 +35,7 @@ from dg.utils.operating_system import OperatingSystem
 
 class TerraformPlugin(AbstractDownloadManagerPlugIn):
     # override
-    def download_binary_version(self, version: semver.VersionInfo):
+    def download_binary_version(self, version: semver.VersionInfo) -> Union[str, None]:
         operating_system = dg.utils.operating_system.get_operating_system()
         operating_system_to_file_name_suffix_dict = {
             OperatingSystem.LINUX_X86_64: "linux_amd64.zip",
@@ -44,14 +46,30 @@ class TerraformPlugin(AbstractDownloadManagerPlugIn):
         file_name_suffix = operating_system_to_file_name_suffix_dict[operating_system]
         file_name = f"terraform_{str(version)}_{file_name_suffix}"
         url = f"https://releases.hashicorp.com/terraform/{str(version)}/{file_name}"
-        archive_path = dg.utils.download.download_file(urllib.parse.urlsplit(url))
 
-        self._extract_archive(archive_path, operating_system)
+        return self._download_and_extract_archive(
+            urllib.parse.urlsplit(url),
+            self._get_expected_sha256(
+                url, f"https://releases.hashicorp.com/terraform/{str(version)}/terraform_{str(version)}_SHA256SUMS"
+            ),
+            operating_system,
+        )
 
     # override
     def get_binary_alias(self) -> str:
         return "terraform"
 
+    # override
+    def get_binary_file_paths(self) -> list[pathlib.Path]:
+        return [
+            dg.config.data_gate_configuration_manager.get_dg_bin_directory_path()
+            / (
+                "terraform.exe"
+                if dg.utils.operating_system.get_operating_system() == OperatingSystem.WINDOWS
+                else "terraform"
+            )
+        ]
+
     # override
     def get_latest_binary_version(self) -> semver.VersionInfo:
         latest_version = self._get_latest_binary_version_on_github("hashicorp", "terraform")
@@ -61,18 +79,32 @@ class TerraformPlugin(AbstractDownloadManagerPlugIn):
 
         return latest_version
 
-    def _extract_archive(self, archive_path: pathlib.Path, operating_system: OperatingSystem):
-        """Extracts the given archive in a dependency-specific manner
+    def _download_and_extract_archive(
+        self,
+        url: urllib.parse.SplitResult,
+        expected_sha256: Union[str, None],
+        operating_system: OperatingSystem,
+    ) -> str:
+        """Downloads and extracts the given archive in a dependency-specific
+        manner (the archive is not kept after it was extracted)
 
         Parameters
         ----------
-        archive_path
-            path of the archive to be extracted
+        url
+            URL of the archive to be downloaded
+        expected_sha256
+            expected SHA-256 hash of the archive
         operating_system
             current operating system
+
+        Returns
+        -------
+        str
+            SHA-256 hash of the archive
         """
 
         target_directory_path = dg.config.data_gate_configuration_manager.get_dg_bin_directory_path()
+        sha256_hashes: list[str] = []
 
         if (operating_system == dg.utils.operating_system.OperatingSystem.LINUX_X86_64) or (
             operating_system == dg.utils.operating_system.OperatingSystem.MAC_OS
@@ -83,10 +115,16 @@ class TerraformPlugin(AbstractDownloadManagerPlugIn):
                 os.stat(path).st_mode | stat.S_IXGRP | stat.S_IXOTH | stat.S_IXUSR,
             )
 
-            dg.utils.compression.extract_archive(
-                archive_path,
+            dg.utils.download.download_and_extract_archive(
+                url,
                 target_directory_path,
+                expected_sha256=expected_sha256,
                 postExtractionFunc=post_extraction_func,
+                sha256_func=sha256_hashes.append,
             )
         else:
-            dg.utils.compression.extract_archive(archive_path, target_directory_path)
+            dg.utils.download.download_and_extract_archive(
+                url, target_directory_path, expected_sha256=expected_sha256, sha256_func=sha256_hashes.append
+            )
+
+        return sha256_hashes[0]
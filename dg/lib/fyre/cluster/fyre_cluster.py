@@ -13,7 +13,6 @@
 #  limitations under the License.
 
 import dg.config
-import dg.lib.fyre.openshift
 import dg.lib.openshift
 
 from dg.lib.cluster.cluster import AbstractCluster, ClusterData
@@ -24,6 +23,10 @@ class FYRECluster(AbstractCluster):
         super().__init__(server, cluster_data)
 
     def get_cluster_access_token(self) -> str:
+        # dg.lib.fyre.openshift is only imported if required as it imports
+        # asyncssh, which is slow
+        import dg.lib.fyre.openshift
+
         token = dg.lib.openshift.get_cluster_access_token(
             dg.lib.fyre.openshift.OPENSHIFT_OAUTH_AUTHORIZATION_ENDPOINT.format(self.cluster_data["cluster_name"]),
             self.cluster_data["username"],
@@ -32,6 +35,11 @@ class FYRECluster(AbstractCluster):
 
         return token
 
+    def get_oc_login_args(self) -> list[str]:
+        return dg.lib.openshift.get_oc_login_args_with_password(
+            self.server, self.cluster_data["username"], self.cluster_data["password"]
+        )
+
     def login(self):
         dg.lib.openshift.log_in_to_openshift_cluster_with_password(
             self.server, self.cluster_data["username"], self.cluster_data["password"]
@@ -94,5 +94,6 @@ async def install_nfs_storage_class_on_remote_host(
             "./"
             + nfs_storage_class_installation_script_path.name
             + " "
-            + str(private_ip_address_of_infrastructure_node)
+            + str(private_ip_address_of_infrastructure_node),
+            max_captured_size=0,
         )
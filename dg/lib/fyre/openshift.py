@@ -12,166 +12,929 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import asyncio
+import datetime
+import hashlib
+import json
+import logging
+import os
 import pathlib
+import re as regex
+import shlex
+import tempfile
+import time
 
-from typing import Final
+from typing import Any, Awaitable, Callable, Final, Union
 
+import click
+
+from tabulate import tabulate
+
+import dg.config
 import dg.lib.openshift
-import dg.utils.process
 import dg.utils.ssh
 
+from dg.lib.error import DataGateCLIException
+
 OPENSHIFT_OAUTH_AUTHORIZATION_ENDPOINT: Final[str] = (
     "https://oauth-openshift.apps.{}.os.fyre.ibm.com/oauth/authorize?"
     "client_id=openshift-challenging-client&response_type=token"
 )
 
+DEFAULT_MAX_PARALLELISM: Final[int] = 16
+MAX_REMOTE_EXECUTION_SUMMARY_RECORD_COUNT: Final[int] = 20
+SELINUX_POLICY_MODULE_NAME: Final[str] = "db2u-nfs"
 STORAGE_PATH: Final[str] = "/var/home/core/data"
 
+# prints the state of a worker node with respect to the initialization
+# steps as key-value pairs (one round trip per node)
+NODE_STATE_PROBE_COMMAND: Final[str] = "; ".join(
+    [
+        "echo container_manage_cgroup=$(getsebool container_manage_cgroup 2>/dev/null | awk '{print $3}')",
+        "echo file_context=$(sudo semanage fcontext --list --locallist 2>/dev/null | "
+        f"grep --fixed-strings '{STORAGE_PATH}(/.*)?' | grep --count container_file_t)",
+        f"echo storage_path_context=$(stat --format %C {STORAGE_PATH} 2>/dev/null)",
+        f"echo storage_path_mode=$(stat --format %a {STORAGE_PATH} 2>/dev/null)",
+        "echo selinux_policy_module=$(sudo semodule --list-modules 2>/dev/null | "
+        f"grep --count '^{SELINUX_POLICY_MODULE_NAME}\\b')",
+        f"echo selinux_policy_module_hash=$(cat {SELINUX_POLICY_MODULE_NAME}.sha256 2>/dev/null)",
+        "echo selinux_policy_toolchain=$(. /etc/os-release 2>/dev/null && echo $ID-$VERSION_ID)/"
+        "$(checkmodule -V 2>/dev/null)",
+    ]
+)
+
+
+class NodeState:
+    """State of a worker node with respect to the initialization steps"""
+
+    def __init__(self, node_state_probe_command_result: str):
+        """Constructor
+
+        Parameters
+        ----------
+        node_state_probe_command_result
+            output of NODE_STATE_PROBE_COMMAND
+        """
+
+        values: dict[str, str] = dict(
+            regex.findall("^(\\w+)=(.*?)\\s*$", node_state_probe_command_result, regex.MULTILINE)
+        )
+
+        self.is_container_manage_cgroup_enabled = values.get("container_manage_cgroup") == "on"
+        self.is_storage_path_file_context_defined = values.get("file_context", "0") not in ["", "0"]
+        self.is_storage_path_labeled = "container_file_t" in values.get("storage_path_context", "")
+        self.is_storage_path_writable = values.get("storage_path_mode") == "777"
+        self.selinux_policy_module_hash: Union[str, None] = (
+            values.get("selinux_policy_module_hash", "")
+            if values.get("selinux_policy_module", "0") not in ["", "0"]
+            else None
+        )
+
+        # operating system and policy version of checkmodule, which determine
+        # the module format supported by the node
+        self.selinux_policy_toolchain = values.get("selinux_policy_toolchain", "")
+
+
+class NodeInitializationResult:
+    """Result of executing the per-node initialization steps on a worker
+    node"""
+
+    def __init__(self, step_count: int, duration: float, error: Union[str, None] = None):
+        self.duration = duration
+        self.error = error
+        self.step_count = step_count
 
-def init_node_for_db2(node: str, db2_edition: str, use_host_path_storage: bool):
-    """Initializes a worker node before creating a Db2 instance
+    def get_summary(self) -> str:
+        if self.error is not None:
+            return f"failed ({self.error})"
+        elif self.step_count != 0:
+            return f"{self.step_count} step(s) executed"
+        else:
+            return "up to date"
+
+
+async def get_selinux_policy_module_package_file_path(
+    nodeClient: dg.utils.ssh.RemoteClient, type_enforcement_file_hash: str, toolchain: str
+) -> pathlib.Path:
+    """Returns the path of the compiled Data Gate SELinux policy module
+    package
+
+    The package is compiled on the given worker node as the module format
+    emitted by checkmodule must be supported by semodule on the node (e.g., a
+    package compiled on a workstation with a newer toolchain is rejected by
+    semodule on RHCOS). It is cached in the Data Gate CLI cache directory per
+    version of the type enforcement file and per toolchain of the node.
 
     Parameters
     ----------
-    node
-        hostname of the worker node to be initialized
+    nodeClient
+        connected SSH client of the worker node the package is compiled on
+    type_enforcement_file_hash
+        SHA-256 hash of the type enforcement file
+    toolchain
+        operating system and policy version of checkmodule on the worker node
+        (see NodeState.selinux_policy_toolchain)
+
+    Returns
+    -------
+    pathlib.Path
+        path of the cached policy module package
+    """
+
+    package_file_path = _get_selinux_policy_module_package_cache_file_path(type_enforcement_file_hash, toolchain)
+
+    if package_file_path.exists():
+        return package_file_path
+
+    package_file_path.parent.mkdir(exist_ok=True, parents=True)
+
+    # the package is written to a temporary directory first so that a partially
+    # written package is never cached
+    with tempfile.TemporaryDirectory(dir=package_file_path.parent) as temporary_directory:
+        compiled_package_file_path = pathlib.Path(temporary_directory) / package_file_path.name
+
+        await _compile_selinux_policy_module_package_on_node(nodeClient, compiled_package_file_path)
+
+        compiled_package_file_path.replace(package_file_path)
+
+    logging.info(f"Cached SELinux policy module package: {package_file_path}")
+
+    return package_file_path
+
+
+def get_selinux_policy_module_type_enforcement_file_hash() -> str:
+    """Returns the SHA-256 hash of the type enforcement file of the Data Gate
+    SELinux policy module
+
+    The hash identifies the module version installed on a worker node.
+
+    Returns
+    -------
+    str
+        SHA-256 hash of the type enforcement file
+    """
+
+    return hashlib.sha256(_get_selinux_policy_module_type_enforcement_file_path().read_bytes()).hexdigest()
+
+
+def init_node_for_db2(
+    nodes: list[str],
+    db2_edition: str,
+    use_host_path_storage: bool,
+    node_selector: Union[str, None] = None,
+    max_parallelism: int = DEFAULT_MAX_PARALLELISM,
+):
+    """Initializes worker nodes before creating a Db2 instance
+
+    The state of the nodes is probed first and only missing steps are
+    executed. Nodes are tainted and labeled with a single oc invocation
+    each. The remaining steps are executed on several nodes concurrently.
+
+    Parameters
+    ----------
+    nodes
+        hostnames of the worker nodes to be initialized
     db2_edition
         Db2 edition
     use_host_path_storage
         flag indicating whether hostpath storage shall be used
+    node_selector
+        label selector identifying additional worker nodes to be initialized
+    max_parallelism
+        maximum number of nodes initialized at the same time
     """
 
-    dg.lib.openshift.execute_oc_command(_get_oc_adm_taint_node_command(node, db2_edition))
-    dg.lib.openshift.execute_oc_command(_get_oc_label_node_command(node, db2_edition))
-    dg.utils.process.execute_command(pathlib.Path("ssh"), _get_ssh_setsebool_container_manage_cgroup_command(node))
+    if node_selector is not None:
+        nodes = _merge_nodes(nodes, dg.lib.openshift.get_node_names(node_selector))
 
-    if use_host_path_storage:
-        label_storage_path(node)
+    _raise_if_no_nodes(nodes)
+
+    node_objects = dg.lib.openshift.get_kubernetes_api_resource("/api/v1/nodes")["items"]
+    nodes_to_be_tainted = _get_nodes_to_be_tainted(node_objects, nodes, db2_edition)
+    nodes_to_be_labeled = _get_nodes_to_be_labeled(node_objects, nodes, db2_edition)
+    taint_results: dict[str, str] = {}
+    label_results: dict[str, str] = {}
+
+    if len(nodes_to_be_tainted) != 0:
+        taint_results = _execute_oc_node_command(
+            _get_oc_adm_taint_nodes_command(nodes_to_be_tainted, db2_edition), nodes_to_be_tainted
+        )
+
+    if len(nodes_to_be_labeled) != 0:
+        label_results = _execute_oc_node_command(
+            _get_oc_label_nodes_command(nodes_to_be_labeled, db2_edition), nodes_to_be_labeled
+        )
+
+    # the local host is the infrastructure node, from which worker nodes may
+    # be reached directly
+    recorder = _create_remote_execution_recorder("init-node-for-db2")
+    node_results = asyncio.get_event_loop().run_until_complete(
+        _initialize_nodes(
+            nodes,
+            lambda node: dg.utils.ssh.RemoteClient(node, "core", recorder=recorder),
+            lambda nodeClient: _initialize_node_for_db2(nodeClient, use_host_path_storage),
+            max_parallelism,
+        )
+    )
+
+    _echo_node_results(nodes, node_results, taint_results, label_results)
+    _echo_remote_execution_summary(recorder)
+    _raise_if_initialization_failed(node_results, taint_results, label_results)
 
 
 async def init_node_for_db2_from_remote_host(
     infrastructure_node_hostname: str,
-    node: str,
+    nodes: list[str],
     db2_edition: str,
     use_host_path_storage: bool,
     oc_login_command_for_remote_host: str,
+    node_selector: Union[str, None] = None,
+    max_parallelism: int = DEFAULT_MAX_PARALLELISM,
 ):
-    """Initializes a worker node from a remote host before creating a Db2
+    """Initializes worker nodes from a remote host before creating a Db2
     instance
 
+    The state of the nodes is probed first and only missing steps are
+    executed. Nodes are tainted and labeled with a single oc invocation
+    each. The remaining steps are executed on several nodes concurrently.
+
     Parameters
     ----------
     infrastructure_node_hostname
         infrastructure node hostname
-    node
-        hostname of the worker node to be initialized
+    nodes
+        hostnames of the worker nodes to be initialized
     db2_edition
         Db2 edition
     use_host_path_storage
         flag indicating whether hostpath storage shall be used
     oc_login_command_for_remote_host
         oc login command for logging in to OpenShift on the remote host
+    node_selector
+        label selector identifying additional worker nodes to be initialized
+    max_parallelism
+        maximum number of nodes initialized at the same time
     """
 
     async with dg.utils.ssh.RemoteClient(infrastructure_node_hostname) as remoteClient:
         await remoteClient.connect()
         await remoteClient.execute(oc_login_command_for_remote_host)
-        await remoteClient.execute("oc " + " ".join(_get_oc_adm_taint_node_command(node, db2_edition)))
-        await remoteClient.execute("oc " + " ".join(_get_oc_label_node_command(node, db2_edition)))
-        await remoteClient.execute("ssh " + " ".join(_get_ssh_setsebool_container_manage_cgroup_command(node)))
 
-        if use_host_path_storage:
-            await label_storage_path_from_remote_host(remoteClient, node)
+        if node_selector is not None:
+            nodes = _merge_nodes(nodes, await _get_node_names_from_remote_host(remoteClient, node_selector))
+
+        _raise_if_no_nodes(nodes)
+
+        node_objects = _parse_oc_get_nodes_command_result(
+            await remoteClient.execute(
+                "oc " + shlex.join(["get", "nodes", "--output", "json"] + nodes), print_output=False
+            )
+        )
+
+        nodes_to_be_tainted = _get_nodes_to_be_tainted(node_objects, nodes, db2_edition)
+        nodes_to_be_labeled = _get_nodes_to_be_labeled(node_objects, nodes, db2_edition)
+        taint_results: dict[str, str] = {}
+        label_results: dict[str, str] = {}
+
+        if len(nodes_to_be_tainted) != 0:
+            taint_results = await _execute_oc_node_command_from_remote_host(
+                remoteClient, _get_oc_adm_taint_nodes_command(nodes_to_be_tainted, db2_edition), nodes_to_be_tainted
+            )
+
+        if len(nodes_to_be_labeled) != 0:
+            label_results = await _execute_oc_node_command_from_remote_host(
+                remoteClient, _get_oc_label_nodes_command(nodes_to_be_labeled, db2_edition), nodes_to_be_labeled
+            )
+
+        recorder = _create_remote_execution_recorder("init-node-for-db2")
+        node_results = await _initialize_nodes(
+            nodes,
+            lambda node: remoteClient.create_tunnelled_client(node, recorder=recorder),
+            lambda nodeClient: _initialize_node_for_db2(nodeClient, use_host_path_storage),
+            max_parallelism,
+        )
+
+    _echo_node_results(nodes, node_results, taint_results, label_results)
+    _echo_remote_execution_summary(recorder)
+    _raise_if_initialization_failed(node_results, taint_results, label_results)
+
 
+async def init_node_for_data_gate_from_remote_host(
+    infrastructure_node_hostname: str,
+    nodes: list[str],
+    oc_login_command_for_remote_host: Union[str, None] = None,
+    node_selector: Union[str, None] = None,
+    max_parallelism: int = DEFAULT_MAX_PARALLELISM,
+):
+    """Initializes worker nodes from a remote host before creating a Data
+    Gate instance
+
+    The Data Gate SELinux policy module is only installed if it is not
+    installed on a worker node or if the installed version differs from the
+    version shipped with the Data Gate CLI. The module is compiled on a
+    worker node at most once per toolchain of the nodes (see
+    get_selinux_policy_module_package_file_path()) and the compiled package
+    is copied to several nodes concurrently.
+
+    Parameters
+    ----------
+    infrastructure_node_hostname
+        infrastructure node hostname
+    nodes
+        hostnames of the worker nodes to be initialized
+    oc_login_command_for_remote_host
+        oc login command for logging in to OpenShift on the remote host
+        (required if node_selector is not None)
+    node_selector
+        label selector identifying additional worker nodes to be initialized
+    max_parallelism
+        maximum number of nodes initialized at the same time
+    """
+
+    async with dg.utils.ssh.RemoteClient(infrastructure_node_hostname) as remoteClient:
+        await remoteClient.connect()
+
+        if node_selector is not None:
+            if oc_login_command_for_remote_host is None:
+                raise DataGateCLIException("Logging in to OpenShift is required to select worker nodes")
 
-def label_storage_path(node: str):
-    """Labels the storage path on the given node
+            await remoteClient.execute(oc_login_command_for_remote_host)
 
-    See https://www.ibm.com/support/producthub/icpdata/docs/content/SSQNUZ_latest/svc-db2/hostpath-selinux-aese.html
+            nodes = _merge_nodes(nodes, await _get_node_names_from_remote_host(remoteClient, node_selector))
+
+        _raise_if_no_nodes(nodes)
+
+        type_enforcement_file_hash = get_selinux_policy_module_type_enforcement_file_hash()
+        package_file_path_tasks: dict[str, asyncio.Future] = {}
+
+        def get_package_file_path(nodeClient: dg.utils.ssh.RemoteClient, toolchain: str) -> Awaitable[pathlib.Path]:
+            # the package is only compiled if a node requires it and at most
+            # once for all nodes with the same toolchain
+            if toolchain not in package_file_path_tasks:
+                package_file_path_tasks[toolchain] = asyncio.ensure_future(
+                    get_selinux_policy_module_package_file_path(nodeClient, type_enforcement_file_hash, toolchain)
+                )
+
+            return package_file_path_tasks[toolchain]
+
+        recorder = _create_remote_execution_recorder("init-node-for-data-gate")
+        node_results = await _initialize_nodes(
+            nodes,
+            lambda node: remoteClient.create_tunnelled_client(node, recorder=recorder),
+            lambda nodeClient: _initialize_node_for_data_gate(
+                nodeClient, type_enforcement_file_hash, get_package_file_path
+            ),
+            max_parallelism,
+        )
+
+    _echo_node_results(nodes, node_results)
+    _echo_remote_execution_summary(recorder)
+    _raise_if_initialization_failed(node_results)
+
+
+async def probe_node_state(nodeClient: dg.utils.ssh.RemoteClient) -> NodeState:
+    """Probes the state of a worker node with a single SSH command
 
     Parameters
     ----------
+    nodeClient
+        SSH client of the worker node
+
+    Returns
+    -------
+    NodeState
+        state of the worker node
+    """
+
+    await nodeClient.connect()
+
+    return NodeState(await nodeClient.execute(NODE_STATE_PROBE_COMMAND, print_output=False))
+
+
+async def _compile_selinux_policy_module_package_on_node(
+    nodeClient: dg.utils.ssh.RemoteClient, package_file_path: pathlib.Path
+):
+    module_name = SELINUX_POLICY_MODULE_NAME
+    batch = dg.utils.ssh.RemoteBatch()
+    batch.add_payload_file(_get_selinux_policy_module_type_enforcement_file_path())
+
+    for command in _get_selinux_policy_module_compilation_commands(f"{module_name}.te", f"{module_name}.pp"):
+        batch.add_step(shlex.join(command), shlex.join(command))
+
+    try:
+        result = await nodeClient.execute_batch(batch, print_output=False, check=False)
+
+        if result.exit_code != 0:
+            raise DataGateCLIException(
+                f"Command '{result.get_failed_step_name()}' failed with exit code {result.exit_code}",
+                stderr=result.output,
+            )
+
+        await nodeClient.download(f"{module_name}.pp", package_file_path)
+    finally:
+        await nodeClient.execute(
+            f"rm --force {module_name}.te {module_name}.mod {module_name}.pp", print_output=False, check=False
+        )
+
+
+def _create_remote_execution_recorder(command_name: str) -> dg.utils.ssh.RemoteExecutionRecorder:
+    return dg.utils.ssh.RemoteExecutionRecorder(
+        dg.config.data_gate_configuration_manager.get_dg_runs_directory_path()
+        / f"{datetime.datetime.now():%Y%m%d-%H%M%S}-{command_name}-{os.getpid()}"
+    )
+
+
+def _echo_node_results(
+    nodes: list[str],
+    node_results: dict[str, NodeInitializationResult],
+    taint_results: Union[dict[str, str], None] = None,
+    label_results: Union[dict[str, str], None] = None,
+):
+    """Prints a consolidated report of initializing the given nodes
+
+    Parameters
+    ----------
+    nodes
+        hostnames of the initialized worker nodes
+    node_results
+        dictionary associating node names with the results of executing the
+        per-node steps
+    taint_results
+        dictionary associating node names with the result of tainting them
+    label_results
+        dictionary associating node names with the result of labeling them
+    """
+
+    headers = ["node"]
+    node_list: list[list[str]] = []
+
+    if taint_results is not None:
+        headers.append("taint")
+
+    if label_results is not None:
+        headers.append("label")
+
+    headers += ["node setup", "duration"]
+
+    for node in nodes:
+        node_list_element = [node]
+
+        if taint_results is not None:
+            node_list_element.append(taint_results.get(node, "already tainted"))
+
+        if label_results is not None:
+            node_list_element.append(label_results.get(node, "already labeled"))
+
+        node_result = node_results[node]
+
+        node_list_element += [node_result.get_summary(), f"{node_result.duration:.1f}s"]
+        node_list.append(node_list_element)
+
+    click.echo(tabulate(node_list, headers=headers))
+
+
+def _echo_remote_execution_summary(recorder: dg.utils.ssh.RemoteExecutionRecorder):
+    """Prints the slowest commands and batch steps executed on worker nodes
+    and the directory containing the log file of each node
+
+    Parameters
+    ----------
+    recorder
+        recorder of commands executed on worker nodes
+    """
+
+    if len(recorder.records) == 0:
+        return
+
+    click.echo()
+    click.echo(recorder.get_summary(MAX_REMOTE_EXECUTION_SUMMARY_RECORD_COUNT))
+    click.echo(f"\nLogs of worker nodes: {recorder.run_directory_path}")
+
+
+async def _execute_node_commands(
+    nodeClient: dg.utils.ssh.RemoteClient,
+    node_commands: list[str],
+    payload_file_paths: Union[list[pathlib.Path], None] = None,
+):
+    """Executes the given commands on a worker node as a remote batch (single
+    session) and prints their output prefixed with the hostname of the worker
     node
-        node on which the storage path shall be labeled
+
+    Parameters
+    ----------
+    nodeClient
+        SSH client of the worker node
+    node_commands
+        commands to be executed on the worker node
+    payload_file_paths
+        paths of files to be copied to the home directory on the worker node
+        before executing the commands
+    """
+
+    batch = dg.utils.ssh.RemoteBatch()
+
+    for payload_file_path in payload_file_paths if payload_file_paths is not None else []:
+        batch.add_payload_file(payload_file_path)
+
+    for node_command in node_commands:
+        batch.add_step(node_command, node_command)
+
+    result = await nodeClient.execute_batch(batch, print_output=False, check=False)
+
+    for line in result.output.splitlines():
+        click.echo(f"[{nodeClient.get_hostname()}] {line}")
+
+    if result.exit_code != 0:
+        raise DataGateCLIException(
+            f"Command '{result.get_failed_step_name()}' failed with exit code {result.exit_code}",
+            stderr=result.output,
+        )
+
+
+def _execute_oc_node_command(args: list[str], nodes: list[str]) -> dict[str, str]:
+    """Executes an oc command modifying the given nodes
+
+    An exception is not raised if the command fails for some nodes so that
+    the results of the remaining nodes are reported.
+
+    Parameters
+    ----------
+    args
+        arguments to be passed to oc
+    nodes
+        nodes modified by the oc command
+
+    Returns
+    -------
+    dict[str, str]
+        dictionary associating node names with results
     """
 
-    dg.utils.process.execute_command(pathlib.Path("ssh"), _get_ssh_mkdir_storage_path_command(node))
-    dg.utils.process.execute_command(pathlib.Path("ssh"), _get_ssh_chmod_storage_path_command(node))
-    dg.utils.process.execute_command(pathlib.Path("ssh"), _get_ssh_semanage_storage_path_command(node))
-    dg.utils.process.execute_command(pathlib.Path("ssh"), _get_ssh_restorecon_storage_path_command(node))
+    oc_command_result = dg.lib.openshift.execute_oc_command(args, capture_output=True, check=False)
 
+    return _parse_oc_node_results(oc_command_result.stdout + "\n" + oc_command_result.stderr, nodes)
 
-async def label_storage_path_from_remote_host(remoteClient: dg.utils.ssh.RemoteClient, node: str):
-    """Labels the storage path on the given node from a remote host
 
-    See https://www.ibm.com/support/producthub/icpdata/docs/content/SSQNUZ_latest/svc-db2/hostpath-selinux-aese.html
+async def _execute_oc_node_command_from_remote_host(
+    remoteClient: dg.utils.ssh.RemoteClient, args: list[str], nodes: list[str]
+) -> dict[str, str]:
+    """Executes an oc command modifying the given nodes on a remote host
+
+    An exception is not raised if the command fails for some nodes so that
+    the results of the remaining nodes are reported.
 
     Parameters
     ----------
     remoteClient
-        SSH client
-    node
-        node on which the storage path shall be labeled
+        SSH client of the remote host
+    args
+        arguments to be passed to oc
+    nodes
+        nodes modified by the oc command
+
+    Returns
+    -------
+    dict[str, str]
+        dictionary associating node names with results
     """
 
-    await remoteClient.execute("ssh " + _join_args(_get_ssh_mkdir_storage_path_command(node)))
-    await remoteClient.execute("ssh " + _join_args(_get_ssh_chmod_storage_path_command(node)))
-    await remoteClient.execute("ssh " + _join_args(_get_ssh_semanage_storage_path_command(node)))
-    await remoteClient.execute("ssh " + _join_args(_get_ssh_restorecon_storage_path_command(node)))
+    return _parse_oc_node_results(await remoteClient.execute("oc " + shlex.join(args), check=False), nodes)
 
 
-def _get_oc_adm_taint_node_command(node: str, db2_edition: str) -> list[str]:
+def _get_data_gate_node_commands(type_enforcement_file_hash: str) -> list[str]:
+    """Returns the commands to be executed on a worker node to install the
+    compiled Data Gate SELinux policy module package
+
+    Parameters
+    ----------
+    type_enforcement_file_hash
+        SHA-256 hash of the type enforcement file recorded on the worker node
+        after installing the module
+
+    Returns
+    -------
+    list[str]
+        commands to be executed on a worker node
+    """
+
+    module_name = SELINUX_POLICY_MODULE_NAME
+
     return [
-        "adm",
-        "taint",
-        "node",
-        node,
-        f"icp4data=database-{db2_edition}:NoSchedule",
+        f"sudo semodule --install {module_name}.pp",
+        f"echo {type_enforcement_file_hash} > {module_name}.sha256",
     ]
 
 
-def _get_oc_label_node_command(node: str, db2_edition: str) -> list[str]:
-    return ["label", "node", node, f"icp4data=database-{db2_edition}"]
+def _get_db2_node_commands(node_state: NodeState, use_host_path_storage: bool) -> list[str]:
+    """Returns the commands to be executed on a worker node before creating
+    a Db2 instance that are missing according to the given node state
 
+    Parameters
+    ----------
+    node_state
+        probed state of the worker node
+    use_host_path_storage
+        flag indicating whether hostpath storage shall be used
+
+    Returns
+    -------
+    list[str]
+        commands to be executed on the worker node
+    """
+
+    node_commands: list[str] = []
 
-def _get_ssh_mkdir_storage_path_command(node: str) -> list[str]:
-    return [f"core@{node}", "mkdir", "--parents", STORAGE_PATH]
+    if not node_state.is_container_manage_cgroup_enabled:
+        node_commands.append("sudo setsebool -P container_manage_cgroup true")
 
+    if use_host_path_storage:
+        node_commands += _get_storage_path_commands(node_state)
 
-def _get_ssh_chmod_storage_path_command(node: str) -> list[str]:
-    return [f"core@{node}", "chmod", "777", STORAGE_PATH]
+    return node_commands
 
 
-def _get_ssh_restorecon_storage_path_command(node: str) -> list[str]:
-    return [f"core@{node}", "sudo", "restorecon", "-Rv", STORAGE_PATH]
+async def _get_node_names_from_remote_host(remoteClient: dg.utils.ssh.RemoteClient, node_selector: str) -> list[str]:
+    return _parse_oc_node_names(
+        await remoteClient.execute(
+            "oc " + shlex.join(_get_oc_get_node_names_command(node_selector)), print_output=False
+        )
+    )
 
 
-def _get_ssh_semanage_storage_path_command(node: str) -> list[str]:
-    return [
-        f"core@{node}",
-        f'sudo semanage fcontext --add --type container_file_t "{STORAGE_PATH}(/.*)?"',
+def _get_nodes_to_be_labeled(node_objects: list[Any], nodes: list[str], db2_edition: str) -> list[str]:
+    labeled_nodes = [
+        node_object["metadata"]["name"]
+        for node_object in node_objects
+        if node_object["metadata"].get("labels", {}).get("icp4data") == f"database-{db2_edition}"
     ]
 
+    return [node for node in nodes if node not in labeled_nodes]
+
+
+def _get_nodes_to_be_tainted(node_objects: list[Any], nodes: list[str], db2_edition: str) -> list[str]:
+    tainted_nodes = [
+        node_object["metadata"]["name"]
+        for node_object in node_objects
+        if {"effect": "NoSchedule", "key": "icp4data", "value": f"database-{db2_edition}"}
+        in [
+            {key: taint.get(key) for key in ["effect", "key", "value"]}
+            for taint in node_object.get("spec", {}).get("taints", [])
+        ]
+    ]
+
+    return [node for node in nodes if node not in tainted_nodes]
+
+
+def _get_oc_adm_taint_nodes_command(nodes: list[str], db2_edition: str) -> list[str]:
+    return (
+        [
+            "adm",
+            "taint",
+            "nodes",
+            "--overwrite",
+        ]
+        + nodes
+        + [f"icp4data=database-{db2_edition}:NoSchedule"]
+    )
+
+
+def _get_oc_get_node_names_command(node_selector: str) -> list[str]:
+    return ["get", "nodes", "--output", "name", "--selector", node_selector]
+
+
+def _get_oc_label_nodes_command(nodes: list[str], db2_edition: str) -> list[str]:
+    return ["label", "nodes", "--overwrite"] + nodes + [f"icp4data=database-{db2_edition}"]
+
+
+def _get_selinux_policy_module_compilation_commands(
+    type_enforcement_file_path: str, package_file_path: str
+) -> list[list[str]]:
+    module_file_path = package_file_path.removesuffix(".pp") + ".mod"
 
-def _get_ssh_setsebool_container_manage_cgroup_command(node: str) -> list[str]:
     return [
-        f"core@{node}",
-        "sudo",
-        "setsebool",
-        "-P",
-        "container_manage_cgroup",
-        "true",
+        ["checkmodule", "-m", "--mls", "--output", module_file_path, type_enforcement_file_path],
+        ["semodule_package", "--module", module_file_path, "--outfile", package_file_path],
     ]
 
 
-def _join_args(args: list[str]) -> str:
-    args_copy = args.copy()
+def _get_selinux_policy_module_package_cache_file_path(type_enforcement_file_hash: str, toolchain: str) -> pathlib.Path:
+    return (
+        dg.config.data_gate_configuration_manager.get_dg_cache_directory_path()
+        / "selinux"
+        / type_enforcement_file_hash
+        / hashlib.sha256(toolchain.encode()).hexdigest()[:16]
+        / f"{SELINUX_POLICY_MODULE_NAME}.pp"
+    )
+
+
+def _get_selinux_policy_module_type_enforcement_file_path() -> pathlib.Path:
+    return (
+        dg.config.data_gate_configuration_manager.get_deps_directory_path()
+        / SELINUX_POLICY_MODULE_NAME
+        / f"{SELINUX_POLICY_MODULE_NAME}.te"
+    )
+
+
+def _get_storage_path_commands(node_state: Union[NodeState, None]) -> list[str]:
+    """Returns the commands to be executed on a worker node to label the
+    storage path that are missing according to the given node state
+
+    Parameters
+    ----------
+    node_state
+        probed state of the worker node (all commands are returned if None)
+
+    Returns
+    -------
+    list[str]
+        commands to be executed on the worker node
+    """
+
+    node_commands: list[str] = []
+
+    if (node_state is None) or not node_state.is_storage_path_writable:
+        node_commands += [f"mkdir --parents {STORAGE_PATH}", f"chmod 777 {STORAGE_PATH}"]
+
+    if (node_state is None) or not node_state.is_storage_path_file_context_defined:
+        node_commands.append(f"sudo semanage fcontext --add --type container_file_t '{STORAGE_PATH}(/.*)?'")
+
+    if (
+        (node_state is None)
+        or not node_state.is_storage_path_file_context_defined
+        or not node_state.is_storage_path_labeled
+    ):
+        node_commands.append(f"sudo restorecon -Rv {STORAGE_PATH}")
+
+    return node_commands
+
+
+async def _initialize_node_for_data_gate(
+    nodeClient: dg.utils.ssh.RemoteClient,
+    type_enforcement_file_hash: str,
+    get_package_file_path: Callable[[dg.utils.ssh.RemoteClient, str], Awaitable[pathlib.Path]],
+) -> int:
+    """Installs the compiled Data Gate SELinux policy module package on a
+    worker node unless the installed version is up to date
+
+    Returns
+    -------
+    int
+        number of executed steps
+    """
+
+    node_state = await probe_node_state(nodeClient)
+
+    if node_state.selinux_policy_module_hash == type_enforcement_file_hash:
+        return 0
+
+    node_commands = _get_data_gate_node_commands(type_enforcement_file_hash)
+
+    await _execute_node_commands(
+        nodeClient, node_commands, [await get_package_file_path(nodeClient, node_state.selinux_policy_toolchain)]
+    )
+
+    return len(node_commands)
+
+
+async def _initialize_node_for_db2(nodeClient: dg.utils.ssh.RemoteClient, use_host_path_storage: bool) -> int:
+    """Executes missing steps on a worker node before creating a Db2
+    instance
+
+    Returns
+    -------
+    int
+        number of executed steps
+    """
+
+    node_commands = _get_db2_node_commands(await probe_node_state(nodeClient), use_host_path_storage)
+
+    if len(node_commands) != 0:
+        await _execute_node_commands(nodeClient, node_commands)
+
+    return len(node_commands)
+
+
+async def _initialize_nodes(
+    nodes: list[str],
+    create_node_client: Callable[[str], dg.utils.ssh.RemoteClient],
+    initialize_node: Callable[[dg.utils.ssh.RemoteClient], Awaitable[int]],
+    max_parallelism: int,
+) -> dict[str, NodeInitializationResult]:
+    """Initializes the given worker nodes concurrently
+
+    A failure on one node does not abort the initialization of other nodes.
+
+    Parameters
+    ----------
+    nodes
+        hostnames of the worker nodes to be initialized
+    create_node_client
+        callable returning an SSH client for a worker node
+    initialize_node
+        coroutine function initializing a worker node and returning the number
+        of executed steps
+    max_parallelism
+        maximum number of nodes initialized at the same time
+
+    Returns
+    -------
+    dict[str, NodeInitializationResult]
+        dictionary associating node names with initialization results
+    """
+
+    if max_parallelism < 1:
+        raise DataGateCLIException("Maximum parallelism must be greater than 0")
+
+    semaphore = asyncio.Semaphore(max_parallelism)
+
+    async def initialize(node: str) -> NodeInitializationResult:
+        async with semaphore:
+            start_time = time.monotonic()
+            error: Union[str, None] = None
+            step_count = 0
+
+            try:
+                async with create_node_client(node) as nodeClient:
+                    step_count = await initialize_node(nodeClient)
+            except Exception as exception:
+                error = str(exception)
+
+                logging.error(f"Initializing {node} failed: {error}")
+
+            return NodeInitializationResult(step_count, time.monotonic() - start_time, error)
+
+    return dict(zip(nodes, await asyncio.gather(*[initialize(node) for node in nodes])))
+
+
+def _merge_nodes(nodes: list[str], additional_nodes: list[str]) -> list[str]:
+    return nodes + [node for node in additional_nodes if node not in nodes]
+
+
+def _parse_oc_get_nodes_command_result(oc_get_nodes_command_result: str) -> list[Any]:
+    # "oc get nodes" returns a single object instead of a list if a single
+    # node name is passed
+    result = json.loads(oc_get_nodes_command_result)
+
+    return result["items"] if "items" in result else [result]
+
+
+def _parse_oc_node_names(oc_get_nodes_command_result: str) -> list[str]:
+    return regex.findall("^node/(\\S+)$", oc_get_nodes_command_result, regex.MULTILINE)
+
+
+def _parse_oc_node_results(oc_command_result: str, nodes: Union[list[str], None] = None) -> dict[str, str]:
+    """Parses the output (stdout and stderr) of oc commands modifying nodes
+
+    Example output: "node/worker0.example.com labeled" or "Error from server
+    (NotFound): nodes "worker1.example.com" not found"
+
+    Parameters
+    ----------
+    oc_command_result
+        output of an oc command modifying nodes
+    nodes
+        nodes passed to the oc command (nodes without result are reported as
+        failed)
+
+    Returns
+    -------
+    dict[str, str]
+        dictionary associating node names with results
+    """
+
+    node_results: dict[str, str] = dict(regex.findall("^node/(\\S+) (.+?)\\s*$", oc_command_result, regex.MULTILINE))
+
+    for node, error in regex.findall(
+        '^Error from server \\(\\w+\\): nodes? "([^"]+)" (.+?)\\s*$', oc_command_result, regex.MULTILINE
+    ):
+        node_results.setdefault(node, f"failed ({error})")
+
+    for node in nodes if nodes is not None else []:
+        node_results.setdefault(node, "failed")
+
+    return node_results
+
+
+def _raise_if_initialization_failed(
+    node_results: dict[str, NodeInitializationResult],
+    taint_results: Union[dict[str, str], None] = None,
+    label_results: Union[dict[str, str], None] = None,
+):
+    failed_nodes = [
+        node
+        for node, node_result in node_results.items()
+        if (node_result.error is not None)
+        or any(
+            results.get(node, "").startswith("failed")
+            for results in [taint_results, label_results]
+            if results is not None
+        )
+    ]
 
-    for i in range(len(args_copy)):
-        if " " in args[i]:
-            if "'" in args[i]:
-                args_copy[i] = args_copy[i].replace("'", "\\'")
+    if len(failed_nodes) != 0:
+        raise DataGateCLIException(f"Initializing worker nodes failed: {', '.join(failed_nodes)}")
 
-            args_copy[i] = f"'{args[i]}'"
 
-    return " ".join(args_copy)
+def _raise_if_no_nodes(nodes: list[str]):
+    if len(nodes) == 0:
+        raise DataGateCLIException("No worker nodes to be initialized")
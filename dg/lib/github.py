@@ -0,0 +1,363 @@
+#  Copyright 2020 IBM Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import datetime
+import hashlib
+import json
+import logging
+import os
+import pathlib
+import tempfile
+import threading
+import time
+
+from typing import Any, Final, Iterator, Union
+
+import requests
+
+import dg.config
+import dg.utils.http
+
+from dg.lib.error import DataGateCLIException
+
+logger = logging.getLogger(__name__)
+
+GITHUB_API_KEY_NAME: Final[str] = "github_api_key"
+GITHUB_API_URL: Final[str] = "https://api.github.com"
+
+_github_api_client: Union["GitHubAPIClient", None] = None
+_github_api_client_lock = threading.Lock()
+
+
+class GitHubAPIResponse:
+    """Cached response of the GitHub REST API"""
+
+    def __init__(self, body: Any, etag: Union[str, None], next_url: Union[str, None]):
+        self.body = body
+        self.etag = etag
+        self.next_url = next_url
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "body": self.body,
+            "etag": self.etag,
+            "next_url": self.next_url,
+        }
+
+
+class GitHubAPIClient:
+    """Client of the GitHub REST API caching responses and honouring rate
+    limits
+
+    Responses are cached along with their ETag, which is sent in an
+    If-None-Match header with subsequent requests. A "304 Not Modified"
+    response does not count against the rate limit. The rate limit state
+    (X-RateLimit-Remaining/X-RateLimit-Reset headers) is stored in the cache
+    directory so that separate Data Gate CLI processes do not send requests
+    which would be rejected. While the rate limit is exceeded, cached
+    responses are returned without revalidation.
+
+    Unauthenticated clients may send 60 requests per hour, authenticated
+    clients may send 5000 requests per hour.
+
+    GitHub REST API: https://docs.github.com/en/rest/overview/resources-in-the-rest-api
+    """
+
+    def __init__(
+        self,
+        cache_directory_path: Union[pathlib.Path, None],
+        token: Union[str, None] = None,
+        api_url: str = GITHUB_API_URL,
+    ):
+        """Constructor
+
+        Parameters
+        ----------
+        cache_directory_path
+            path of the directory responses are cached in or None if responses
+            shall not be cached
+        token
+            GitHub personal access token used for authentication
+        api_url
+            base URL of the GitHub REST API
+        """
+
+        self.api_url = api_url
+        self.cache_directory_path = cache_directory_path
+
+        self._lock = threading.RLock()
+        self._rate_limit: Union[dict[str, int], None] = None
+        self._token = token
+
+    def get(self, url: str) -> Any:
+        """Sends a GET request to the given URL of the GitHub REST API and
+        returns the decoded JSON response
+
+        Parameters
+        ----------
+        url
+            URL of a GitHub REST API endpoint
+
+        Returns
+        -------
+        Any
+            decoded JSON response
+        """
+
+        return self._get(url).body
+
+    def get_latest_release(self, owner: str, repo: str) -> Union[Any, None]:
+        """Returns the latest published full release of a repository
+
+        Draft releases and prereleases are not returned.
+
+        Parameters
+        ----------
+        owner
+            GitHub repository owner
+        repo
+            GitHub repository name
+
+        Returns
+        -------
+        Union[Any, None]
+            release or None if the repository does not contain a published
+            full release
+        """
+
+        try:
+            return self.get(f"{self.api_url}/repos/{owner}/{repo}/releases/latest")
+        except requests.exceptions.HTTPError as exception:
+            if exception.response.status_code == 404:
+                return None
+
+            raise
+
+    def get_pages(self, url: str) -> Iterator[Any]:
+        """Returns the items of a paginated GitHub REST API endpoint
+
+        Pages are requested lazily (i.e., if a caller stops iterating after
+        an item on the first page was found, only the first page is
+        requested).
+
+        Parameters
+        ----------
+        url
+            URL of a paginated GitHub REST API endpoint
+
+        Returns
+        -------
+        Iterator[Any]
+            items of all pages
+        """
+
+        next_url: Union[str, None] = url
+
+        while next_url is not None:
+            response = self._get(next_url)
+
+            yield from response.body
+
+            next_url = response.next_url
+
+    def get_release_by_tag(self, owner: str, repo: str, tag: str) -> Any:
+        """Returns the release of a repository with the given tag
+
+        Parameters
+        ----------
+        owner
+            GitHub repository owner
+        repo
+            GitHub repository name
+        tag
+            tag of the release
+
+        Returns
+        -------
+        Any
+            release
+        """
+
+        return self.get(f"{self.api_url}/repos/{owner}/{repo}/releases/tags/{tag}")
+
+    def get_releases(self, owner: str, repo: str) -> Iterator[Any]:
+        """Returns the releases of a repository, most recent first
+
+        Parameters
+        ----------
+        owner
+            GitHub repository owner
+        repo
+            GitHub repository name
+
+        Returns
+        -------
+        Iterator[Any]
+            releases (see get_pages())
+        """
+
+        return self.get_pages(f"{self.api_url}/repos/{owner}/{repo}/releases")
+
+    def _get(self, url: str) -> GitHubAPIResponse:
+        cached_response = self._read_cached_response(url)
+        rate_limit_reset_time = self._get_rate_limit_reset_time()
+
+        if rate_limit_reset_time is not None:
+            return self._get_cached_response_if_rate_limit_exceeded(url, cached_response, rate_limit_reset_time)
+
+        headers = {"Accept": "application/vnd.github.v3+json"}
+
+        if cached_response is not None and cached_response.etag is not None:
+            headers["If-None-Match"] = cached_response.etag
+
+        if self._token is not None:
+            headers["Authorization"] = f"token {self._token}"
+
+        response = dg.utils.http.get_http_session().get(url, headers=headers)
+
+        self._store_rate_limit(response)
+
+        if (response.status_code == 304) and (cached_response is not None):
+            logger.debug(f"Using cached GitHub API response for {url}")
+
+            return cached_response
+
+        if (response.status_code in [403, 429]) and (response.headers.get("X-RateLimit-Remaining") == "0"):
+            return self._get_cached_response_if_rate_limit_exceeded(
+                url, cached_response, int(response.headers.get("X-RateLimit-Reset", time.time()))
+            )
+
+        response.raise_for_status()
+
+        result = GitHubAPIResponse(
+            body=json.loads(response.content),
+            etag=response.headers.get("ETag"),
+            next_url=response.links.get("next", {}).get("url"),
+        )
+
+        self._write_cached_response(url, result)
+
+        return result
+
+    def _get_cached_response_if_rate_limit_exceeded(
+        self, url: str, cached_response: Union[GitHubAPIResponse, None], rate_limit_reset_time: float
+    ) -> GitHubAPIResponse:
+        reset_time = datetime.datetime.fromtimestamp(rate_limit_reset_time).strftime("%H:%M:%S")
+
+        if cached_response is None:
+            raise DataGateCLIException(
+                f"GitHub API rate limit exceeded (reset at {reset_time}) - store a GitHub personal access token "
+                f"using 'dg adm store-credentials --github-api-key' to increase the rate limit"
+            )
+
+        logger.warning(f"GitHub API rate limit exceeded (reset at {reset_time}) - using cached response for {url}")
+
+        return cached_response
+
+    def _get_cached_response_file_path(self, url: str) -> Union[pathlib.Path, None]:
+        return (
+            self.cache_directory_path / f"{hashlib.sha256(url.encode()).hexdigest()}.json"
+            if self.cache_directory_path is not None
+            else None
+        )
+
+    def _get_rate_limit_file_path(self) -> Union[pathlib.Path, None]:
+        return (
+            self.cache_directory_path / f"rate-limit-{'authenticated' if self._token is not None else 'anonymous'}.json"
+            if self.cache_directory_path is not None
+            else None
+        )
+
+    def _get_rate_limit_reset_time(self) -> Union[float, None]:
+        """Returns the time at which the rate limit is reset if it is
+        currently exceeded"""
+
+        rate_limit_file_path = self._get_rate_limit_file_path()
+        rate_limit = (
+            self._read_json_file(rate_limit_file_path) if rate_limit_file_path is not None else self._rate_limit
+        )
+
+        if (rate_limit is None) or (rate_limit.get("remaining") != 0) or (rate_limit.get("reset", 0) <= time.time()):
+            return None
+
+        return rate_limit["reset"]
+
+    def _read_cached_response(self, url: str) -> Union[GitHubAPIResponse, None]:
+        cached_response = self._read_json_file(self._get_cached_response_file_path(url))
+
+        try:
+            return GitHubAPIResponse(**cached_response) if cached_response is not None else None
+        except TypeError:
+            return None
+
+    def _read_json_file(self, path: Union[pathlib.Path, None]) -> Union[Any, None]:
+        if (path is None) or not path.exists():
+            return None
+
+        try:
+            return json.loads(path.read_text())
+        except ValueError:
+            logger.warning(f"Ignoring invalid GitHub API cache file: {path}")
+
+            return None
+
+    def _store_rate_limit(self, response: requests.Response):
+        if ("X-RateLimit-Remaining" not in response.headers) or ("X-RateLimit-Reset" not in response.headers):
+            return
+
+        remaining = int(response.headers["X-RateLimit-Remaining"])
+
+        logger.debug(f"Remaining GitHub API requests: {remaining}")
+
+        self._rate_limit = {"remaining": remaining, "reset": int(response.headers["X-RateLimit-Reset"])}
+        self._write_json_file(self._get_rate_limit_file_path(), self._rate_limit)
+
+    def _write_cached_response(self, url: str, response: GitHubAPIResponse):
+        self._write_json_file(self._get_cached_response_file_path(url), response.to_dict())
+
+    def _write_json_file(self, path: Union[pathlib.Path, None], contents: Any):
+        if path is None:
+            return
+
+        with self._lock:
+            path.parent.mkdir(exist_ok=True, parents=True)
+
+            # replace the file atomically as it may be read by other processes
+            with tempfile.NamedTemporaryFile("w", delete=False, dir=path.parent, prefix=".") as temporary_file:
+                json.dump(contents, temporary_file)
+
+            os.replace(temporary_file.name, path)
+
+
+def get_github_api_client() -> GitHubAPIClient:
+    """Returns the GitHub API client caching responses in the Data Gate CLI
+    cache directory and authenticating with the GitHub personal access token
+    stored in the credentials file (if any)
+
+    Returns
+    -------
+    GitHubAPIClient
+        GitHub API client
+    """
+
+    global _github_api_client
+
+    with _github_api_client_lock:
+        if _github_api_client is None:
+            _github_api_client = GitHubAPIClient(
+                dg.config.data_gate_configuration_manager.get_dg_github_cache_directory_path(),
+                dg.config.data_gate_configuration_manager.get_value_from_credentials_file(GITHUB_API_KEY_NAME),
+            )
+
+        return _github_api_client
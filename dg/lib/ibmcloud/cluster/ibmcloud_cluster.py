@@ -28,7 +28,13 @@ class IBMCloudCluster(AbstractCluster):
         # TODO implement
         return ""
 
+    def get_oc_login_args(self) -> list[str]:
+        return dg.lib.openshift.get_oc_login_args_with_password(self.server, "apikey", self._get_api_key())
+
     def login(self):
+        dg.lib.openshift.log_in_to_openshift_cluster_with_password(self.server, "apikey", self._get_api_key())
+
+    def _get_api_key(self) -> str:
         api_key = dg.config.data_gate_configuration_manager.get_value_from_credentials_file(
             dg.lib.ibmcloud.INTERNAL_IBM_CLOUD_API_KEY_NAME
         )
@@ -36,4 +42,4 @@ class IBMCloudCluster(AbstractCluster):
         if api_key is None:
             raise DataGateCLIException("IBM Cloud API key not found in stored credentials")
 
-        dg.lib.openshift.log_in_to_openshift_cluster_with_password(self.server, "apikey", api_key)
+        return api_key
@@ -19,9 +19,9 @@ from time import sleep
 from typing import Any
 
 import click
-import requests
 
 import dg.config
+import dg.utils.http
 import dg.utils.logging
 
 from dg.lib.cloud_pak_for_data.cpd_manager import (
@@ -110,7 +110,7 @@ def _get_entitlement_key(api_key: str) -> str:
             "Accept": "application/json",
         }
 
-        response = requests.get(url, headers=headers)
+        response = dg.utils.http.get_http_session().get(url, headers=headers)
 
         if response.ok:
             resources = response.json()["resources"]
@@ -160,7 +160,7 @@ def execute_install(cluster_id: str, api_key: str) -> Any:
         "version_locator_id": version_locator,
     }
 
-    response = requests.post(url, headers=headers, json=data)
+    response = dg.utils.http.get_http_session().post(url, headers=headers, json=data)
 
     if response.ok:
         logging.info("Installation request submitted successfully.")
@@ -186,7 +186,7 @@ def get_schematics_workspace_details(install_details: Any) -> Any:
     url = "https://schematics.cloud.ibm.com/v1/workspaces/" + workspace_id
     headers = {"Authorization": auth_token}
 
-    response = requests.get(url, headers=headers)
+    response = dg.utils.http.get_http_session().get(url, headers=headers)
 
     if response.ok:
         result = response.json()
@@ -266,7 +266,7 @@ def get_installation_log(install_details: Any) -> str:
     url = log_path
     headers = {"Authorization": auth_token}
 
-    response = requests.get(url, headers=headers)
+    response = dg.utils.http.get_http_session().get(url, headers=headers)
 
     if response.ok:
         result = response.text
@@ -292,7 +292,7 @@ def get_workspace_output_values(install_details: Any) -> Any:
     url = "https://schematics.cloud.ibm.com/v1/workspaces/" + workspace_id + "/output_values"
     headers = {"Authorization": auth_token}
 
-    response = requests.get(url, headers=headers)
+    response = dg.utils.http.get_http_session().get(url, headers=headers)
 
     if response.ok:
         result = response.json()
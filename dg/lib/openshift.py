@@ -12,20 +12,30 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import atexit
 import json
+import logging
+import os
+import pathlib
+import re as regex
 import urllib.parse
 
-from typing import Final, List
+from typing import Any, Final, List, Union
 
 import requests
 import semver
+import yaml
 
 import dg.config
-import dg.utils.network
+import dg.utils.http
 import dg.utils.process
 
 from dg.lib.error import DataGateCLIException
+from dg.lib.openshift_proxy import OpenShiftProxy
 
+ALL_WORKERS_NODE_SELECTOR: Final[str] = "node-role.kubernetes.io/worker"
+CLUSTER_VERSION_PATH: Final[str] = "/apis/config.openshift.io/v1/clusterversions/version"
+OC_VERSION_ARGS: Final[list[str]] = ["version", "--output", "json"]
 OPENSHIFT_REST_API_VERSION: Final[str] = "v1"
 
 
@@ -106,13 +116,10 @@ def get_cluster_access_token(oauth_server_url: str, username: str, password: str
         OAuth access token obtained from the given OpenShift server
     """
 
-    dg.utils.network.disable_insecure_request_warning()
-
-    response = requests.get(
+    response = dg.utils.http.get_http_session(verify=False).get(
         oauth_server_url,
         allow_redirects=False,
         auth=(username, password),
-        verify=False,
     )
 
     if "Location" not in response.headers:
@@ -129,12 +136,12 @@ def get_cluster_access_token(oauth_server_url: str, username: str, password: str
 
 
 def get_current_token() -> str:
-    """Returns the current OAuth access token stored in ~/.kube/config
+    """Returns the current OAuth access token stored in the kubeconfig file
 
     Returns
     -------
     str
-        current OAuth access token stored in ~/.kube/config
+        current OAuth access token stored in the kubeconfig file
     """
 
     oc_whoami_args = [
@@ -147,6 +154,75 @@ def get_current_token() -> str:
     return oc_whoami_command_result.stdout.rstrip()
 
 
+def get_kubeconfig_file_path(server: str) -> pathlib.Path:
+    """Returns the path of the dedicated kubeconfig file of the OpenShift
+    cluster with the given server URL
+
+    Parameters
+    ----------
+    server
+        OpenShift server URL
+
+    Returns
+    -------
+    pathlib.Path
+        path of the dedicated kubeconfig file of the OpenShift cluster
+    """
+
+    file_name = regex.sub("[^\\w.-]", "_", regex.sub("^\\w+://", "", server))
+
+    return dg.config.data_gate_configuration_manager.get_dg_kubeconfig_directory_path() / file_name
+
+
+def get_kubernetes_api_resource(path: str) -> Any:
+    """Returns the JSON representation of the Kubernetes API resource with
+    the given path
+
+    If the oc proxy mode is enabled ("dg adm config set --key oc_proxy
+    --value true"), the request is sent through a shared "oc proxy" process,
+    which is started on first use and stopped when the Data Gate CLI exits.
+    Otherwise, "oc get --raw" is executed.
+
+    Parameters
+    ----------
+    path
+        Kubernetes API path (e.g., /api/v1/nodes)
+
+    Returns
+    -------
+    Any
+        JSON representation of the Kubernetes API resource
+    """
+
+    if dg.config.data_gate_configuration_manager.is_oc_proxy_enabled():
+        return get_openshift_proxy().get(path)
+
+    return json.loads(execute_oc_command(["get", "--raw", path], capture_output=True).stdout)
+
+
+def get_node_names(node_selector: Union[str, None] = None) -> list[str]:
+    """Returns the names of the nodes matching the given label selector
+
+    Parameters
+    ----------
+    node_selector
+        label selector (e.g., node-role.kubernetes.io/worker) or None to return
+        the names of all nodes
+
+    Returns
+    -------
+    list[str]
+        names of the nodes matching the given label selector
+    """
+
+    path = "/api/v1/nodes"
+
+    if node_selector is not None:
+        path += "?labelSelector=" + urllib.parse.quote(node_selector)
+
+    return [node["metadata"]["name"] for node in get_kubernetes_api_resource(path)["items"]]
+
+
 def get_oc_login_args_with_password(server: str, username: str, password: str) -> List[str]:
     return [
         "login",
@@ -188,40 +264,105 @@ def get_openshift_image_registry_default_route() -> str:
         Image Registry default route
     """
 
-    oc_get_route_args = [
-        "get",
-        "route",
-        "--namespace",
-        "openshift-image-registry",
-        "--output",
-        "jsonpath='{.items[?(@.metadata.name==\"default-route\")].spec.host}'",
-    ]
+    routes = get_kubernetes_api_resource("/apis/route.openshift.io/v1/namespaces/openshift-image-registry/routes")
+    result = ""
 
-    oc_get_route_command_result = (
-        execute_oc_command(oc_get_route_args, capture_output=True).stdout.removeprefix("'").removesuffix("'")
-    )
+    for route in routes["items"]:
+        if route["metadata"]["name"] == "default-route":
+            result = route["spec"]["host"]
+
+            break
+
+    return result
 
-    return oc_get_route_command_result
+
+def get_openshift_proxy() -> OpenShiftProxy:
+    """Returns the shared "oc proxy" process for the current kubeconfig file
+
+    The process is started on first use and stopped when the Data Gate CLI
+    exits.
+
+    Returns
+    -------
+    OpenShiftProxy
+        shared "oc proxy" process for the current kubeconfig file
+    """
+
+    kubeconfig = os.environ.get("KUBECONFIG", "")
+
+    if (kubeconfig not in _openshift_proxies) or not _openshift_proxies[kubeconfig].is_running():
+        openshift_proxy = OpenShiftProxy(dg.config.data_gate_configuration_manager.get_oc_cli_path())
+        openshift_proxy.start()
+
+        if len(_openshift_proxies) == 0:
+            atexit.register(_stop_openshift_proxies)
+
+        _openshift_proxies[kubeconfig] = openshift_proxy
+
+    return _openshift_proxies[kubeconfig]
 
 
 def get_openshift_version() -> semver.VersionInfo:
-    oc_version_args = ["version", "--output", "json"]
-    oc_version_command_result = json.loads(execute_oc_command(oc_version_args, capture_output=True).stdout)
+    """Returns the version of the current OpenShift cluster
 
-    return semver.VersionInfo.parse(oc_version_command_result["openshiftVersion"])
+    The version is read from the ClusterVersion resource, which exists as of
+    OpenShift 4. For older clusters, the version is read from the output of
+    "oc version".
 
+    Returns
+    -------
+    semver.VersionInfo
+        version of the current OpenShift cluster
+    """
 
-def get_persistent_volume_name(namespace: str, persistent_volume_claim_name: str) -> str:
-    oc_get_pvc_args = [
-        "get",
-        "pvc",
-        "--namespace",
-        namespace,
-        "--output",
-        "json",
-    ]
+    try:
+        cluster_version = get_kubernetes_api_resource(CLUSTER_VERSION_PATH)
+    except DataGateCLIException as exception:
+        logging.debug(f"Failed to query ClusterVersion resource, falling back to 'oc version': {exception}")
+
+        return get_openshift_version_from_oc_version_output(
+            execute_oc_command(OC_VERSION_ARGS, capture_output=True).stdout
+        )
 
-    oc_get_pvc_command_result = json.loads(execute_oc_command(oc_get_pvc_args, capture_output=True).stdout)
+    return get_openshift_version_from_cluster_version(cluster_version)
+
+
+def get_openshift_version_from_cluster_version(cluster_version: Any) -> semver.VersionInfo:
+    """Returns the OpenShift version given the ClusterVersion resource
+
+    Parameters
+    ----------
+    cluster_version
+        ClusterVersion resource (see CLUSTER_VERSION_PATH)
+
+    Returns
+    -------
+    semver.VersionInfo
+        version of the OpenShift cluster
+    """
+
+    return semver.VersionInfo.parse(cluster_version["status"]["desired"]["version"])
+
+
+def get_openshift_version_from_oc_version_output(oc_version_output: str) -> semver.VersionInfo:
+    """Returns the OpenShift version given the output of "oc version"
+
+    Parameters
+    ----------
+    oc_version_output
+        JSON output of oc executed with OC_VERSION_ARGS
+
+    Returns
+    -------
+    semver.VersionInfo
+        version of the OpenShift cluster
+    """
+
+    return semver.VersionInfo.parse(json.loads(oc_version_output)["openshiftVersion"])
+
+
+def get_persistent_volume_name(namespace: str, persistent_volume_claim_name: str) -> str:
+    oc_get_pvc_command_result = get_kubernetes_api_resource(f"/api/v1/namespaces/{namespace}/persistentvolumeclaims")
 
     if len(oc_get_pvc_command_result["items"]) == 0:
         raise DataGateCLIException(
@@ -235,16 +376,14 @@ def get_persistent_volume_name(namespace: str, persistent_volume_claim_name: str
 
 
 def get_persistent_volume_id(namespace: str, persistent_volume_name: str):
-    oc_get_pv_args = [
-        "get",
-        "pv",
-        "--output",
-        f"jsonpath='{{.items[?(@.metadata.name==\"{persistent_volume_name}\")].metadata.labels.volumeId}}'",
-    ]
+    persistent_volumes = get_kubernetes_api_resource("/api/v1/persistentvolumes")
+    oc_get_pv_command_result = ""
 
-    oc_get_pv_command_result = (
-        execute_oc_command(oc_get_pv_args, capture_output=True).stdout.removeprefix("'").removesuffix("'")
-    )
+    for persistent_volume in persistent_volumes["items"]:
+        if persistent_volume["metadata"]["name"] == persistent_volume_name:
+            oc_get_pv_command_result = persistent_volume["metadata"].get("labels", {}).get("volumeId", "")
+
+            break
 
     if oc_get_pv_command_result == "":
         raise DataGateCLIException(f"Persistent volume with name '{persistent_volume_name}' could not be found")
@@ -252,8 +391,141 @@ def get_persistent_volume_id(namespace: str, persistent_volume_name: str):
     return oc_get_pv_command_result
 
 
+def get_token_from_kubeconfig_file(kubeconfig_file_path: pathlib.Path) -> Union[str, None]:
+    """Returns the OAuth access token of the current context stored in the
+    given kubeconfig file
+
+    Parameters
+    ----------
+    kubeconfig_file_path
+        path of the kubeconfig file
+
+    Returns
+    -------
+    Union[str, None]
+        OAuth access token of the current context or None if the kubeconfig
+        file does not exist or does not contain a token
+    """
+
+    if not kubeconfig_file_path.exists():
+        return None
+
+    with open(kubeconfig_file_path) as kubeconfig_file:
+        kubeconfig = yaml.safe_load(kubeconfig_file)
+
+    if not isinstance(kubeconfig, dict):
+        return None
+
+    user_name: Union[str, None] = None
+
+    for context in kubeconfig.get("contexts") or []:
+        if context.get("name") == kubeconfig.get("current-context"):
+            user_name = context.get("context", {}).get("user")
+
+            break
+
+    for user in kubeconfig.get("users") or []:
+        if (user.get("name") == user_name) and ("token" in (user.get("user") or {})):
+            return user["user"]["token"]
+
+    return None
+
+
+def get_token_user_name(server: str, token: str) -> Union[str, None]:
+    """Returns the name of the user to whom the given OAuth access token was
+    issued
+
+    Parameters
+    ----------
+    server
+        OpenShift server URL
+    token
+        OAuth access token
+
+    Returns
+    -------
+    Union[str, None]
+        name of the user or None if the OAuth access token is not accepted by
+        the OpenShift server
+    """
+
+    try:
+        response = dg.utils.http.get_http_session(verify=False).get(
+            f"{_get_server_url(server)}/apis/user.openshift.io/v1/users/~",
+            headers={"Authorization": f"Bearer {token}"},
+            timeout=10,
+        )
+
+        if not response.ok:
+            return None
+
+        return response.json()["metadata"]["name"]
+    except (requests.exceptions.RequestException, KeyError, TypeError, ValueError):
+        return None
+
+
+def is_token_valid(server: str, token: str) -> bool:
+    """Returns whether the given OAuth access token is accepted by the given
+    OpenShift server
+
+    The check is performed with a single authenticated request for the
+    current user.
+
+    Parameters
+    ----------
+    server
+        OpenShift server URL
+    token
+        OAuth access token to be checked
+
+    Returns
+    -------
+    bool
+        true, if the OAuth access token is accepted by the OpenShift server
+    """
+
+    return get_token_user_name(server, token) is not None
+
+
+def log_kubeconfig_file_hint(server: str):
+    """Logs how to use the dedicated kubeconfig file of the OpenShift
+    cluster with the given server URL in the current shell
+
+    Parameters
+    ----------
+    server
+        OpenShift server URL
+    """
+
+    kubeconfig_file_path = get_kubeconfig_file_path(server)
+
+    logging.info(
+        f"Logged in using {kubeconfig_file_path} (execute 'export KUBECONFIG={kubeconfig_file_path}' to use this "
+        "login in the current shell)"
+    )
+
+
 def log_in_to_openshift_cluster_with_password(server: str, username: str, password: str):
-    """Logs in to a given Openshift cluster with the given credentials"""
+    """Logs in to a given Openshift cluster with the given credentials
+
+    The dedicated kubeconfig file of the cluster is used and an OAuth access
+    token stored in it is reused if it is still valid and was issued to the
+    given user.
+    """
+
+    kubeconfig_file_path = use_kubeconfig_file(server)
+    stored_token = get_token_from_kubeconfig_file(kubeconfig_file_path)
+
+    if stored_token is not None:
+        token_user_name = get_token_user_name(server, stored_token)
+
+        if token_user_name == username:
+            logging.info(f"Reusing valid OAuth access token stored in {kubeconfig_file_path}")
+
+            return
+
+        if token_user_name is not None:
+            logging.info(f"OAuth access token stored in {kubeconfig_file_path} was issued to {token_user_name}")
 
     oc_login_args = get_oc_login_args_with_password(server, username, password)
 
@@ -262,8 +534,57 @@ def log_in_to_openshift_cluster_with_password(server: str, username: str, passwo
 
 def log_in_to_openshift_cluster_with_token(server: str, token: str):
     """Logs in to a given Openshift cluster with the given OAuth access
-    token"""
+    token
+
+    The dedicated kubeconfig file of the cluster is used and oc login is
+    skipped if it already stores the given token and the token is still
+    valid.
+    """
+
+    kubeconfig_file_path = use_kubeconfig_file(server)
+
+    if (get_token_from_kubeconfig_file(kubeconfig_file_path) == token) and is_token_valid(server, token):
+        logging.info(f"Reusing valid OAuth access token stored in {kubeconfig_file_path}")
+
+        return
 
     oc_login_args = get_oc_login_args_with_token(server, token)
 
     execute_oc_command(oc_login_args)
+
+
+def use_kubeconfig_file(server: str) -> pathlib.Path:
+    """Points child processes (e.g., oc and cpd-cli) to the dedicated
+    kubeconfig file of the OpenShift cluster with the given server URL
+
+    Parameters
+    ----------
+    server
+        OpenShift server URL
+
+    Returns
+    -------
+    pathlib.Path
+        path of the dedicated kubeconfig file of the OpenShift cluster
+    """
+
+    kubeconfig_file_path = get_kubeconfig_file_path(server)
+    kubeconfig_file_path.parent.mkdir(mode=0o700, exist_ok=True, parents=True)
+
+    os.environ["KUBECONFIG"] = str(kubeconfig_file_path)
+
+    return kubeconfig_file_path
+
+
+_openshift_proxies: dict[str, OpenShiftProxy] = {}
+
+
+def _get_server_url(server: str) -> str:
+    return server if regex.match("^\\w+://", server) is not None else f"https://{server}"
+
+
+def _stop_openshift_proxies():
+    for openshift_proxy in _openshift_proxies.values():
+        openshift_proxy.stop()
+
+    _openshift_proxies.clear()
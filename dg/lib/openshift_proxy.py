@@ -0,0 +1,250 @@
+#  Copyright 2020 IBM Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import logging
+import pathlib
+import queue
+import re as regex
+import subprocess
+import threading
+import time
+
+from typing import IO, Any, Callable, Final, Union
+
+import requests
+
+from dg.lib.error import DataGateCLIException
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_START_TIMEOUT: Final[float] = 30
+
+
+class OpenShiftProxy:
+    """Runs "oc proxy" as a sidecar process
+
+    Kubernetes API requests sent to the local port the proxy listens on are
+    authenticated by oc using the current kubeconfig file. Thus, plain HTTP
+    requests to localhost may be used instead of executing oc for each
+    query.
+    """
+
+    def __init__(
+        self,
+        oc_cli_path: pathlib.Path,
+        env: Union[dict[str, str], None] = None,
+        start_timeout: float = DEFAULT_START_TIMEOUT,
+    ):
+        """Constructor
+
+        Parameters
+        ----------
+        oc_cli_path
+            path to the OpenShift Container Platform CLI
+        env
+            environment variables passed to oc (e.g., KUBECONFIG)
+        start_timeout
+            number of seconds to wait for the proxy process to report the
+            address it listens on
+        """
+
+        self._env = env
+        self._oc_cli_path = oc_cli_path
+        self._output_threads: list[threading.Thread] = []
+        self._process: Union[subprocess.Popen, None] = None
+        self._session: Union[requests.Session, None] = None
+        self._start_timeout = start_timeout
+        self._url: Union[str, None] = None
+
+    def __enter__(self):
+        self.start()
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def get(self, path: str) -> Any:
+        """Sends a GET request to the Kubernetes API through the proxy
+
+        Parameters
+        ----------
+        path
+            Kubernetes API path (e.g., /api/v1/nodes)
+
+        Returns
+        -------
+        Any
+            JSON response
+        """
+
+        return self.request("GET", path)
+
+    def get_url(self) -> str:
+        """Returns the URL the proxy listens on
+
+        Returns
+        -------
+        str
+            URL the proxy listens on
+        """
+
+        if self._url is None:
+            raise DataGateCLIException("oc proxy is not running")
+
+        return self._url
+
+    def is_running(self) -> bool:
+        """Returns whether the proxy process is running
+
+        Returns
+        -------
+        bool
+            true, if the proxy process is running
+        """
+
+        return (self._process is not None) and (self._process.poll() is None)
+
+    def request(self, method: str, path: str, **kwargs: Any) -> Any:
+        """Sends a request to the Kubernetes API through the proxy
+
+        Parameters
+        ----------
+        method
+            HTTP method
+        path
+            Kubernetes API path (e.g., /api/v1/nodes)
+        **kwargs
+            passed to requests.Session.request()
+
+        Returns
+        -------
+        Any
+            JSON response
+        """
+
+        if (self._session is None) or not self.is_running():
+            raise DataGateCLIException("oc proxy is not running")
+
+        response = self._session.request(method, self.get_url() + path, **kwargs)
+
+        if not response.ok:
+            raise DataGateCLIException(
+                f"Kubernetes API request '{method} {path}' failed (HTTP status code: {response.status_code})",
+                stderr=response.text,
+            )
+
+        return response.json()
+
+    def start(self):
+        """Starts the proxy process on a random local port"""
+
+        if self.is_running():
+            return
+
+        args = [str(self._oc_cli_path), "proxy", "--address", "127.0.0.1", "--port", "0"]
+
+        logger.debug(f"Executing command: {' '.join(args)}")
+
+        self._process = subprocess.Popen(
+            args,
+            env=self._env,
+            stderr=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+
+        process = self._process
+        stderr_lines: list[str] = []
+        stdout_lines: queue.Queue[Union[str, None]] = queue.Queue()
+
+        def read_stdout():
+            self._log_output(process.stdout, stdout_lines.put)
+
+            # end of output (e.g., because the process exited)
+            stdout_lines.put(None)
+
+        # output of the proxy process is drained to avoid blocking it
+        self._output_threads = [
+            threading.Thread(target=self._log_output, args=(process.stderr, stderr_lines.append), daemon=True),
+            threading.Thread(target=read_stdout, daemon=True),
+        ]
+
+        for output_thread in self._output_threads:
+            output_thread.start()
+
+        # oc may print warnings (e.g., about kubeconfig file permissions)
+        # before the address it listens on
+        deadline = time.monotonic() + self._start_timeout
+        search_result: Union[regex.Match, None] = None
+
+        while search_result is None:
+            try:
+                line = stdout_lines.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                self.stop()
+
+                raise DataGateCLIException(
+                    f"oc proxy did not start within {self._start_timeout:g} seconds", stderr="".join(stderr_lines)
+                )
+
+            if line is None:
+                self.stop()
+
+                raise DataGateCLIException("oc proxy could not be started", stderr="".join(stderr_lines))
+
+            search_result = regex.search("Starting to serve on (\\S+:\\d+)", line)
+
+        self._session = requests.Session()
+        self._url = f"http://{search_result.group(1)}"
+
+        logger.debug(f"oc proxy is listening on {self._url}")
+
+    def stop(self):
+        """Stops the proxy process"""
+
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+        if self._process is not None:
+            if self._process.poll() is None:
+                self._process.terminate()
+
+                try:
+                    self._process.wait(timeout=10)
+                except subprocess.TimeoutExpired:
+                    self._process.kill()
+                    self._process.wait()
+
+            # streams are closed after their output was read until its end
+            for output_thread, stream in zip(self._output_threads, [self._process.stderr, self._process.stdout]):
+                output_thread.join(timeout=1)
+
+                if (stream is not None) and not output_thread.is_alive():
+                    stream.close()
+
+            self._output_threads = []
+            self._process = None
+
+        self._url = None
+
+    def _log_output(self, stream: Union[IO[str], None], process_line: Callable[[str], None]):
+        """Logs each line written by the proxy process to the given stream and
+        passes it to the given callable"""
+
+        if stream is not None:
+            for line in stream:
+                logger.debug(f"oc proxy: {line.rstrip()}")
+                process_line(line)
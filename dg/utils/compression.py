@@ -18,7 +18,7 @@ import re as regex
 import tarfile
 import zipfile
 
-from typing import Any, Callable
+from typing import Any, BinaryIO, Callable, Union
 
 import dg.utils.file
 
@@ -43,7 +43,12 @@ def execute_post_extraction_func_if_exists(extracted_file_path: pathlib.Path, **
         kwargs["postExtractionFunc"](extracted_file_path)
 
 
-def extract_archive(archive_path: pathlib.Path, target_directory_path: pathlib.Path, **kwargs: Any):
+def extract_archive(
+    archive_path: pathlib.Path,
+    target_directory_path: pathlib.Path,
+    archive_file_name: Union[str, None] = None,
+    **kwargs: Any,
+):
     """Extracts a tar.gz, tgz, or zip archive
 
     Parameters
@@ -52,6 +57,10 @@ def extract_archive(archive_path: pathlib.Path, target_directory_path: pathlib.P
         path of the archive to be extracted
     target_directory_path
         path of the directory the archive shall be extracted to
+    archive_file_name
+        file name determining the type of the archive (default: name of the
+        archive file, which differs from the original file name for cached
+        archives)
     **kwargs
         directoryPathToStartExtraction: str
             path of a directory indicating that only files and directories whose
@@ -68,26 +77,13 @@ def extract_archive(archive_path: pathlib.Path, target_directory_path: pathlib.P
             post-extraction actions
     """
 
-    if (archive_path.suffixes == [".tar", ".gz"]) or (archive_path.suffix == ".tgz"):
-        with tarfile.open(archive_path) as tar_file:
-            for member in tar_file:
-                if is_member_to_be_extracted(member.name, member.isdir(), **kwargs):
-                    if "directoryPathToStartExtraction" in kwargs:
-                        directory_path_to_start_extraction = kwargs["directoryPathToStartExtraction"]
-                        search_result = regex.search(f"({directory_path_to_start_extraction}/).*", member.name)
-
-                        if search_result is None:
-                            continue
-
-                        member.name = member.name.removeprefix(search_result.group(1))
-
-                    if is_directory_structure_to_be_ignored(**kwargs):
-                        member.name = os.path.basename(member.name)
+    if archive_file_name is None:
+        archive_file_name = archive_path.name
 
-                    tar_file.extract(member, target_directory_path)
-                    execute_post_extraction_func_if_exists(target_directory_path / member.name, **kwargs)
-
-    elif archive_path.suffix == ".zip":
+    if is_tar_gz_archive(archive_file_name):
+        with tarfile.open(archive_path) as tar_file:
+            _extract_tar_file_members(tar_file, target_directory_path, **kwargs)
+    elif pathlib.PurePath(archive_file_name).suffix == ".zip":
         with zipfile.ZipFile(archive_path) as zip_file:
             for member in zip_file.infolist():
                 if is_member_to_be_extracted(member.filename, member.is_dir(), **kwargs):
@@ -98,6 +94,27 @@ def extract_archive(archive_path: pathlib.Path, target_directory_path: pathlib.P
                     execute_post_extraction_func_if_exists(target_directory_path / member.filename, **kwargs)
 
 
+def extract_tar_gz_archive_from_stream(stream: BinaryIO, target_directory_path: pathlib.Path, **kwargs: Any):
+    """Extracts a tar.gz archive while it is read from the given stream
+
+    The stream is read sequentially (e.g., the body of an HTTP response) so
+    that extraction overlaps with reading the stream and the archive is not
+    stored.
+
+    Parameters
+    ----------
+    stream
+        stream the tar.gz archive is read from
+    target_directory_path
+        path of the directory the archive shall be extracted to
+    **kwargs
+        see extract_archive()
+    """
+
+    with tarfile.open(fileobj=stream, mode="r|gz") as tar_file:
+        _extract_tar_file_members(tar_file, target_directory_path, **kwargs)
+
+
 def is_directory_structure_to_be_ignored(**kwargs: Any) -> bool:
     """Returns whether the directory structure within an archive shall be
        ignored
@@ -119,6 +136,23 @@ def is_directory_structure_to_be_ignored(**kwargs: Any) -> bool:
     return ("ignoreDirectoryStructure" in kwargs) and (kwargs["ignoreDirectoryStructure"])
 
 
+def is_tar_gz_archive(file_name: str) -> bool:
+    """Returns whether the given file name is the name of a tar.gz archive
+
+    Parameters
+    ----------
+    file_name
+        file name to be checked
+
+    Returns
+    -------
+    bool
+        true, if the given file name ends with .tar.gz or .tgz
+    """
+
+    return file_name.endswith(".tar.gz") or file_name.endswith(".tgz")
+
+
 def is_member_to_be_extracted(member_name: str, is_dir: bool, **kwargs: Any) -> bool:
     """Returns whether the given member within an archive shall be extracted
 
@@ -146,3 +180,22 @@ def is_member_to_be_extracted(member_name: str, is_dir: bool, **kwargs: Any) ->
             dg.utils.file.FileType.Directory if is_dir else dg.utils.file.FileType.RegularFile,
         )
     )
+
+
+def _extract_tar_file_members(tar_file: tarfile.TarFile, target_directory_path: pathlib.Path, **kwargs: Any):
+    for member in tar_file:
+        if is_member_to_be_extracted(member.name, member.isdir(), **kwargs):
+            if "directoryPathToStartExtraction" in kwargs:
+                directory_path_to_start_extraction = kwargs["directoryPathToStartExtraction"]
+                search_result = regex.search(f"({directory_path_to_start_extraction}/).*", member.name)
+
+                if search_result is None:
+                    continue
+
+                member.name = member.name.removeprefix(search_result.group(1))
+
+            if is_directory_structure_to_be_ignored(**kwargs):
+                member.name = os.path.basename(member.name)
+
+            tar_file.extract(member, target_directory_path)
+            execute_post_extraction_func_if_exists(target_directory_path / member.name, **kwargs)
@@ -12,22 +12,431 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import concurrent.futures
+import contextlib
+import hashlib
 import io
+import json
 import logging
+import math
 import os
 import pathlib
 import re as regex
+import shutil
 import tempfile
+import threading
+import time
 import urllib.parse
 
-from typing import Any
+from typing import IO, Any, Callable, ContextManager, Final, Union
 
 import requests
 
 from tqdm import tqdm
 
+import dg.utils.compression
+import dg.utils.http
+
+from dg.lib.error import DataGateCLIException
+from dg.utils.download_cache import DownloadCache, copy_file, get_download_cache
+
 logger = logging.getLogger(__name__)
 
+DEFAULT_CONNECTION_COUNT: Final[int] = 4
+MIN_SEGMENT_SIZE: Final[int] = 8388608  # 8 MiB
+PARTIAL_DOWNLOAD_SAVE_INTERVAL: Final[float] = 1
+
+
+class PartialDownload:
+    """In-progress download stored as a .part file next to the target file
+
+    A sidecar file (.part.json) records the URL, the validator (ETag or
+    Last-Modified), and the size of the file as well as the number of bytes
+    received for each segment. If a download fails, it may be resumed using
+    range requests as long as the validator still matches.
+    """
+
+    def __init__(
+        self,
+        path: pathlib.Path,
+        url: str,
+        validator: Union[str, None],
+        size: int,
+        segments: list[list[int]],
+    ):
+        """Constructor
+
+        Parameters
+        ----------
+        path
+            path of the target file
+        url
+            url of the file to be downloaded
+        validator
+            ETag or Last-Modified header of the file
+        size
+            size of the file (0 if unknown)
+        segments
+            start, end (0 if unknown), and number of received bytes of each
+            segment
+        """
+
+        self.part_path = path.with_name(path.name + ".part")
+        self.path = path
+        self.segments = segments
+        self.sidecar_path = path.with_name(path.name + ".part.json")
+        self.size = size
+        self.url = url
+        self.validator = validator
+
+        self._lock = threading.Lock()
+        self._save_time = 0.0
+
+    @staticmethod
+    def load(path: pathlib.Path, url: str, validator: Union[str, None], size: int) -> Union["PartialDownload", None]:
+        """Loads the in-progress download of the given file if it may be
+        resumed
+
+        Parameters
+        ----------
+        path
+            path of the target file
+        url
+            url of the file to be downloaded
+        validator
+            current ETag or Last-Modified header of the file
+        size
+            current size of the file
+
+        Returns
+        -------
+        Union[PartialDownload, None]
+            in-progress download or None if there is no in-progress download or
+            if the file changed
+        """
+
+        partial_download = PartialDownload(path, url, validator, size, [])
+
+        if (validator is None) or not (partial_download.part_path.exists() and partial_download.sidecar_path.exists()):
+            return None
+
+        try:
+            sidecar = json.loads(partial_download.sidecar_path.read_text())
+        except ValueError:
+            return None
+
+        if (sidecar.get("url"), sidecar.get("validator"), sidecar.get("size")) != (url, validator, size):
+            return None
+
+        partial_download.segments = sidecar["segments"]
+
+        return partial_download
+
+    def complete(self):
+        """Renames the .part file to the target file and removes the sidecar
+        file"""
+
+        os.replace(self.part_path, self.path)
+        self.sidecar_path.unlink(missing_ok=True)
+
+    def remove(self):
+        """Removes the .part file and the sidecar file"""
+
+        self.part_path.unlink(missing_ok=True)
+        self.sidecar_path.unlink(missing_ok=True)
+
+    def get_received_size(self) -> int:
+        return sum(segment[2] for segment in self.segments)
+
+    def is_resumable(self) -> bool:
+        return (self.validator is not None) and (self.size != 0)
+
+    def save(self):
+        """Writes the sidecar file"""
+
+        if not self.is_resumable():
+            return
+
+        with self._lock:
+            sidecar = {"url": self.url, "validator": self.validator, "size": self.size, "segments": self.segments}
+            self._save_time = time.monotonic()
+
+        temporary_sidecar_path = self.sidecar_path.with_name(self.sidecar_path.name + ".tmp")
+        temporary_sidecar_path.write_text(json.dumps(sidecar))
+
+        os.replace(temporary_sidecar_path, self.sidecar_path)
+
+    def update(self, segment_index: int, size: int):
+        """Records received bytes of a segment and writes the sidecar file
+        periodically
+
+        Parameters
+        ----------
+        segment_index
+            index of the segment
+        size
+            number of received bytes
+        """
+
+        with self._lock:
+            self.segments[segment_index][2] += size
+            is_save_required = (time.monotonic() - self._save_time) >= PARTIAL_DOWNLOAD_SAVE_INTERVAL
+
+        if is_save_required:
+            self.save()
+
+
+class _SegmentedSHA256:
+    """SHA-256 hash of a file whose segments are written concurrently
+
+    Chunks written at the current position of the hash are hashed directly.
+    Chunks written ahead of it (i.e., to subsequent segments) are read back
+    from the file once all preceding bytes were hashed, which is usually
+    served from the page cache while the download is still in progress.
+    Bytes received before a download was resumed are read back as well.
+    """
+
+    def __init__(self, partial_download: PartialDownload, read_func: Callable[[int, int], bytes]):
+        """Constructor
+
+        Parameters
+        ----------
+        partial_download
+            in-progress download whose segments are hashed
+        read_func
+            function returning the given number of bytes at the given offset
+            of the file
+        """
+
+        self._hashed_size = 0
+        self._lock = threading.Lock()
+        self._partial_download = partial_download
+        self._read_func = read_func
+        self._sha256 = hashlib.sha256()
+
+    def hexdigest(self) -> str:
+        with self._lock:
+            self._hash_written_bytes()
+
+            return self._sha256.hexdigest()
+
+    def update(self, offset: int, chunk: bytes):
+        """Hashes a chunk written at the given offset if it is the next chunk
+        to be hashed and any subsequent bytes already written
+
+        Parameters
+        ----------
+        offset
+            offset of the chunk within the file
+        chunk
+            chunk written to the file
+        """
+
+        with self._lock:
+            if offset == self._hashed_size:
+                self._sha256.update(chunk)
+                self._hashed_size += len(chunk)
+
+            self._hash_written_bytes()
+
+    def _get_contiguous_size(self) -> int:
+        """Returns the number of bytes written contiguously from the start of
+        the file"""
+
+        contiguous_size = 0
+
+        for start, end, received_size in self._partial_download.segments:
+            contiguous_size = start + received_size
+
+            if contiguous_size != end:
+                break
+
+        return contiguous_size
+
+    def _hash_written_bytes(self):
+        while (contiguous_size := self._get_contiguous_size()) > self._hashed_size:
+            data = self._read_func(self._hashed_size, min(contiguous_size - self._hashed_size, 1048576))  # 1 MiB
+
+            self._sha256.update(data)
+            self._hashed_size += len(data)
+
+
+class _ResponseStream(io.RawIOBase):
+    """Read-only stream returning the body of a streamed HTTP response"""
+
+    def __init__(self, response: requests.Response, chunk_func: Callable[[bytes], None]):
+        """Constructor
+
+        Parameters
+        ----------
+        response
+            streamed HTTP response
+        chunk_func
+            function called for each chunk of the body received
+        """
+
+        self._chunk_func = chunk_func
+        self._chunk = memoryview(b"")
+        self._chunks = response.iter_content(chunk_size=1048576)  # 1 MiB
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        while len(self._chunk) == 0:
+            chunk = next(self._chunks, None)
+
+            if chunk is None:
+                return 0
+
+            self._chunk_func(chunk)
+            self._chunk = memoryview(chunk)
+
+        size = min(len(buffer), len(self._chunk))
+        buffer[:size] = self._chunk[:size]
+        self._chunk = self._chunk[size:]
+
+        return size
+
+
+def download_and_extract_archive(
+    url: urllib.parse.SplitResult, target_directory_path: pathlib.Path, **kwargs: Any
+) -> str:
+    """Downloads and extracts an archive
+
+    tar.gz archives are extracted while they are downloaded (i.e., the
+    archive is not stored unless it is cached). Other archives (e.g., zip
+    archives, which cannot be extracted sequentially) are downloaded to a
+    temporary file, which is removed after the archive was extracted.
+
+    If a download cache is used (see
+    dg.utils.download_cache.set_download_cache()), a cached archive is
+    extracted directly from the cache if it did not change. Otherwise, the
+    archive is downloaded to the temporary directory of the cache so that it
+    is cached without copying it.
+
+    If an argument for expected_sha256 is passed, a tar.gz archive is
+    extracted to a temporary directory within the target directory and
+    extracted files are moved to the target directory once the SHA-256 hash
+    of the archive was verified.
+
+    Parameters
+    ----------
+    url
+        url of the archive to be downloaded
+    target_directory_path
+        path of the directory the archive shall be extracted to
+    **kwargs
+        expected_sha256
+            expected SHA-256 hash of the archive (see download_file())
+        sha256_func
+            function called with the SHA-256 hash of the archive (see
+            download_file())
+        see dg.utils.compression.extract_archive() for further arguments
+
+    Returns
+    -------
+    str
+        name of the downloaded archive
+    """
+
+    url_as_str = urllib.parse.urlunsplit(url)
+    cache_key = DownloadCache.get_key(url_as_str, {})
+    response = _get_with_download_cache(url_as_str, cache_key, {})
+
+    if (cached_file_path := _get_cached_file_path(response, cache_key)) is not None:
+        logger.info("Using cached download: {} [{}]".format(url_as_str, cached_file_path[1]))
+
+        # blobs are named after the SHA-256 hash of their contents
+        _verify_sha256(url_as_str, cached_file_path[0].name, **kwargs)
+        dg.utils.compression.extract_archive(
+            cached_file_path[0], target_directory_path, archive_file_name=cached_file_path[1], **kwargs
+        )
+
+        return cached_file_path[1]
+
+    file_name = _get_file_name(response)
+
+    if not dg.utils.compression.is_tar_gz_archive(file_name):
+        archive_path = _download_file_from_response(
+            url,
+            {},
+            response,
+            cache_key,
+            _get_archive_directory_path(response),
+            is_temporary_file=True,
+            **_get_sha256_args(kwargs),
+        )
+
+        try:
+            dg.utils.compression.extract_archive(archive_path, target_directory_path, **kwargs)
+        finally:
+            archive_path.unlink(missing_ok=True)
+
+        return archive_path.name
+
+    logger.info("Downloading and extracting: {} [{}]".format(response.url, file_name))
+
+    download_progress_bar = tqdm(total=_get_content_length(response), unit="B", unit_scale=True)
+    sha256 = hashlib.sha256()
+
+    if kwargs.get("expected_sha256") is not None:
+        target_directory_path.mkdir(exist_ok=True, parents=True)
+
+    # the archive is also streamed into a temporary file within the download
+    # cache if it may be cached (the file is renamed into place afterwards)
+    with _create_cache_file(response) as cache_file, (
+        tempfile.TemporaryDirectory(dir=target_directory_path, prefix=".")
+        if kwargs.get("expected_sha256") is not None
+        else contextlib.nullcontext()
+    ) as staging_directory:
+        extracted_file_paths: list[pathlib.Path] = []
+        extraction_directory_path = (
+            pathlib.Path(staging_directory) if staging_directory is not None else target_directory_path
+        )
+
+        extraction_kwargs = (
+            dict(kwargs, postExtractionFunc=extracted_file_paths.append) if staging_directory is not None else kwargs
+        )
+
+        def process_chunk(chunk: bytes):
+            if cache_file is not None:
+                cache_file.write(chunk)
+
+            sha256.update(chunk)
+            download_progress_bar.update(len(chunk))
+
+        stream = _ResponseStream(response, process_chunk)
+
+        try:
+            dg.utils.compression.extract_tar_gz_archive_from_stream(
+                stream, extraction_directory_path, **extraction_kwargs
+            )
+
+            # read the remainder of the archive following the end-of-archive
+            # marker (e.g., padding) so that the complete archive is hashed and
+            # cached
+            while len(stream.read(1048576)) != 0:  # 1 MiB
+                pass
+        finally:
+            response.close()
+
+        download_progress_bar.close()
+        _verify_sha256(url_as_str, sha256.hexdigest(), **kwargs)
+
+        if staging_directory is not None:
+            _move_extracted_files(
+                pathlib.Path(staging_directory), target_directory_path, extracted_file_paths, **kwargs
+            )
+
+        if cache_file is not None:
+            cache_file.close()
+            _store_in_download_cache(
+                response, cache_key, url_as_str, pathlib.Path(cache_file.name), file_name, sha256.hexdigest(), True
+            )
+
+    return file_name
+
 
 def download_file(url: urllib.parse.SplitResult, **kwargs: Any) -> pathlib.Path:
     """Downloads a file to the temporary directory of the current user
@@ -35,6 +444,29 @@ def download_file(url: urllib.parse.SplitResult, **kwargs: Any) -> pathlib.Path:
     If an argument for target_directory_path is passed, the file is
     downloaded to the specified directory.
 
+    If the server supports range requests and the file is large enough, the
+    file is split into segments, which are downloaded concurrently using
+    separate connections and written to their positions within the
+    preallocated file. Otherwise, the file is downloaded using a single
+    connection.
+
+    The file is downloaded to a .part file, which is renamed once the
+    download completed. If a download fails, the number of bytes received
+    for each segment is recorded in a sidecar file (see PartialDownload) and
+    a subsequent download of the same URL resumes the download using range
+    requests unless the ETag (or Last-Modified header) of the file changed.
+
+    If a download cache is used (see
+    dg.utils.download_cache.set_download_cache()), a conditional request is
+    sent for cached files and the cached file is copied to the target
+    directory if it did not change. Downloaded files are copied into the
+    cache (i.e., the downloaded file may be modified without modifying the
+    cached file).
+
+    The SHA-256 hash of the file is computed while it is downloaded (see
+    _SegmentedSHA256) and verified if an argument for expected_sha256 is
+    passed. If the hash does not match, the downloaded file is removed.
+
     Parameters
     ----------
     url
@@ -42,8 +474,15 @@ def download_file(url: urllib.parse.SplitResult, **kwargs: Any) -> pathlib.Path:
     **kwargs
         auth
             passed to requests.get()
+        connection_count
+            maximum number of connections used to download segments of the file
+            concurrently (1 disables segmented downloads)
+        expected_sha256
+            expected SHA-256 hash of the file
         headers
             passed to requests.get()
+        sha256_func
+            function called with the SHA-256 hash of the file
         target_directory_path
             path of the directory the file shall be downloaded to
 
@@ -53,72 +492,411 @@ def download_file(url: urllib.parse.SplitResult, **kwargs: Any) -> pathlib.Path:
         Path of the downloaded file
     """
 
-    args: dict[str, Any] = {}
+    args = _get_request_args(kwargs)
+    url_as_str = urllib.parse.urlunsplit(url)
+    cache_key = DownloadCache.get_key(url_as_str, args.get("headers", {}))
+    response = _get_with_download_cache(url_as_str, cache_key, args)
+    target_directory_path = pathlib.Path(
+        kwargs["target_directory_path"] if "target_directory_path" in kwargs else tempfile.gettempdir()
+    )
 
-    if "auth" in kwargs:
-        args["auth"] = kwargs["auth"]
+    if (cached_file_path := _get_cached_file_path(response, cache_key)) is not None:
+        path = target_directory_path / cached_file_path[1]
 
-    if "headers" in kwargs:
-        args["headers"] = kwargs["headers"]
+        logger.info("Using cached download: {} [{}]".format(url_as_str, cached_file_path[1]))
 
-    args["stream"] = True
+        # blobs are named after the SHA-256 hash of their contents
+        _verify_sha256(url_as_str, cached_file_path[0].name, **kwargs)
+        copy_file(cached_file_path[0], path)
 
-    response = requests.get(urllib.parse.urlunsplit(url), **args)
-    response.raise_for_status()
+        return path
 
-    file_name: str
+    return _download_file_from_response(url, args, response, cache_key, target_directory_path, **kwargs)
 
-    if "Content-Disposition" in response.headers:
-        content_disposition = response.headers["Content-Disposition"]
-        search_result = regex.search('filename="?([^;"]+)"?', content_disposition)
-        file_name = (
-            search_result.group(1)
-            if search_result is not None
-            else os.path.basename(urllib.parse.urlsplit(response.url).path)
-        )
-    else:
-        file_name = os.path.basename(urllib.parse.urlsplit(response.url).path)
 
-    logger.info("Downloading: {} [{}]".format(response.url, file_name))
+def download_file_into_buffer(url: urllib.parse.SplitResult, output_stream: io.BufferedIOBase, **kwargs: Any) -> str:
+    """Downloads a file and writes its content into the given output
+    stream.
+
+    If a download cache is used (see
+    dg.utils.download_cache.set_download_cache()), a conditional request is
+    sent for cached files and the content of the cached file is written into
+    the output stream if it did not change.
 
-    content_length = (
-        int(str(response.headers.get("Content-Length"))) if response.headers.get("Content-Length") is not None else 0
+    Parameters
+    ----------
+    url
+        url of the file to be downloaded
+    output_stream
+        output stream the content of the downloaded file is written to
+    **kwargs
+        silent: bool
+            flag indicating whether output to stdout shall be suppressed
+    """
+
+    url_as_str = urllib.parse.urlunsplit(url)
+    cache_key = DownloadCache.get_key(url_as_str, {})
+    response = _get_with_download_cache(url_as_str, cache_key, {})
+
+    if (cached_file_path := _get_cached_file_path(response, cache_key)) is not None:
+        if ("silent" not in kwargs) or not kwargs["silent"]:
+            logger.info("Using cached download: {} [{}]".format(url_as_str, cached_file_path[1]))
+
+        with open(cached_file_path[0], "rb") as cached_file:
+            shutil.copyfileobj(cached_file, output_stream)
+
+        return cached_file_path[1]
+
+    file_name = _get_file_name(response)
+
+    if ("silent" not in kwargs) or not kwargs["silent"]:
+        logger.info("Downloading: {} [{}]".format(response.url, file_name))
+
+    content_length = _get_content_length(response)
+    download_progress_bar = (
+        tqdm(total=content_length, unit="B", unit_scale=True)
+        if ("silent" not in kwargs) or not kwargs["silent"]
+        else None
     )
 
+    sha256 = hashlib.sha256()
+
+    # the content is also written to a temporary file within the cache if it
+    # may be cached, which is moved into the cache afterwards
+    with _create_cache_file(response) as cache_file:
+        for chunk in response.iter_content(chunk_size=1048576):  # 1 MiB
+            output_stream.write(chunk)
+
+            if cache_file is not None:
+                cache_file.write(chunk)
+                sha256.update(chunk)
+
+            if download_progress_bar is not None:
+                download_progress_bar.update(len(chunk))
+
+        if download_progress_bar is not None:
+            download_progress_bar.close()
+
+        if cache_file is not None:
+            cache_file.close()
+            _store_in_download_cache(
+                response, cache_key, url_as_str, pathlib.Path(cache_file.name), file_name, sha256.hexdigest(), True
+            )
+
+    return file_name
+
+
+def get_sha256_from_checksum_file(url: urllib.parse.SplitResult, file_name: str) -> Union[str, None]:
+    """Returns the SHA-256 hash of the given file listed in a checksum file
+    published along with it
+
+    Checksum files are expected to be in the format of the output of
+    sha256sum (e.g., HashiCorp SHA256SUMS files):
+
+    <SHA-256 hash>  <file name>
+    […]
+
+    Parameters
+    ----------
+    url
+        url of the checksum file
+    file_name
+        name of the file whose SHA-256 hash shall be returned
+
+    Returns
+    -------
+    Union[str, None]
+        SHA-256 hash or None if the file is not listed
+    """
+
+    with io.BytesIO() as buffer:
+        download_file_into_buffer(url, buffer, silent=True)
+
+        for line in buffer.getvalue().decode("utf-8").splitlines():
+            search_result = regex.match("([0-9A-Fa-f]{64})\\s+\\*?(.+)$", line.strip())
+
+            if (search_result is not None) and (os.path.basename(search_result.group(2)) == file_name):
+                return search_result.group(1).lower()
+
+    return None
+
+
+def _create_cache_file(response: requests.Response) -> ContextManager[Union[IO[bytes], None]]:
+    """Returns a context manager creating a temporary file within the
+    download cache if the response may be cached"""
+
+    download_cache = get_download_cache()
+
+    return (
+        download_cache.create_temporary_file()
+        if (download_cache is not None) and _is_cacheable(response)
+        else contextlib.nullcontext()
+    )
+
+
+def _download_file_from_response(
+    url: urllib.parse.SplitResult,
+    args: dict[str, Any],
+    response: requests.Response,
+    cache_key: str,
+    directory_path: pathlib.Path,
+    is_temporary_file: bool = False,
+    **kwargs: Any,
+) -> pathlib.Path:
+    """Downloads the body of the given (streamed) response to the given
+    directory (see download_file())
+
+    A temporary file (i.e., a file which is removed after it was read) is
+    hard-linked into the download cache instead of being copied.
+    """
+
+    url_as_str = urllib.parse.urlunsplit(url)
+    file_name = _get_file_name(response)
+
+    logger.info("Downloading: {} [{}]".format(response.url, file_name))
+
+    content_length = _get_content_length(response)
+    connection_count: int = kwargs.get("connection_count", DEFAULT_CONNECTION_COUNT)
     download_progress_bar = tqdm(total=content_length, unit="B", unit_scale=True)
-    path = (
-        pathlib.Path(kwargs["target_directory_path"] if "target_directory_path" in kwargs else tempfile.gettempdir())
-        / file_name
+    path = directory_path / file_name
+    validator = _get_validator(response)
+    is_range_request_supported = _is_range_request_supported(response, content_length)
+    partial_download = (
+        PartialDownload.load(path, url_as_str, validator, content_length) if is_range_request_supported else None
     )
 
-    with open(path, "wb") as file:
-        for chunk in response.iter_content(chunk_size=1048576):  # 1 MiB
-            file.write(chunk)
-            download_progress_bar.update(len(chunk))
+    if partial_download is not None:
+        # the initial response is not required as the remaining bytes of each
+        # segment are requested using range requests
+        response.close()
+        download_progress_bar.update(partial_download.get_received_size())
+
+        logger.info(f"Resuming download ({partial_download.get_received_size()} of {content_length} bytes received)")
+
+        is_resumed = True
+    else:
+        # the size of the file is unknown unless the response is unencoded
+        # (e.g., Content-Length is the size of the compressed body if the
+        # response is gzip-encoded)
+        size = content_length if is_range_request_supported else 0
+        segments = (
+            _get_segments(content_length, connection_count)
+            if _is_segmented_download_supported(response, content_length, connection_count)
+            else [[0, size, 0]]
+        )
+
+        partial_download = PartialDownload(path, url_as_str, validator, size, segments)
+
+        with open(partial_download.part_path, "wb") as file:
+            # preallocate the file so that segments may be written to their
+            # positions
+            file.truncate(size)
+
+        is_resumed = False
+
+    try:
+        sha256 = _download_segments(url, args, response, partial_download, download_progress_bar, is_resumed)
+    except BaseException:
+        # the .part file is only kept if a subsequent download may resume it
+        if not partial_download.is_resumable():
+            partial_download.remove()
+
+        raise
+    finally:
+        download_progress_bar.close()
+
+        # the connection is released (or closed if the body of the response
+        # was not read completely, e.g., if the download failed)
+        response.close()
+
+    try:
+        _verify_sha256(url_as_str, sha256, **kwargs)
+    except DataGateCLIException:
+        partial_download.remove()
+
+        raise
 
-    download_progress_bar.close()
+    partial_download.complete()
+
+    if _is_cacheable(response):
+        _store_in_download_cache(response, cache_key, url_as_str, path, file_name, sha256, link=is_temporary_file)
 
     return path
 
 
-def download_file_into_buffer(url: urllib.parse.SplitResult, output_stream: io.BufferedIOBase, **kwargs: Any) -> str:
-    """Downloads a file and writes its content into the given output
-    stream.
+def _download_segments(
+    url: urllib.parse.SplitResult,
+    args: dict[str, Any],
+    response: requests.Response,
+    partial_download: PartialDownload,
+    download_progress_bar: tqdm,
+    is_resumed: bool = False,
+) -> str:
+    """Downloads the missing bytes of each segment of a file concurrently
+    and writes them to their positions within the .part file
+
+    Unless the download is resumed, the body of the initial response is used
+    for the first segment. The remaining bytes of other segments are
+    requested from the URL of the initial response using range requests,
+    which are conditional on the validator of the file so that a changed
+    file is not assembled from different versions. If a segment fails, the
+    bytes received so far are recorded in the sidecar file.
 
     Parameters
     ----------
     url
         url of the file to be downloaded
-    output_stream
-        output stream the content of the downloaded file is written to
-    **kwargs
-        silent: bool
-            flag indicating whether output to stdout shall be suppressed
+    args
+        arguments passed to requests.get()
+    response
+        initial (streamed) response
+    partial_download
+        in-progress download
+    download_progress_bar
+        progress bar updated with the aggregate progress of all segments
+    is_resumed
+        flag indicating whether the body of the initial response shall not be
+        used as the download is resumed
+
+    Returns
+    -------
+    str
+        SHA-256 hash of the file
     """
 
-    response = requests.get(urllib.parse.urlunsplit(url), stream=True)
-    response.raise_for_status()
+    segment_args = _get_segment_request_args(url, args, response, partial_download)
+    pending_segment_indices = [
+        index
+        for index, (start, end, received_size) in enumerate(partial_download.segments)
+        if (index == 0 and not is_resumed) or (start + received_size < end)
+    ]
+
+    logger.debug(f"Downloading {len(pending_segment_indices)} segment(s) concurrently")
+
+    progress_bar_lock = threading.Lock()
+
+    with open(partial_download.part_path, "r+b") as file:
+        file_lock = threading.Lock()
+
+        def read(offset: int, size: int) -> bytes:
+            if hasattr(os, "pread"):
+                return os.pread(file.fileno(), size, offset)
+
+            with file_lock:
+                file.seek(offset)
+
+                return file.read(size)
+
+        def write(data: bytes, offset: int):
+            if hasattr(os, "pwrite"):
+                os.pwrite(file.fileno(), data, offset)
+            else:
+                with file_lock:
+                    file.seek(offset)
+                    file.write(data)
+
+        sha256 = _SegmentedSHA256(partial_download, read)
+
+        def write_segment(segment_response: requests.Response, index: int):
+            start, end, received_size = partial_download.segments[index]
+            offset = start + received_size
+
+            try:
+                for chunk in segment_response.iter_content(chunk_size=1048576):  # 1 MiB
+                    if end != 0:
+                        chunk = chunk[: end - offset]
+
+                    write(chunk, offset)
+                    partial_download.update(index, len(chunk))
+                    sha256.update(offset, chunk)
+                    offset += len(chunk)
+
+                    with progress_bar_lock:
+                        download_progress_bar.update(len(chunk))
+
+                    if offset == end:
+                        break
+            finally:
+                segment_response.close()
+
+            if (end != 0) and (offset != end):
+                raise DataGateCLIException(
+                    f"Incomplete segment received (bytes {start}-{end - 1}): {partial_download.url}"
+                )
+
+        def download_segment(index: int):
+            if (index == 0) and not is_resumed:
+                write_segment(response, index)
+
+                return
+
+            start, end, received_size = partial_download.segments[index]
+            headers = dict(segment_args.get("headers", {}), Range=f"bytes={start + received_size}-{end - 1}")
+            segment_response = dg.utils.http.get_http_session().get(
+                response.url, stream=True, **dict(segment_args, headers=headers)
+            )
+
+            segment_response.raise_for_status()
+
+            if segment_response.status_code != 206:
+                segment_response.close()
+
+                raise DataGateCLIException(f"Server did not return the requested range: {partial_download.url}")
+
+            write_segment(segment_response, index)
+
+        try:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max(len(pending_segment_indices), 1)) as executor:
+                for future in [executor.submit(download_segment, index) for index in pending_segment_indices]:
+                    future.result()
+        finally:
+            partial_download.save()
+
+        return sha256.hexdigest()
+
+
+def _get_archive_directory_path(response: requests.Response) -> pathlib.Path:
+    """Returns the path of the directory an archive is downloaded to before it
+    is extracted
+
+    Archives which may be cached are downloaded to the temporary directory of
+    the cache so that they may be hard-linked into the cache instead of being
+    copied.
+    """
 
+    download_cache = get_download_cache()
+
+    return (
+        download_cache.get_temporary_directory_path()
+        if (download_cache is not None) and _is_cacheable(response)
+        else pathlib.Path(tempfile.gettempdir())
+    )
+
+
+def _get_cached_file_path(response: requests.Response, cache_key: str) -> Union[tuple[pathlib.Path, str], None]:
+    """Returns the path and the name of the cached file if the server
+    responded that it did not change"""
+
+    download_cache = get_download_cache()
+
+    if (download_cache is None) or (response.status_code != 304):
+        return None
+
+    cache_entry = download_cache.get_entry(cache_key)
+
+    if cache_entry is None:
+        raise DataGateCLIException(f"Cached file was removed during the download: {response.url}")
+
+    download_cache.touch(cache_key)
+
+    return download_cache.get_blob_path(cache_entry), cache_entry.file_name
+
+
+def _get_content_length(response: requests.Response) -> int:
+    return int(str(response.headers.get("Content-Length"))) if response.headers.get("Content-Length") is not None else 0
+
+
+def _get_file_name(response: requests.Response) -> str:
     file_name: str
 
     if "Content-Disposition" in response.headers:
@@ -132,23 +910,178 @@ def download_file_into_buffer(url: urllib.parse.SplitResult, output_stream: io.B
     else:
         file_name = os.path.basename(urllib.parse.urlsplit(response.url).path)
 
-    if ("silent" not in kwargs) or not kwargs["silent"]:
-        logger.info("Downloading: {} [{}]".format(response.url, file_name))
+    return file_name
+
+
+def _get_with_download_cache(url: str, cache_key: str, args: dict[str, Any]) -> requests.Response:
+    """Sends a GET request, which is conditional on the ETag or Last-Modified
+    header of the cached file (if any)"""
+
+    download_cache = get_download_cache()
+    cache_entry = download_cache.get_entry(cache_key) if download_cache is not None else None
+
+    if cache_entry is not None:
+        args = dict(
+            args, headers=dict(args.get("headers", {}), **DownloadCache.get_conditional_request_headers(cache_entry))
+        )
+
+    response = dg.utils.http.get_http_session().get(url, stream=True, **args)
+    response.raise_for_status()
+
+    return response
+
+
+def _get_request_args(kwargs: dict[str, Any]) -> dict[str, Any]:
+    args: dict[str, Any] = {}
+
+    if "auth" in kwargs:
+        args["auth"] = kwargs["auth"]
+
+    if "headers" in kwargs:
+        args["headers"] = kwargs["headers"]
+
+    return args
+
+
+def _get_sha256_args(kwargs: dict[str, Any]) -> dict[str, Any]:
+    return {key: value for key, value in kwargs.items() if key in ["expected_sha256", "sha256_func"]}
+
+
+def _get_segment_request_args(
+    url: urllib.parse.SplitResult,
+    args: dict[str, Any],
+    response: requests.Response,
+    partial_download: PartialDownload,
+) -> dict[str, Any]:
+    """Returns the arguments passed to requests.get() when requesting a
+    segment of a file from the URL of the initial response
+
+    Credentials are only sent if the initial request was not redirected to
+    another host (e.g., pre-signed URLs of GitHub release assets reject
+    requests containing credentials).
+    """
 
-    content_length = (
-        int(str(response.headers.get("Content-Length"))) if response.headers.get("Content-Length") is not None else 0
+    is_redirected_to_other_host = urllib.parse.urlsplit(response.url).netloc != url.netloc
+    headers = dict(args.get("headers", {})) if not is_redirected_to_other_host else {}
+    headers["Accept-Encoding"] = "identity"
+
+    if partial_download.validator is not None:
+        headers["If-Range"] = partial_download.validator
+
+    segment_args: dict[str, Any] = {"headers": headers}
+
+    if ("auth" in args) and not is_redirected_to_other_host:
+        segment_args["auth"] = args["auth"]
+
+    return segment_args
+
+
+def _get_segments(content_length: int, connection_count: int) -> list[list[int]]:
+    segment_count = min(connection_count, math.ceil(content_length / MIN_SEGMENT_SIZE))
+    segment_size = math.ceil(content_length / segment_count)
+
+    return [[start, min(start + segment_size, content_length), 0] for start in range(0, content_length, segment_size)]
+
+
+def _get_validator(response: requests.Response) -> Union[str, None]:
+    """Returns the ETag or Last-Modified header of the given response
+    (weak ETags are not suitable for range requests)"""
+
+    etag = response.headers.get("ETag")
+
+    if (etag is not None) and not etag.startswith("W/"):
+        return etag
+
+    return response.headers.get("Last-Modified")
+
+
+def _is_cacheable(response: requests.Response) -> bool:
+    return (get_download_cache() is not None) and (
+        ("ETag" in response.headers) or ("Last-Modified" in response.headers)
     )
 
-    if ("silent" in kwargs) and kwargs["silent"]:
-        for chunk in response.iter_content(chunk_size=1048576):  # 1 MiB
-            output_stream.write(chunk)
-    else:
-        download_progress_bar = tqdm(total=content_length, unit="B", unit_scale=True)
 
-        for chunk in response.iter_content(chunk_size=1048576):  # 1 MiB
-            output_stream.write(chunk)
-            download_progress_bar.update(len(chunk))
+def _is_range_request_supported(response: requests.Response, content_length: int) -> bool:
+    """Returns whether parts of a file may be requested using range requests
 
-        download_progress_bar.close()
+    Range requests require a server supporting them, a known size, and an
+    unencoded response (ranges refer to encoded bytes otherwise).
+    """
 
-    return file_name
+    return (
+        (content_length != 0)
+        and (response.headers.get("Accept-Ranges", "").lower() == "bytes")
+        and (response.headers.get("Content-Encoding", "identity").lower() == "identity")
+    )
+
+
+def _is_segmented_download_supported(response: requests.Response, content_length: int, connection_count: int) -> bool:
+    return (
+        (connection_count > 1)
+        and (content_length >= 2 * MIN_SEGMENT_SIZE)
+        and _is_range_request_supported(response, content_length)
+    )
+
+
+def _move_extracted_files(
+    staging_directory_path: pathlib.Path,
+    target_directory_path: pathlib.Path,
+    extracted_file_paths: list[pathlib.Path],
+    **kwargs: Any,
+):
+    """Moves files extracted to a staging directory to the target directory
+    and calls the post-extraction function (if any) for each moved file"""
+
+    for extracted_file_path in extracted_file_paths:
+        target_file_path = target_directory_path / extracted_file_path.relative_to(staging_directory_path)
+
+        if extracted_file_path.is_dir():
+            target_file_path.mkdir(exist_ok=True, parents=True)
+        else:
+            target_file_path.parent.mkdir(exist_ok=True, parents=True)
+            os.replace(extracted_file_path, target_file_path)
+
+        dg.utils.compression.execute_post_extraction_func_if_exists(target_file_path, **kwargs)
+
+
+def _store_in_download_cache(
+    response: requests.Response,
+    cache_key: str,
+    url: str,
+    path: pathlib.Path,
+    file_name: str,
+    sha256: Union[str, None] = None,
+    move: bool = False,
+    link: bool = False,
+):
+    download_cache = get_download_cache()
+
+    if (download_cache is not None) and _is_cacheable(response):
+        download_cache.store(
+            cache_key,
+            url,
+            path,
+            file_name,
+            response.headers.get("ETag"),
+            response.headers.get("Last-Modified"),
+            sha256,
+            move,
+            link,
+        )
+
+
+def _verify_sha256(url: str, sha256: str, **kwargs: Any):
+    """Verifies the SHA-256 hash of a downloaded file if an expected hash was
+    passed and calls the function passed for sha256_func (if any)"""
+
+    if ("expected_sha256" in kwargs) and (kwargs["expected_sha256"] is not None):
+        if sha256.lower() != kwargs["expected_sha256"].lower():
+            raise DataGateCLIException(
+                f"SHA-256 hash of downloaded file does not match (expected: {kwargs['expected_sha256']}, actual: "
+                f"{sha256}): {url}"
+            )
+
+        logger.debug(f"Verified SHA-256 hash of downloaded file: {url}")
+
+    if "sha256_func" in kwargs:
+        kwargs["sha256_func"](sha256)
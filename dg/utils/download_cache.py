@@ -0,0 +1,569 @@
+#  Copyright 2020 IBM Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import contextlib
+import fcntl
+import hashlib
+import json
+import logging
+import os
+import pathlib
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+
+from typing import IO, Any, Callable, Final, Iterator, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DOWNLOAD_CACHE_MAX_SIZE: Final[int] = 4294967296  # 4 GiB
+TEMPORARY_FILE_MAX_AGE: Final[float] = 86400  # 1 day
+
+_download_cache: Union["DownloadCache", None] = None
+
+
+class DownloadCacheEntry:
+    """Cached download of a URL"""
+
+    def __init__(
+        self,
+        blob: str,
+        etag: Union[str, None],
+        file_name: str,
+        last_access_time: float,
+        last_modified: Union[str, None],
+        size: int,
+        url: str,
+    ):
+        self.blob = blob
+        self.etag = etag
+        self.file_name = file_name
+        self.last_access_time = last_access_time
+        self.last_modified = last_modified
+        self.size = size
+        self.url = url
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "blob": self.blob,
+            "etag": self.etag,
+            "file_name": self.file_name,
+            "last_access_time": self.last_access_time,
+            "last_modified": self.last_modified,
+            "size": self.size,
+            "url": self.url,
+        }
+
+
+class DownloadCache:
+    """Content-addressed cache of downloaded files
+
+    Downloaded files are stored as blobs named after the SHA-256 hash of
+    their contents (i.e., identical files downloaded from different URLs are
+    stored once). An index file associates cache keys (URL and request
+    headers) with blobs and the ETag or Last-Modified header of the
+    corresponding response, which are used to send conditional requests
+    (If-None-Match/If-Modified-Since). If the total size of all blobs
+    exceeds the maximum size, least recently used entries are evicted.
+
+    The index file is replaced atomically. Updates of the index are
+    serialized across threads and processes (e.g., several Data Gate CLI
+    processes downloading dependencies at the same time) by locking a lock
+    file (see _lock_index()).
+
+    Files downloaded to the temporary directory of the cache (see
+    create_temporary_file() and get_temporary_directory_path()) are moved or
+    hard-linked into the cache instead of being copied. Blobs and files
+    hard-linked to them must not be modified (including their permissions).
+    Thus, files which are passed to callers are copied from or into the
+    cache (see copy_file()).
+    """
+
+    def __init__(self, directory_path: pathlib.Path, max_size: int = DEFAULT_DOWNLOAD_CACHE_MAX_SIZE):
+        """Constructor
+
+        Parameters
+        ----------
+        directory_path
+            path of the cache directory
+        max_size
+            maximum total size of all blobs in bytes
+        """
+
+        self.directory_path = directory_path
+        self.max_size = max_size
+
+        self._index_lock_file: Union[IO[str], None] = None
+        self._lock = threading.RLock()
+
+    def clear(self):
+        """Removes all cached files"""
+
+        if not self.directory_path.exists():
+            return
+
+        with self._lock_index():
+            for path in self.directory_path.iterdir():
+                # the lock file is kept as other processes may wait for it
+                if path.is_dir():
+                    shutil.rmtree(path)
+                elif path.name != "index.lock":
+                    path.unlink()
+
+    @contextlib.contextmanager
+    def create_temporary_file(self) -> Iterator[IO[bytes]]:
+        """Creates a temporary file within the temporary directory of the
+        cache, which may be moved into the cache by passing its path to
+        store() (move=True)
+
+        The file must be closed before it is stored. It is removed when the
+        context is exited unless it was moved into the cache.
+
+        Returns
+        -------
+        Iterator[IO[bytes]]
+            temporary file
+        """
+
+        with tempfile.NamedTemporaryFile(
+            delete=False, dir=self.get_temporary_directory_path(), prefix="."
+        ) as temporary_file:
+            try:
+                yield temporary_file
+            finally:
+                temporary_file.close()
+                pathlib.Path(temporary_file.name).unlink(missing_ok=True)
+
+    def get_blob_path(self, entry: DownloadCacheEntry) -> pathlib.Path:
+        return self.directory_path / "blobs" / entry.blob[:2] / entry.blob
+
+    def get_entries(self) -> dict[str, DownloadCacheEntry]:
+        """Returns all cache entries
+
+        Returns
+        -------
+        dict[str, DownloadCacheEntry]
+            dictionary associating cache keys with cache entries
+        """
+
+        with self._lock:
+            return self._read_index()
+
+    def get_entry(self, key: str) -> Union[DownloadCacheEntry, None]:
+        """Returns the cache entry associated with the given key if its blob
+        exists
+
+        Parameters
+        ----------
+        key
+            cache key (see get_key())
+
+        Returns
+        -------
+        Union[DownloadCacheEntry, None]
+            cache entry or None if the URL was not cached
+        """
+
+        with self._lock:
+            entry = self._read_index().get(key)
+
+        return entry if (entry is not None) and self.get_blob_path(entry).exists() else None
+
+    def get_size(self) -> int:
+        """Returns the total size of all blobs
+
+        Returns
+        -------
+        int
+            total size of all blobs in bytes
+        """
+
+        with self._lock:
+            return sum(
+                path.stat().st_size
+                for path in (self.directory_path / "blobs").glob("*/*")
+                if not path.name.startswith(".")
+            )
+
+    def get_temporary_directory_path(self) -> pathlib.Path:
+        """Returns the path of the temporary directory of the cache, which is
+        located on the same file system as the blobs so that files downloaded
+        to it may be moved or hard-linked into the cache without copying them
+
+        Returns
+        -------
+        pathlib.Path
+            path of the temporary directory of the cache
+        """
+
+        temporary_directory_path = self.directory_path / "tmp"
+        temporary_directory_path.mkdir(exist_ok=True, parents=True)
+
+        return temporary_directory_path
+
+    @staticmethod
+    def get_key(url: str, headers: dict[str, str]) -> str:
+        """Returns the cache key of a URL requested with the given headers
+
+        Different representations of a resource may be requested using
+        request headers (e.g., "Accept: application/vnd.github.v3.raw").
+
+        Parameters
+        ----------
+        url
+            requested URL
+        headers
+            request headers
+
+        Returns
+        -------
+        str
+            cache key
+        """
+
+        return json.dumps([url, dict(sorted(headers.items()))]) if len(headers) != 0 else url
+
+    @staticmethod
+    def get_conditional_request_headers(entry: DownloadCacheEntry) -> dict[str, str]:
+        """Returns headers to be sent to validate the given cache entry
+
+        Parameters
+        ----------
+        entry
+            cache entry to be validated
+
+        Returns
+        -------
+        dict[str, str]
+            If-None-Match and/or If-Modified-Since headers
+        """
+
+        headers: dict[str, str] = {}
+
+        if entry.etag is not None:
+            headers["If-None-Match"] = entry.etag
+
+        if entry.last_modified is not None:
+            headers["If-Modified-Since"] = entry.last_modified
+
+        return headers
+
+    def prune(self, max_size: Union[int, None] = None) -> int:
+        """Evicts least recently used entries until the total size of all
+        blobs does not exceed the maximum size and removes unreferenced blobs
+
+        Parameters
+        ----------
+        max_size
+            maximum total size of all blobs in bytes (default: maximum size of
+            the cache)
+
+        Returns
+        -------
+        int
+            number of removed blobs
+        """
+
+        with self._lock_index():
+            index = self._read_index()
+            blobs: dict[str, int] = {}
+
+            for entry in index.values():
+                blobs[entry.blob] = entry.size
+
+            size = sum(blobs.values())
+
+            for key, entry in sorted(index.items(), key=lambda item: item[1].last_access_time):
+                if size <= (max_size if max_size is not None else self.max_size):
+                    break
+
+                del index[key]
+
+                if all(other_entry.blob != entry.blob for other_entry in index.values()):
+                    size -= blobs.pop(entry.blob)
+
+            removed_blob_count = 0
+
+            for path in (self.directory_path / "blobs").glob("*/*"):
+                # temporary files of blobs being stored are ignored
+                if not path.name.startswith(".") and (path.name not in blobs):
+                    path.unlink()
+                    removed_blob_count += 1
+
+            self._write_index(index)
+
+        # remove files left behind by interrupted downloads
+        for path in (self.directory_path / "tmp").glob("*"):
+            if path.is_file() and (time.time() - path.stat().st_mtime > TEMPORARY_FILE_MAX_AGE):
+                path.unlink(missing_ok=True)
+
+        return removed_blob_count
+
+    def store(
+        self,
+        key: str,
+        url: str,
+        path: pathlib.Path,
+        file_name: str,
+        etag: Union[str, None],
+        last_modified: Union[str, None],
+        sha256: Union[str, None] = None,
+        move: bool = False,
+        link: bool = False,
+    ):
+        """Stores a downloaded file in the cache (files exceeding the maximum
+        size of the cache are not stored)
+
+        The file is copied into the cache unless it shall be moved or
+        hard-linked. It is not written again if an identical file is already
+        cached.
+
+        Parameters
+        ----------
+        key
+            cache key (see get_key())
+        url
+            requested URL
+        path
+            path of the downloaded file
+        file_name
+            name of the downloaded file
+        etag
+            ETag header of the response
+        last_modified
+            Last-Modified header of the response
+        sha256
+            SHA-256 hash of the file (computed if not passed)
+        move
+            flag indicating whether the file shall be moved into the cache
+            (e.g., a file created by create_temporary_file())
+        link
+            flag indicating whether the file shall be hard-linked into the
+            cache (or copied if it cannot be hard-linked), which requires that
+            the file is not modified (e.g., a temporary file which is removed
+            after it was read)
+        """
+
+        size = path.stat().st_size
+
+        if size > self.max_size:
+            logger.debug(f"Not caching {url} as its size exceeds the maximum size of the download cache")
+
+            return
+
+        if sha256 is None:
+            sha256 = _get_sha256(path)
+
+        entry = DownloadCacheEntry(
+            blob=sha256,
+            etag=etag,
+            file_name=file_name,
+            last_access_time=time.time(),
+            last_modified=last_modified,
+            size=size,
+            url=url,
+        )
+
+        blob_path = self.get_blob_path(entry)
+
+        with self._lock_index():
+            if not blob_path.exists():
+                blob_path.parent.mkdir(exist_ok=True, parents=True)
+
+                if move:
+                    # temporary files are only readable by the current user
+                    os.chmod(path, 0o644)
+                    os.replace(path, blob_path)
+                elif link:
+                    link_or_copy_file(path, blob_path)
+                else:
+                    copy_file(path, blob_path)
+
+            index = self._read_index()
+            index[key] = entry
+
+            self._write_index(index)
+
+            if sum({other_entry.blob: other_entry.size for other_entry in index.values()}.values()) > self.max_size:
+                self.prune()
+
+    def touch(self, key: str):
+        """Marks the cache entry associated with the given key as recently
+        used
+
+        Parameters
+        ----------
+        key
+            cache key (see get_key())
+        """
+
+        with self._lock_index():
+            index = self._read_index()
+
+            if key in index:
+                index[key].last_access_time = time.time()
+
+                self._write_index(index)
+
+    def _get_index_file_path(self) -> pathlib.Path:
+        return self.directory_path / "index.json"
+
+    @contextlib.contextmanager
+    def _lock_index(self) -> Iterator[None]:
+        """Locks the index for reading and modifying it
+
+        The thread lock serializes threads of the current process. The lock
+        file is locked using flock() to serialize other processes using the
+        same cache directory. The lock is re-entrant (e.g., store() calls
+        prune()).
+        """
+
+        with self._lock:
+            if self._index_lock_file is not None:
+                # the lock file is already locked by the current thread
+                yield
+
+                return
+
+            self.directory_path.mkdir(exist_ok=True, parents=True)
+
+            with open(self.directory_path / "index.lock", "a") as lock_file:
+                # the lock is released when the lock file is closed
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                self._index_lock_file = lock_file
+
+                try:
+                    yield
+                finally:
+                    self._index_lock_file = None
+
+    def _read_index(self) -> dict[str, DownloadCacheEntry]:
+        index_file_path = self._get_index_file_path()
+
+        if not index_file_path.exists():
+            return {}
+
+        try:
+            return {key: DownloadCacheEntry(**value) for key, value in json.loads(index_file_path.read_text()).items()}
+        except (TypeError, ValueError):
+            logger.warning(f"Ignoring invalid download cache index: {index_file_path}")
+
+            return {}
+
+    def _write_index(self, index: dict[str, DownloadCacheEntry]):
+        index_file_path = self._get_index_file_path()
+        index_file_path.parent.mkdir(exist_ok=True, parents=True)
+
+        # replace the index atomically as it may be read by other processes
+        with tempfile.NamedTemporaryFile("w", delete=False, dir=index_file_path.parent) as temporary_file:
+            json.dump({key: entry.to_dict() for key, entry in index.items()}, temporary_file, indent=4)
+
+        os.replace(temporary_file.name, index_file_path)
+
+
+def copy_file(source_path: pathlib.Path, target_path: pathlib.Path):
+    """Copies a file to the given path
+
+    An existing file is replaced atomically. In contrast to
+    link_or_copy_file(), the copy may be modified (e.g., its permissions)
+    without modifying the source file.
+
+    Parameters
+    ----------
+    source_path
+        path of the file to be copied
+    target_path
+        path of the copy
+    """
+
+    _replace_file(target_path, lambda temporary_path: shutil.copyfile(source_path, temporary_path))
+
+
+def get_download_cache() -> Union[DownloadCache, None]:
+    """Returns the download cache used by dg.utils.download.download_file()
+    and dg.utils.download.download_file_into_buffer()
+
+    Returns
+    -------
+    Union[DownloadCache, None]
+        download cache or None if downloaded files are not cached
+    """
+
+    return _download_cache
+
+
+def link_or_copy_file(source_path: pathlib.Path, target_path: pathlib.Path):
+    """Hard-links a file to the given path (the file is copied if it cannot
+    be hard-linked, e.g., across file systems)
+
+    An existing file is replaced atomically (i.e., it is not overwritten in
+    place, which would modify other links of the same file).
+
+    Parameters
+    ----------
+    source_path
+        path of the file to be linked
+    target_path
+        path of the link
+    """
+
+    def link_or_copy(temporary_path: pathlib.Path):
+        try:
+            os.link(source_path, temporary_path)
+        except OSError:
+            shutil.copyfile(source_path, temporary_path)
+
+    _replace_file(target_path, link_or_copy)
+
+
+def set_download_cache(cache: Union[DownloadCache, None]):
+    """Sets the download cache used by dg.utils.download.download_file() and
+    dg.utils.download.download_file_into_buffer()
+
+    Parameters
+    ----------
+    cache
+        download cache or None if downloaded files shall not be cached
+    """
+
+    global _download_cache
+
+    _download_cache = cache
+
+
+def _get_sha256(path: pathlib.Path) -> str:
+    sha256 = hashlib.sha256()
+
+    with open(path, "rb") as file:
+        while len(chunk := file.read(1048576)) != 0:  # 1 MiB
+            sha256.update(chunk)
+
+    return sha256.hexdigest()
+
+
+def _replace_file(target_path: pathlib.Path, create_file: Callable[[pathlib.Path], None]):
+    """Creates a file at a temporary path next to the given path and replaces
+    the file at the given path atomically (i.e., a partially written file is
+    never visible at the given path and an existing file is not overwritten
+    in place, which would modify other links of the same file)"""
+
+    temporary_path = target_path.with_name(f".{target_path.name}.{uuid.uuid4().hex}")
+
+    try:
+        create_file(temporary_path)
+        os.replace(temporary_path, target_path)
+    finally:
+        temporary_path.unlink(missing_ok=True)
@@ -0,0 +1,145 @@
+#  Copyright 2020 IBM Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import http.cookiejar
+import threading
+
+from typing import Any, Final, Union
+
+import requests
+import requests.adapters
+
+from urllib3.util.retry import Retry
+
+import dg.utils.network
+
+DEFAULT_CONNECT_TIMEOUT: Final[float] = 10
+DEFAULT_MAX_POOL_SIZE: Final[int] = 16
+DEFAULT_READ_TIMEOUT: Final[float] = 60
+DEFAULT_RETRY_COUNT: Final[int] = 3
+
+_http_sessions: dict[bool, "HTTPSession"] = {}
+_http_sessions_lock = threading.Lock()
+
+
+class HTTPSession(requests.Session):
+    """requests session with keep-alive connection pools, default timeouts,
+    retries, and a fixed TLS verification policy
+
+    Connections are pooled per host and reused by subsequent requests (i.e.,
+    TCP and TLS handshakes are only performed once per connection). Requests
+    using idempotent methods are retried if a connection cannot be
+    established or if a server responds with 502, 503, or 504. Timeouts and
+    the TLS verification policy of the session apply to all requests unless
+    they are passed explicitly.
+
+    Cookies are rejected as the session is shared by requests to unrelated
+    hosts (i.e., a cookie set by one host must not be stored and sent along
+    with later requests of other flows).
+    """
+
+    def __init__(
+        self,
+        verify: bool = True,
+        timeout: Union[float, tuple[float, float]] = (DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT),
+        max_pool_size: int = DEFAULT_MAX_POOL_SIZE,
+        retry_count: int = DEFAULT_RETRY_COUNT,
+    ):
+        """Constructor
+
+        Parameters
+        ----------
+        verify
+            flag indicating whether TLS certificates shall be verified
+        timeout
+            connect and read timeout in seconds
+        max_pool_size
+            maximum number of hosts with pooled connections and maximum number
+            of pooled connections per host
+        retry_count
+            maximum number of retries of a request
+        """
+
+        super().__init__()
+
+        self.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+        self.timeout = timeout
+        self.verify = verify
+
+        # POST requests are not retried as they are not idempotent (see
+        # Retry.DEFAULT_METHOD_WHITELIST)
+        adapter = requests.adapters.HTTPAdapter(
+            max_retries=Retry(
+                total=retry_count,
+                backoff_factor=0.5,
+                raise_on_status=False,
+                status_forcelist=[502, 503, 504],
+            ),
+            pool_connections=max_pool_size,
+            pool_maxsize=max_pool_size,
+        )
+
+        self.mount("http://", adapter)
+        self.mount("https://", adapter)
+
+    def request(
+        self, method: Union[str, bytes], url: Union[str, bytes], *args: Any, **kwargs: Any
+    ) -> requests.Response:
+        kwargs.setdefault("timeout", self.timeout)
+
+        # requests prefers the CA bundle configured by REQUESTS_CA_BUNDLE over
+        # the verify attribute of a session unless verify is passed
+        kwargs.setdefault("verify", self.verify)
+
+        return super().request(method, url, *args, **kwargs)
+
+
+def close_http_sessions():
+    """Closes the shared HTTP sessions and their pooled connections (e.g.,
+    when the servers they are connected to are stopped)
+
+    A new session is created by a subsequent call of get_http_session().
+    """
+
+    with _http_sessions_lock:
+        for http_session in _http_sessions.values():
+            http_session.close()
+
+        _http_sessions.clear()
+
+
+def get_http_session(verify: bool = True) -> HTTPSession:
+    """Returns the HTTP session shared by all network I/O of the Data Gate
+    CLI
+
+    Parameters
+    ----------
+    verify
+        flag indicating whether TLS certificates shall be verified (e.g.,
+        FYRE and OpenShift clusters use self-signed certificates)
+
+    Returns
+    -------
+    HTTPSession
+        shared HTTP session
+    """
+
+    with _http_sessions_lock:
+        if verify not in _http_sessions:
+            if not verify:
+                dg.utils.network.disable_insecure_request_warning()
+
+            _http_sessions[verify] = HTTPSession(verify=verify)
+
+        return _http_sessions[verify]
@@ -132,6 +132,64 @@ def execute_command_without_check(
     )
 
 
+async def execute_command_async(
+    program: pathlib.Path,
+    args: list[str],
+    env: Optional[dict[str, str]] = None,
+    stdout_callback: Optional[Callable[[str], None]] = None,
+    stderr_callback: Optional[Callable[[str], None]] = None,
+) -> ProcessResult:
+    """Executes a process within a running event loop and captures its
+    output without checking its return code
+
+    In contrast to execute_command(), this coroutine may be awaited
+    concurrently (e.g., to execute a command for several OpenShift clusters
+    at the same time).
+
+    Parameters
+    ----------
+    program
+        path of the executable
+    args
+        arguments to be passed to the executable
+    env
+        environment variables of the process (the environment variables of the
+        current process are inherited if None)
+    stdout_callback
+        callback invoked when a line was read from stdout
+    stderr_callback
+        callback invoked when a line was read from stderr
+
+    Returns
+    -------
+    ProcessResult
+        object storing the return code and captured output
+    """
+
+    logging.info(f"Executing command: {' '.join([str(program)] + args)}")
+
+    stderr_buffer: list[str] = []
+    stdout_buffer: list[str] = []
+
+    def process_stderr_output(line: str):
+        stderr_buffer.append(line.rstrip())
+
+        if stderr_callback is not None:
+            stderr_callback(line)
+
+    def process_stdout_output(line: str):
+        stdout_buffer.append(line.rstrip())
+
+        if stdout_callback is not None:
+            stdout_callback(line)
+
+    return_code = await _create_subprocess_and_capture_output(
+        program, args, process_stdout_output, process_stderr_output, env=env
+    )
+
+    return ProcessResult(return_code, "\n".join(stderr_buffer), "\n".join(stdout_buffer))
+
+
 async def _create_subprocess(program: pathlib.Path, args: list[str]) -> int:
     """Executes a process
 
@@ -154,7 +212,11 @@ async def _create_subprocess(program: pathlib.Path, args: list[str]) -> int:
 
 
 async def _create_subprocess_and_capture_output(
-    program: pathlib.Path, args: list[str], stdout_callback, stderr_callback
+    program: pathlib.Path,
+    args: list[str],
+    stdout_callback,
+    stderr_callback,
+    env: Optional[dict[str, str]] = None,
 ) -> int:
     """Executes a process and captures its output to stdout/stderr
 
@@ -168,6 +230,9 @@ async def _create_subprocess_and_capture_output(
         callback invoked when a line was read from stdout
     stderr_callback
         callback invoked when a line was read from stderr
+    env
+        environment variables of the process (the environment variables of the
+        current process are inherited if None)
 
     Returns
     -------
@@ -177,6 +242,7 @@ async def _create_subprocess_and_capture_output(
 
     process = await asyncio.create_subprocess_exec(
         *([str(program)] + args),
+        env=env,
         stderr=asyncio.subprocess.PIPE,
         stdout=asyncio.subprocess.PIPE,
     )
@@ -12,35 +12,857 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import asyncio
+import atexit
+import base64
+import collections
+import datetime
+import hashlib
+import io
 import logging
 import pathlib
+import posixpath
+import re as regex
+import shlex
+import socket
+import subprocess
+import sys
+import tarfile
+import tempfile
+import time
+import uuid
 
-from typing import Union
+from typing import Any, Callable, Final, Union
 
 import asyncssh
 import click
 import colorama
 
+from tabulate import tabulate
+
 from dg.lib.error import DataGateCLIException
 
 asyncssh.set_log_level(logging.WARNING)
 
+DEFAULT_IDLE_TIMEOUT: Final[float] = 60
+DEFAULT_KEEPALIVE_INTERVAL: Final[float] = 15
+DEFAULT_SSH_AGENT_LIFETIME: Final[float] = 600
+SSH_AGENT_START_TIMEOUT: Final[float] = 10
+
+
+OutputCallback = Callable[[str, bool], None]
+SSHHost = tuple[str, str]
+
+
+class RemoteBatchStepResult:
+    """Result of a step of a remote batch"""
+
+    def __init__(self, name: str, exit_code: int, duration: float):
+        self.duration = duration
+        self.exit_code = exit_code
+        self.name = name
+
+
+class RemoteBatchResult:
+    """Result of executing a remote batch"""
+
+    def __init__(self, step_names: list[str], step_results: list[RemoteBatchStepResult], exit_code: int, output: str):
+        self.exit_code = exit_code
+        self.output = output
+        self.step_names = step_names
+        self.step_results = step_results
+
+    def get_failed_step_name(self) -> Union[str, None]:
+        """Returns the name of the step that failed
+
+        Returns
+        -------
+        Union[str, None]
+            name of the step that failed, "transfer" if the batch could not be
+            transferred, or None if no step failed
+        """
+
+        if self.exit_code == 0:
+            return None
+
+        for step_result in self.step_results:
+            if step_result.exit_code != 0:
+                return step_result.name
+
+        if len(self.step_results) == 0:
+            return "transfer"
+
+        # the batch was aborted while executing the step following the last
+        # completed step (e.g., because it was killed)
+        return self.step_names[len(self.step_results)] if len(self.step_results) < len(self.step_names) else "unknown"
+
+    def get_summary(self) -> str:
+        """Returns the exit code and duration of each executed step
+
+        Returns
+        -------
+        str
+            exit code and duration of each executed step
+        """
+
+        return ", ".join(
+            f"{step_result.name}: {step_result.exit_code} ({step_result.duration:.2f}s)"
+            for step_result in self.step_results
+        )
+
+
+class RemoteBatch:
+    """Sequence of commands (steps) executed on a remote host in a single
+    session
+
+    A shell script running the steps and any payload files required by the
+    steps are shipped to the remote host as a single compressed archive
+    passed to the session using stdin. The exit code and duration of each
+    step are reported using marker lines, which are removed from the output.
+    Execution stops at the first failing step.
+    """
+
+    def __init__(self):
+        self._id = uuid.uuid4().hex
+        self._payload_file_paths: list[pathlib.Path] = []
+        self._steps: list[tuple[str, str]] = []
+
+    def add_payload_file(self, path: pathlib.Path):
+        """Adds a file that is extracted to the working directory of the
+        session before executing the steps
+
+        Parameters
+        ----------
+        path
+            path of the file
+        """
+
+        self._payload_file_paths.append(path)
+
+    def add_step(self, name: str, command: str):
+        """Adds a step
+
+        Parameters
+        ----------
+        name
+            name of the step used for reporting
+        command
+            shell command executed by the step
+        """
+
+        self._steps.append((name, command))
+
+    def get_command(self) -> str:
+        """Returns the command extracting the archive passed using stdin and
+        executing the shell script
+
+        Returns
+        -------
+        str
+            command to be executed on the remote host
+        """
+
+        script_name = self._get_script_name()
+
+        return (
+            f"base64 --decode | tar --extract --gzip --file - && "
+            f"{{ sh {script_name}; __dg_exit_code=$?; rm -f {script_name}; exit $__dg_exit_code; }}"
+        )
+
+    def get_input(self) -> str:
+        """Returns the base64-encoded compressed archive containing the shell
+        script and payload files
+
+        Returns
+        -------
+        str
+            base64-encoded compressed archive
+        """
+
+        archive = io.BytesIO()
+
+        with tarfile.open(fileobj=archive, mode="w:gz") as tar_file:
+            for payload_file_path in self._payload_file_paths:
+                tar_file.add(payload_file_path, arcname=payload_file_path.name)
+
+            script = self.get_script().encode()
+            script_tar_info = tarfile.TarInfo(self._get_script_name())
+            script_tar_info.mode = 0o700
+            script_tar_info.size = len(script)
+
+            tar_file.addfile(script_tar_info, io.BytesIO(script))
+
+        return base64.b64encode(archive.getvalue()).decode() + "\n"
+
+    def get_script(self) -> str:
+        """Returns the shell script executing the steps
+
+        Returns
+        -------
+        str
+            shell script executing the steps
+        """
+
+        lines = [
+            "__dg_run_step() {",
+            "  __dg_start_time=$(date +%s%N)",
+            '  ( eval "$2" )',
+            "  __dg_exit_code=$?",
+            f'  printf \'%s %s %s %s\\n\' {self._get_marker()} "$1" "$__dg_exit_code" '
+            '"$(( ($(date +%s%N) - __dg_start_time) / 1000000 ))"',
+            "  return $__dg_exit_code",
+            "}",
+        ]
+
+        for index, (_, command) in enumerate(self._steps):
+            lines.append(f"__dg_run_step {index} {shlex.quote(command)} || exit $?")
+
+        return "\n".join(lines) + "\n"
+
+    def get_step_names(self) -> list[str]:
+        return [name for name, _ in self._steps]
+
+    def parse_output(self, exit_code: int, output: str) -> RemoteBatchResult:
+        """Parses the output of the shell script
+
+        Parameters
+        ----------
+        exit_code
+            exit code of the session
+        output
+            output of the session
+
+        Returns
+        -------
+        RemoteBatchResult
+            result of executing the batch
+        """
+
+        step_names = self.get_step_names()
+        step_results: list[RemoteBatchStepResult] = []
+        marker_pattern = f"{regex.escape(self._get_marker())} (\\d+) (\\d+) (\\d+)\\n?"
+
+        for match in regex.finditer(marker_pattern, output):
+            step_results.append(
+                RemoteBatchStepResult(step_names[int(match.group(1))], int(match.group(2)), int(match.group(3)) / 1000)
+            )
+
+        return RemoteBatchResult(step_names, step_results, exit_code, regex.sub(marker_pattern, "", output))
+
+    def _get_marker(self) -> str:
+        return f"@@dg-batch-{self._id}@@"
+
+    def _get_script_name(self) -> str:
+        return f".dg-batch-{self._id}.sh"
+
+
+class RemoteExecutionRecord:
+    """Timing, exit status, and byte counts of a command or batch step
+    executed on a remote host"""
+
+    def __init__(
+        self,
+        hostname: str,
+        command: str,
+        exit_code: int,
+        duration: float,
+        input_size: Union[int, None] = None,
+        output_size: Union[int, None] = None,
+    ):
+        self.command = command
+        self.duration = duration
+        self.exit_code = exit_code
+        self.hostname = hostname
+        self.input_size = input_size
+        self.output_size = output_size
+
+
+class RecordedRemoteExecution:
+    """Command being executed on a remote host whose output is appended to
+    the log file of the host (see RemoteExecutionRecorder.start())"""
+
+    def __init__(self, recorder: "RemoteExecutionRecorder", hostname: str, command: str, input_size: int):
+        self._command = command
+        self._hostname = hostname
+        self._input_size = input_size
+        self._log_file = open(recorder.get_log_file_path(hostname), "a")
+        self._output_size = 0
+        self._recorder = recorder
+        self._start_time = time.monotonic()
+
+        self._log_file.write(f"==> [{datetime.datetime.now().isoformat(timespec='seconds')}] {command}\n")
+
+    def finish(self, exit_code: int):
+        """Stores the record of the execution and closes the log file
+
+        Parameters
+        ----------
+        exit_code
+            exit code of the command
+        """
+
+        duration = time.monotonic() - self._start_time
+
+        self._log_file.write(f"\n<== exit code {exit_code} after {duration:.2f}s\n\n")
+        self._log_file.close()
+        self._recorder.add_record(
+            RemoteExecutionRecord(
+                self._hostname, self._command, exit_code, duration, self._input_size, self._output_size
+            )
+        )
+
+    def write(self, chunk: str):
+        """Appends a chunk of output to the log file
+
+        Parameters
+        ----------
+        chunk
+            chunk of output (stdout or stderr)
+        """
+
+        self._log_file.write(chunk)
+        self._output_size += len(chunk.encode())
+
+
+class RemoteExecutionRecorder:
+    """Records timing, exit status, and byte counts of commands executed on
+    remote hosts and writes the full output of each host to its own log file
+    within a run directory
+
+    Recorders are passed to RemoteClient objects, which record each executed
+    command and each step of an executed batch.
+    """
+
+    def __init__(self, run_directory_path: pathlib.Path):
+        """Constructor
+
+        Parameters
+        ----------
+        run_directory_path
+            path of the directory log files are written to (created if it does
+            not exist)
+        """
+
+        run_directory_path.mkdir(exist_ok=True, parents=True)
+
+        self.records: list[RemoteExecutionRecord] = []
+        self.run_directory_path = run_directory_path
+
+    def add_record(self, record: RemoteExecutionRecord):
+        self.records.append(record)
+
+    def get_log_file_path(self, hostname: str) -> pathlib.Path:
+        """Returns the path of the log file of the given host
+
+        Parameters
+        ----------
+        hostname
+            name of the remote host
+
+        Returns
+        -------
+        pathlib.Path
+            path of the log file of the given host
+        """
+
+        return self.run_directory_path / (regex.sub("[^\\w.-]", "_", hostname) + ".log")
+
+    def get_summary(self, max_record_count: Union[int, None] = None) -> str:
+        """Returns the records as a pretty-printed table sorted by duration
+        (descending)
+
+        Parameters
+        ----------
+        max_record_count
+            maximum number of records to be included (all records are included
+            if None)
+
+        Returns
+        -------
+        str
+            records as a pretty-printed table
+        """
+
+        records = sorted(self.records, key=lambda record: record.duration, reverse=True)[:max_record_count]
+
+        return tabulate(
+            [
+                [
+                    record.hostname,
+                    record.command if len(record.command) <= 60 else record.command[:57] + "...",
+                    record.exit_code,
+                    f"{record.duration:.2f}s",
+                    record.input_size if record.input_size is not None else "",
+                    record.output_size if record.output_size is not None else "",
+                ]
+                for record in records
+            ],
+            headers=["host", "command", "exit code", "duration", "input [B]", "output [B]"],
+        )
+
+    def log(self, hostname: str, text: str):
+        """Appends the given text to the log file of the given host
+
+        Parameters
+        ----------
+        hostname
+            name of the remote host
+        text
+            text to be appended
+        """
+
+        with open(self.get_log_file_path(hostname), "a") as log_file:
+            log_file.write(text)
+
+    def start(self, hostname: str, command: str, input_size: int = 0) -> RecordedRemoteExecution:
+        """Starts recording the execution of a command on a remote host
+
+        Parameters
+        ----------
+        hostname
+            name of the remote host
+        command
+            executed command
+        input_size
+            number of bytes passed to the command using stdin
+
+        Returns
+        -------
+        RecordedRemoteExecution
+            object receiving the output of the command
+        """
+
+        return RecordedRemoteExecution(self, hostname, command, input_size)
+
+
+class PooledSSHConnection:
+    """SSH connection managed by SSHConnectionPool"""
+
+    def __init__(
+        self,
+        connection: asyncssh.SSHClientConnection,
+        loop: asyncio.AbstractEventLoop,
+        jump_host: Union[SSHHost, None] = None,
+        is_relayed: bool = False,
+    ):
+        self.connection = connection
+        self.idle_timer: Union[asyncio.TimerHandle, None] = None
+        self.is_known_hosts_loaded = False
+        self.is_relayed = is_relayed
+        self.jump_host = jump_host
+        self.known_hosts: Union[asyncssh.SSHKnownHosts, None] = None
+        self.loop = loop
+        self.reference_count = 0
+
+
+class SSHConnectionPool:
+    """Pool of authenticated SSH connections keyed by host and user
+
+    Many concurrent sessions and SFTP channels may be multiplexed over a
+    single pooled connection. Thus, a full SSH handshake is only required
+    when a host is contacted for the first time. Connections that are not
+    borrowed by any client are closed after an idle timeout.
+
+    Hosts that are only reachable from another host (e.g., worker nodes of a
+    FYRE cluster, which are only reachable from the infrastructure node) are
+    connected to through a tunnel over the pooled connection to that jump
+    host. Such connections are authenticated with the private keys of the
+    local user (including keys held by a local SSH agent); private keys are
+    never read from the jump host. Host keys are checked against the known
+    hosts of the user on the jump host.
+
+    If the user on the jump host has no known hosts file or if no private key
+    of the local user is authorized on the remote host, commands are relayed
+    through the ssh client of the jump host instead (see is_relayed() and
+    get_relay_command()). In this case, the pooled connection to the jump
+    host is shared.
+    """
+
+    def __init__(
+        self,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+        keepalive_interval: float = DEFAULT_KEEPALIVE_INTERVAL,
+        connect_options: Union[dict[str, Any], None] = None,
+    ):
+        """Constructor
+
+        Parameters
+        ----------
+        idle_timeout
+            number of seconds after which a connection that is not borrowed by
+            any client is closed
+        keepalive_interval
+            number of seconds between keep-alive requests sent to remote hosts
+        connect_options
+            additional options passed to asyncssh.connect() when connecting to
+            hosts directly (e.g., port)
+        """
+
+        self._connect_options = connect_options if connect_options is not None else {}
+        self._connections: dict[tuple[SSHHost, Union[SSHHost, None]], PooledSSHConnection] = {}
+        self._idle_timeout = idle_timeout
+        self._is_close_at_exit_registered = False
+        self._keepalive_interval = keepalive_interval
+        self._locks: dict[tuple[asyncio.AbstractEventLoop, SSHHost, Union[SSHHost, None]], asyncio.Lock] = {}
+        self._ssh_agent_lifetime = DEFAULT_SSH_AGENT_LIFETIME
+        self._ssh_agent_socket_path: Union[pathlib.Path, None] = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def acquire(
+        self, hostname: str, username: str = "root", jump_host: Union[SSHHost, None] = None
+    ) -> asyncssh.SSHClientConnection:
+        """Borrows a connection to the given host from the pool
+
+        A new connection is established if there is no open connection to the
+        given host for the given user. Connections must be returned by calling
+        release().
+
+        Parameters
+        ----------
+        hostname
+            name of the remote host
+        username
+            name of the user on the remote host
+        jump_host
+            hostname and username of the host through which the remote host is
+            reached (the remote host is connected to directly if None)
+
+        Returns
+        -------
+        asyncssh.SSHClientConnection
+            authenticated SSH connection
+        """
+
+        key = ((hostname, username), jump_host)
+        loop = asyncio.get_running_loop()
+
+        async with self._get_lock(loop, key):
+            pooled_connection = self._connections.get(key)
+
+            if (pooled_connection is not None) and (
+                (pooled_connection.loop is not loop) or pooled_connection.connection.is_closed()
+            ):
+                self._discard(key)
+                pooled_connection = None
+
+            if pooled_connection is None:
+                if self._ssh_agent_socket_path is not None:
+                    pooled_connection = await self._connect_through_ssh_agent(hostname, username, jump_host)
+                elif jump_host is not None:
+                    pooled_connection = await self._connect_through_jump_host(hostname, username, jump_host)
+                else:
+                    pooled_connection = await self._connect(hostname, username)
+
+                self._connections[key] = pooled_connection
+                self._register_close_at_exit()
+
+            if pooled_connection.idle_timer is not None:
+                pooled_connection.idle_timer.cancel()
+                pooled_connection.idle_timer = None
+
+            pooled_connection.reference_count += 1
+
+            return pooled_connection.connection
+
+    async def close(self):
+        """Closes all pooled connections established within the running event
+        loop"""
+
+        loop = asyncio.get_running_loop()
+
+        # close tunnelled connections before the connections they are
+        # tunnelled through
+        for key in sorted(
+            [key for key, pooled_connection in self._connections.items() if pooled_connection.loop is loop],
+            key=lambda key: key[1] is None,
+        ):
+            if key in self._connections:
+                pooled_connection = self._connections[key]
+
+                self._discard(key)
+
+                if not pooled_connection.is_relayed:
+                    await pooled_connection.connection.wait_closed()
+
+    def get_connection_keys(self) -> list[tuple[SSHHost, Union[SSHHost, None]]]:
+        """Returns the keys of pooled connections
+
+        Returns
+        -------
+        list[tuple[SSHHost, Union[SSHHost, None]]]
+            remote host and jump host of each pooled connection
+        """
+
+        return list(self._connections.keys())
+
+    def is_relayed(self, hostname: str, username: str = "root", jump_host: Union[SSHHost, None] = None) -> bool:
+        """Returns whether commands for the given host must be relayed through
+        the ssh client of the jump host (see get_relay_command())
+
+        Parameters
+        ----------
+        hostname
+            name of the remote host
+        username
+            name of the user on the remote host
+        jump_host
+            hostname and username of the host through which the remote host is
+            reached
+
+        Returns
+        -------
+        bool
+            true, if the connection borrowed by calling acquire() is the
+            connection to the jump host and commands must be relayed
+        """
+
+        pooled_connection = self._connections.get(((hostname, username), jump_host))
+
+        return (pooled_connection is not None) and pooled_connection.is_relayed
+
+    def release(self, hostname: str, username: str = "root", jump_host: Union[SSHHost, None] = None):
+        """Returns a connection borrowed by calling acquire() to the pool
+
+        Parameters
+        ----------
+        hostname
+            name of the remote host
+        username
+            name of the user on the remote host
+        jump_host
+            hostname and username of the host through which the remote host is
+            reached
+        """
+
+        key = ((hostname, username), jump_host)
+        pooled_connection = self._connections.get(key)
+
+        if pooled_connection is None:
+            return
+
+        pooled_connection.reference_count -= 1
+
+        if (pooled_connection.reference_count == 0) and not pooled_connection.loop.is_closed():
+            pooled_connection.idle_timer = pooled_connection.loop.call_later(
+                self._idle_timeout, self._close_if_idle, key, pooled_connection
+            )
+
+    def use_ssh_agent(self, socket_path: pathlib.Path, lifetime: float = DEFAULT_SSH_AGENT_LIFETIME):
+        """Establishes new connections through the persistent Data Gate SSH
+        agent listening on the given Unix domain socket
+
+        The agent holds authenticated connections to recently used hosts and
+        multiplexes sessions of separate Data Gate CLI processes over them,
+        similar to an OpenSSH ControlMaster. It is started in the background
+        if it is not running.
+
+        Parameters
+        ----------
+        socket_path
+            path of the Unix domain socket the agent listens on
+        lifetime
+            number of seconds after which an agent started by this pool exits
+            if it is not used
+        """
+
+        self._ssh_agent_lifetime = lifetime
+        self._ssh_agent_socket_path = socket_path
+
+    def _close_at_exit(self):
+        for key, pooled_connection in sorted(self._connections.items(), key=lambda item: item[0][1] is None):
+            if key not in self._connections:
+                continue
+
+            self._discard(key)
+
+            if not (
+                pooled_connection.is_relayed
+                or pooled_connection.loop.is_closed()
+                or pooled_connection.loop.is_running()
+            ):
+                pooled_connection.loop.run_until_complete(pooled_connection.connection.wait_closed())
+
+    def _close_if_idle(self, key: tuple[SSHHost, Union[SSHHost, None]], pooled_connection: PooledSSHConnection):
+        if (self._connections.get(key) is pooled_connection) and (pooled_connection.reference_count == 0):
+            logging.debug(f"Closing idle SSH connection to {key[0][1]}@{key[0][0]}")
+            self._discard(key)
+
+    async def _connect(self, hostname: str, username: str) -> PooledSSHConnection:
+        logging.debug(f"Establishing SSH connection to {username}@{hostname}")
+
+        return PooledSSHConnection(
+            await asyncssh.connect(
+                hostname, keepalive_interval=self._keepalive_interval, username=username, **self._connect_options
+            ),
+            asyncio.get_running_loop(),
+        )
+
+    async def _connect_through_jump_host(self, hostname: str, username: str, jump_host: SSHHost) -> PooledSSHConnection:
+        logging.debug(f"Establishing SSH connection to {username}@{hostname} through {jump_host[1]}@{jump_host[0]}")
+
+        jump_host_connection = await self.acquire(jump_host[0], jump_host[1])
+
+        try:
+            pooled_jump_host_connection = self._connections[(jump_host, None)]
+
+            if not pooled_jump_host_connection.is_known_hosts_loaded:
+                await self._load_jump_host_known_hosts(pooled_jump_host_connection, jump_host)
+
+            if pooled_jump_host_connection.known_hosts is None:
+                # host keys could not be checked
+                logging.info(
+                    f"No known hosts file (~/.ssh/known_hosts) of {jump_host[1]}@{jump_host[0]} found - relaying "
+                    f"commands for {hostname} through ssh on {jump_host[0]}"
+                )
+
+                return PooledSSHConnection(jump_host_connection, asyncio.get_running_loop(), jump_host, True)
+
+            try:
+                return PooledSSHConnection(
+                    await asyncssh.connect(
+                        hostname,
+                        keepalive_interval=self._keepalive_interval,
+                        known_hosts=pooled_jump_host_connection.known_hosts,
+                        tunnel=jump_host_connection,
+                        username=username,
+                    ),
+                    asyncio.get_running_loop(),
+                    jump_host,
+                )
+            except asyncssh.PermissionDenied:
+                logging.info(
+                    f"Authentication of {username}@{hostname} with the private SSH keys of the local user failed - "
+                    f"relaying commands for {hostname} through ssh on {jump_host[0]}"
+                )
+
+                return PooledSSHConnection(jump_host_connection, asyncio.get_running_loop(), jump_host, True)
+        except Exception:
+            self.release(jump_host[0], jump_host[1])
+
+            raise
+
+    async def _connect_through_ssh_agent(
+        self, hostname: str, username: str, jump_host: Union[SSHHost, None]
+    ) -> PooledSSHConnection:
+        if self._ssh_agent_socket_path is None:
+            raise DataGateCLIException("SSH agent is not enabled")
+
+        logging.debug(f"Establishing SSH connection to {username}@{hostname} through SSH agent")
+
+        agent_username = get_ssh_agent_username(hostname, username, jump_host)
+
+        try:
+            connection = await connect_to_ssh_agent(self._ssh_agent_socket_path, agent_username)
+        except OSError:
+            start_ssh_agent(self._ssh_agent_socket_path, self._ssh_agent_lifetime)
+
+            connection = await connect_to_ssh_agent(
+                self._ssh_agent_socket_path, agent_username, timeout=SSH_AGENT_START_TIMEOUT
+            )
+
+        return PooledSSHConnection(connection, asyncio.get_running_loop())
+
+    def _discard(self, key: tuple[SSHHost, Union[SSHHost, None]]):
+        pooled_connection = self._connections.pop(key)
+
+        if pooled_connection.idle_timer is not None:
+            pooled_connection.idle_timer.cancel()
+
+        # the connection to the jump host of a relayed connection is closed
+        # when it is discarded itself
+        if not (pooled_connection.is_relayed or pooled_connection.loop.is_closed()):
+            pooled_connection.connection.close()
+
+        if pooled_connection.jump_host is not None:
+            self.release(pooled_connection.jump_host[0], pooled_connection.jump_host[1])
+
+    def _get_lock(self, loop: asyncio.AbstractEventLoop, key: tuple[SSHHost, Union[SSHHost, None]]) -> asyncio.Lock:
+        # asyncio locks must not be shared between event loops
+        for lock_key in [lock_key for lock_key in self._locks.keys() if lock_key[0].is_closed()]:
+            self._locks.pop(lock_key)
+
+        return self._locks.setdefault((loop, key[0], key[1]), asyncio.Lock())
+
+    async def _load_jump_host_known_hosts(self, pooled_connection: PooledSSHConnection, jump_host: SSHHost):
+        """Loads the known hosts of the user on a jump host
+
+        The known hosts are not set if the user on the jump host has no known
+        hosts file.
+
+        Parameters
+        ----------
+        pooled_connection
+            pooled connection to the jump host
+        jump_host
+            hostname and username of the jump host
+        """
+
+        async with pooled_connection.connection.start_sftp_client() as sftp_client:
+            if await sftp_client.exists(".ssh/known_hosts"):
+                async with sftp_client.open(".ssh/known_hosts") as known_hosts_file:
+                    pooled_connection.known_hosts = asyncssh.import_known_hosts(await known_hosts_file.read())
+            else:
+                logging.debug(f"No known hosts file (~/.ssh/known_hosts) of {jump_host[1]}@{jump_host[0]} found")
+
+        pooled_connection.is_known_hosts_loaded = True
+
+    def _register_close_at_exit(self):
+        if not self._is_close_at_exit_registered:
+            atexit.register(self._close_at_exit)
+
+            self._is_close_at_exit_registered = True
+
 
 class RemoteClient:
     """Class providing basic SSH functionality based on the asyncssh
-    package"""
+    package
+
+    Connections are borrowed from an SSH connection pool. Thus, several
+    clients for the same host share a single authenticated connection and
+    commands may be executed concurrently.
+
+    If a recorder is passed, the timing, exit status, and byte counts of
+    each executed command are recorded and its output is written to the log
+    file of the host.
+    """
 
-    def __init__(self, hostname: str):
+    def __init__(
+        self,
+        hostname: str,
+        username: str = "root",
+        connection_pool: Union[SSHConnectionPool, None] = None,
+        jump_host: Union[SSHHost, None] = None,
+        recorder: Union[RemoteExecutionRecorder, None] = None,
+    ):
         """Constructor
 
         Parameters
         ----------
         hostname
             name of the remote host to which an SSH connection shall be established
+        username
+            name of the user on the remote host
+        connection_pool
+            SSH connection pool (the shared pool is used if None)
+        jump_host
+            hostname and username of the host through which the remote host is
+            reached (the remote host is connected to directly if None)
+        recorder
+            recorder of executed commands (commands are not recorded if None)
         """
 
         self._connection: Union[asyncssh.SSHClientConnection, None] = None
+        self._connection_pool = connection_pool if connection_pool is not None else ssh_connection_pool
         self._hostname = hostname
+        self._is_relayed = False
+        self._jump_host = jump_host
+        self._recorder = recorder
+        self._username = username
 
     async def __aenter__(self):
         return self
@@ -51,19 +873,97 @@ class RemoteClient:
     async def connect(self):
         """Connects to the remote host"""
 
-        self._connection = await asyncssh.connect(self._hostname, username="root")
+        if self._connection is None:
+            self._connection = await self._connection_pool.acquire(self._hostname, self._username, self._jump_host)
+            self._is_relayed = self._connection_pool.is_relayed(self._hostname, self._username, self._jump_host)
+
+    def create_tunnelled_client(
+        self, hostname: str, username: str = "core", recorder: Union[RemoteExecutionRecorder, None] = None
+    ) -> "RemoteClient":
+        """Returns a client for a host that is only reachable from the remote
+        host of this client (e.g., a worker node reachable from the
+        infrastructure node of a FYRE cluster)
+
+        Commands executed by the returned client run natively on the given host
+        using a connection tunnelled through the connection of this client. If
+        the connection cannot be established (see SSHConnectionPool), commands
+        are relayed through the ssh client of the remote host of this client.
+
+        Parameters
+        ----------
+        hostname
+            name of the host only reachable from the remote host of this client
+        username
+            name of the user on the host only reachable from the remote host of
+            this client
+        recorder
+            recorder of commands executed by the returned client (commands are
+            not recorded if None)
+
+        Returns
+        -------
+        RemoteClient
+            client for the given host
+        """
+
+        return RemoteClient(
+            hostname,
+            username,
+            connection_pool=self._connection_pool,
+            jump_host=(self._hostname, self._username),
+            recorder=recorder,
+        )
+
+    def get_hostname(self) -> str:
+        return self._hostname
 
     async def disconnect(self):
-        """Disconnects from the remote host"""
+        """Disconnects from the remote host
+
+        The connection is returned to the connection pool and closed after the
+        idle timeout of the pool unless it is borrowed again.
+        """
 
         if self._connection is not None:
-            self._connection.close()
+            self._connection = None
+            self._is_relayed = False
+            self._connection_pool.release(self._hostname, self._username, self._jump_host)
 
-            await self._connection.wait_closed()
+    async def download(self, remote_path: str, path: pathlib.Path):
+        """Downloads a file from the remote host
 
-            self._connection = None
+        Parameters
+        ----------
+        remote_path
+            path of the file on the remote host (relative paths are relative to
+            the home directory)
+        path
+            local path the file is stored at
+        """
+
+        if self._connection is None:
+            raise DataGateCLIException("Not connected to " + self._hostname)
+
+        if self._is_relayed:
+            # SFTP is not available if commands are relayed
+            path.write_bytes(
+                base64.b64decode(await self.execute(f"base64 -- {shlex.quote(remote_path)}", print_output=False))
+            )
+
+            return
 
-    async def execute(self, command: str, print_output: bool = True) -> str:
+        async with self._connection.start_sftp_client() as sftp_client:
+            await sftp_client.get(remote_path, str(path))
+
+    async def execute(
+        self,
+        command: str,
+        print_output: bool = True,
+        input: Union[str, None] = None,
+        check: bool = True,
+        output_callback: Union[OutputCallback, None] = None,
+        max_captured_size: Union[int, None] = None,
+    ) -> str:
         """Executes the given command on the remote host
 
         Parameters
@@ -73,39 +973,511 @@ class RemoteClient:
         print_output
             flag indicating whether the output of the command (stdout and stderr)
             shall be printed to stdout and stderr
+        input
+            data passed to the command using stdin
+        check
+            flag indicating whether an exception shall be raised if the command
+            returns with a nonzero exit code
+        output_callback
+            callable invoked for each chunk of output while the command is
+            executed (arguments: chunk, flag indicating whether the chunk was
+            written to stderr)
+        max_captured_size
+            maximum number of characters of output to be returned (only the tail
+            of the output is returned if it is exceeded; the whole output is
+            returned if None)
+
+        Returns
+        -------
+        str
+            output of the command (stdout and stderr)
+        """
+
+        return (await self._execute(command, print_output, input, check, output_callback, max_captured_size))[1]
+
+    async def execute_batch(
+        self, batch: RemoteBatch, print_output: bool = True, check: bool = True
+    ) -> RemoteBatchResult:
+        """Executes the steps of the given batch on the remote host in a single
+        session
+
+        Parameters
+        ----------
+        batch
+            batch to be executed
+        print_output
+            flag indicating whether the output of the steps shall be printed
+            after the batch was executed
+        check
+            flag indicating whether an exception shall be raised if a step
+            failed
+
+        Returns
+        -------
+        RemoteBatchResult
+            exit code and duration of each executed step and output
+        """
+
+        logging.info(f"Executing batch on {self._hostname}: {', '.join(batch.get_step_names())}")
+
+        start_time = time.monotonic()
+        batch_input = batch.get_input()
+        exit_code, output = await self._execute(batch.get_command(), False, batch_input, False, record=False)
+        result = batch.parse_output(exit_code, output)
+
+        if self._recorder is not None:
+            self._record_batch(batch, batch_input, result, time.monotonic() - start_time)
+
+        logging.info(f"Executed batch on {self._hostname}: {result.get_summary()}")
+
+        if print_output:
+            click.echo(result.output, nl=False)
+
+        if check and (result.exit_code != 0):
+            raise DataGateCLIException(
+                f"Step '{result.get_failed_step_name()}' of batch executed on {self._hostname} failed with exit "
+                f"code {result.exit_code} ({result.get_summary()})",
+                stderr=result.output,
+            )
+
+        return result
+
+    async def upload(
+        self,
+        path: pathlib.Path,
+        remote_path: Union[str, None] = None,
+        skip_identical_files: bool = True,
+        compress: bool = False,
+    ) -> int:
+        """Uploads a file or a directory to the remote host
+
+        Files are transferred using a single SFTP channel of the existing
+        connection. Before transferring files, the sizes and SHA-256 hashes of
+        existing remote files are determined with a single command and files
+        whose remote copy is identical are skipped.
+
+        Parameters
+        ----------
+        path
+            path of the file or directory to be uploaded
+        remote_path
+            path of the file or directory on the remote host (relative paths are
+            relative to the home directory; the name of the file or directory is
+            used if None)
+        skip_identical_files
+            flag indicating whether files whose remote copy is identical shall
+            be skipped
+        compress
+            flag indicating whether files shall be transferred as a compressed
+            archive, which is extracted on the remote host (always true if
+            commands are relayed)
+
+        Returns
+        -------
+        int
+            number of uploaded files
         """
 
+        if self._connection is None:
+            raise DataGateCLIException("Not connected to " + self._hostname)
+
+        remote_path = remote_path if remote_path is not None else path.name
+        files: dict[str, pathlib.Path] = {}
+
+        # files are keyed by their path relative to the remote root directory
+        if path.is_dir():
+            remote_root_directory_path = remote_path
+
+            for file_path in sorted(path.rglob("*")):
+                if file_path.is_file():
+                    files[file_path.relative_to(path).as_posix()] = file_path
+        else:
+            remote_root_directory_path = posixpath.dirname(remote_path) or "."
+            files[posixpath.basename(remote_path)] = path
+
+        if skip_identical_files:
+            remote_file_hashes = await self._get_remote_file_hashes(
+                remote_root_directory_path, {name: file_path.stat().st_size for name, file_path in files.items()}
+            )
+
+            for name in [name for name in files.keys() if name in remote_file_hashes]:
+                if _get_file_hash(files[name]) == remote_file_hashes[name]:
+                    logging.info(f"Skipping upload of {files[name]} to {self._hostname} (identical remote copy)")
+                    files.pop(name)
+
+        if len(files) == 0:
+            return 0
+
+        if compress or self._is_relayed:
+            await self._upload_compressed_files(remote_root_directory_path, files)
+        else:
+            async with self._connection.start_sftp_client() as sftp_client:
+                await sftp_client.makedirs(remote_root_directory_path, exist_ok=True)
+
+                for remote_directory_path in sorted(
+                    set(posixpath.dirname(name) for name in files.keys() if posixpath.dirname(name) != "")
+                ):
+                    await sftp_client.makedirs(
+                        posixpath.join(remote_root_directory_path, remote_directory_path), exist_ok=True
+                    )
+
+                # transfers are pipelined over the SFTP channel
+                await asyncio.gather(
+                    *[
+                        sftp_client.put(str(file_path), posixpath.join(remote_root_directory_path, name))
+                        for name, file_path in files.items()
+                    ]
+                )
+
+        return len(files)
+
+    async def _execute(
+        self,
+        command: str,
+        print_output: bool,
+        input: Union[str, None],
+        check: bool,
+        output_callback: Union[OutputCallback, None] = None,
+        max_captured_size: Union[int, None] = None,
+        record: bool = True,
+    ) -> tuple[int, str]:
         logging.info(f"Executing command on {self._hostname}: {command}")
 
         if self._connection is None:
             raise DataGateCLIException("Not connected to " + self._hostname)
 
-        channel, session = await self._connection.create_session(
-            create_remote_client_ssh_session(print_output), command
+        recorded_execution = (
+            self._recorder.start(self._hostname, command, len(input.encode()) if input is not None else 0)
+            if (self._recorder is not None) and record
+            else None
         )
 
-        await channel.wait_closed()
-        session.check_exit_status()
+        if recorded_execution is not None:
+            forwarded_output_callback = output_callback
+            write_output = recorded_execution.write
+
+            def record_output(chunk: str, is_stderr: bool):
+                write_output(chunk)
+
+                if forwarded_output_callback is not None:
+                    forwarded_output_callback(chunk, is_stderr)
+
+            output_callback = record_output
+
+        exit_status: Union[int, None] = None
+
+        try:
+            channel, session = await self._connection.create_session(
+                create_remote_client_ssh_session(print_output, output_callback, max_captured_size),
+                get_relay_command(self._hostname, self._username, command) if self._is_relayed else command,
+            )
 
-        return session.get_received_data()
+            if input is not None:
+                channel.write(input)
+                channel.write_eof()
 
-    async def upload(self, path: pathlib.Path):
-        """Uploads a file to the remote host
+            await channel.wait_closed()
+
+            exit_status = channel.get_exit_status()
+        finally:
+            if recorded_execution is not None:
+                recorded_execution.finish(exit_status if exit_status is not None else -1)
+
+        if check:
+            session.check_exit_status()
+
+        return (exit_status if exit_status is not None else -1), session.get_received_data()
+
+    def _record_batch(self, batch: RemoteBatch, batch_input: str, result: RemoteBatchResult, duration: float):
+        """Records the executed steps of a batch and writes the output of the
+        batch (without step markers) to the log file of the host"""
+
+        if self._recorder is None:
+            return
+
+        step_names = batch.get_step_names()
+        batch_name = f"batch ({len(step_names)} step(s))"
+
+        self._recorder.log(
+            self._hostname,
+            f"==> [{datetime.datetime.now().isoformat(timespec='seconds')}] {batch_name}: {', '.join(step_names)}\n"
+            f"{result.output}\n<== {result.get_summary()} after {duration:.2f}s\n\n",
+        )
+
+        self._recorder.add_record(
+            RemoteExecutionRecord(
+                self._hostname, batch_name, result.exit_code, duration, len(batch_input), len(result.output.encode())
+            )
+        )
+
+        for step_result in result.step_results:
+            self._recorder.add_record(
+                RemoteExecutionRecord(self._hostname, step_result.name, step_result.exit_code, step_result.duration)
+            )
+
+    async def _get_remote_file_hashes(self, remote_directory_path: str, file_sizes: dict[str, int]) -> dict[str, str]:
+        """Returns the SHA-256 hashes of remote files whose sizes match the
+        given sizes
 
         Parameters
         ----------
-        path
-            path of the file to be uploaded
+        remote_directory_path
+            path of the remote directory containing the files
+        file_sizes
+            dictionary associating paths of files relative to the remote
+            directory with expected sizes
+
+        Returns
+        -------
+        dict[str, str]
+            dictionary associating paths of files relative to the remote
+            directory with SHA-256 hashes
+        """
+
+        commands = [f"cd {shlex.quote(remote_directory_path)} 2>/dev/null || exit 0"]
+
+        for name, size in file_sizes.items():
+            quoted_name = shlex.quote(name)
+
+            commands.append(
+                f'[ "$(stat --format %s -- {quoted_name} 2>/dev/null)" = "{size}" ] && sha256sum -- {quoted_name}'
+            )
+
+        output = await self.execute("; ".join(commands + ["true"]), print_output=False)
+
+        return {
+            name: file_hash
+            for file_hash, name in regex.findall("^([0-9a-f]{64}) [ *](.+)$", output, regex.MULTILINE)
+            if name in file_sizes
+        }
+
+    async def _upload_compressed_files(self, remote_directory_path: str, files: dict[str, pathlib.Path]):
+        """Uploads the given files as a compressed archive, which is extracted
+        on the remote host
+
+        Parameters
+        ----------
+        remote_directory_path
+            path of the remote directory the archive is extracted to
+        files
+            dictionary associating paths of files relative to the remote
+            directory with local paths
         """
 
         if self._connection is None:
             raise DataGateCLIException("Not connected to " + self._hostname)
 
-        await asyncssh.scp(str(path), self._connection)
+        archive_name = f".dg-upload-{uuid.uuid4().hex}.tar.gz"
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            archive_path = pathlib.Path(temporary_directory) / archive_name
+
+            with tarfile.open(archive_path, mode="w:gz") as tar_file:
+                for name, file_path in files.items():
+                    tar_file.add(file_path, arcname=name)
+
+            if self._is_relayed:
+                # SFTP is not available if commands are relayed
+                await self.execute(
+                    f"mkdir --parents {shlex.quote(remote_directory_path)} && base64 --decode | "
+                    f"tar --extract --gzip --directory {shlex.quote(remote_directory_path)} --file -",
+                    print_output=False,
+                    input=base64.b64encode(archive_path.read_bytes()).decode() + "\n",
+                )
+
+                return
+
+            async with self._connection.start_sftp_client() as sftp_client:
+                await sftp_client.put(str(archive_path), archive_name)
+
+        await self.execute(
+            f"mkdir --parents {shlex.quote(remote_directory_path)} && "
+            f"tar --extract --gzip --directory {shlex.quote(remote_directory_path)} --file {archive_name}; "
+            f"__dg_exit_code=$?; rm -f {archive_name}; exit $__dg_exit_code",
+            print_output=False,
+        )
+
+
+async def connect_to_ssh_agent(
+    socket_path: pathlib.Path, username: str, timeout: float = 0
+) -> asyncssh.SSHClientConnection:
+    """Connects to the Data Gate SSH agent listening on the given Unix domain
+    socket
+
+    The agent is only reachable by the current user (the socket is created
+    with mode 0600). Thus, neither the client nor the agent is
+    authenticated.
+
+    Parameters
+    ----------
+    socket_path
+        path of the Unix domain socket the agent listens on
+    username
+        name identifying the remote host (see get_ssh_agent_username())
+    timeout
+        number of seconds to wait for the agent to listen on the socket
+
+    Returns
+    -------
+    asyncssh.SSHClientConnection
+        connection whose sessions are forwarded to the remote host by the
+        agent
+    """
+
+    loop = asyncio.get_running_loop()
+    deadline = time.monotonic() + timeout
+
+    while True:
+        agent_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        agent_socket.setblocking(False)
+
+        try:
+            await loop.sock_connect(agent_socket, str(socket_path))
+
+            break
+        except OSError:
+            agent_socket.close()
+
+            if time.monotonic() >= deadline:
+                raise
+
+            await asyncio.sleep(0.1)
+
+    return await asyncssh.connect(
+        agent_path=None, client_keys=None, config=None, known_hosts=None, sock=agent_socket, username=username
+    )
+
+
+def get_relay_command(
+    hostname: str, username: str, command: Union[str, None] = None, subsystem: Union[str, None] = None
+) -> str:
+    """Returns the command executing the given command or subsystem on a host
+    using the ssh client of the jump host through which the host is reached
+
+    The host is authenticated with the private keys and known hosts of the
+    user on the jump host.
+
+    Parameters
+    ----------
+    hostname
+        name of the remote host
+    username
+        name of the user on the remote host
+    command
+        command to be executed on the remote host (a shell is started if None)
+    subsystem
+        subsystem to be started on the remote host (e.g., sftp)
+
+    Returns
+    -------
+    str
+        command to be executed on the jump host
+    """
+
+    args = ["ssh", "-q", "-o", "BatchMode=yes"]
+
+    if subsystem is not None:
+        args += ["-s", f"{username}@{hostname}", subsystem]
+    else:
+        args += [f"{username}@{hostname}"] + ([command] if command is not None else [])
+
+    return shlex.join(args)
+
+
+def get_ssh_agent_username(hostname: str, username: str, jump_host: Union[SSHHost, None] = None) -> str:
+    """Returns the name of the user passed to the Data Gate SSH agent when
+    connecting to it, which identifies the remote host sessions are forwarded
+    to
+
+    Parameters
+    ----------
+    hostname
+        name of the remote host
+    username
+        name of the user on the remote host
+    jump_host
+        hostname and username of the host through which the remote host is
+        reached
+
+    Returns
+    -------
+    str
+        name of the user passed to the Data Gate SSH agent (e.g.,
+        "core@worker0,root@infrastructure")
+    """
+
+    result = f"{username}@{hostname}"
+
+    if jump_host is not None:
+        result += f",{jump_host[1]}@{jump_host[0]}"
+
+    return result
+
+
+def parse_ssh_agent_username(agent_username: str) -> tuple[str, str, Union[SSHHost, None]]:
+    """Parses a user name returned by get_ssh_agent_username()
+
+    Parameters
+    ----------
+    agent_username
+        name of the user passed to the Data Gate SSH agent
+
+    Returns
+    -------
+    tuple[str, str, Union[SSHHost, None]]
+        hostname, username, and jump host
+    """
+
+    hosts: list[SSHHost] = []
+
+    for host in agent_username.split(","):
+        if "@" not in host:
+            raise DataGateCLIException(f"Invalid SSH agent user name: {agent_username}")
+
+        username, hostname = host.rsplit("@", 1)
+        hosts.append((hostname, username))
+
+    if len(hosts) > 2:
+        raise DataGateCLIException(f"Invalid SSH agent user name: {agent_username}")
+
+    return hosts[0][0], hosts[0][1], hosts[1] if len(hosts) == 2 else None
+
+
+def start_ssh_agent(socket_path: pathlib.Path, lifetime: float = DEFAULT_SSH_AGENT_LIFETIME):
+    """Starts the Data Gate SSH agent as a background process
+
+    The agent outlives the current process and exits if it was not used for
+    the given lifetime. Its log is written to a file next to the socket.
+
+    Parameters
+    ----------
+    socket_path
+        path of the Unix domain socket the agent listens on
+    lifetime
+        number of seconds after which the agent exits if it is not used
+    """
+
+    if sys.platform == "win32":
+        raise DataGateCLIException("The SSH agent is not supported on Windows")
+
+    socket_path.parent.mkdir(mode=0o700, exist_ok=True, parents=True)
+
+    logging.debug(f"Starting SSH agent listening on {socket_path}")
+
+    with open(socket_path.with_suffix(".log"), "a") as log_file:
+        subprocess.Popen(
+            [sys.executable, "-m", "dg.utils.ssh_agent", "--lifetime", str(lifetime), str(socket_path)],
+            start_new_session=True,
+            stderr=log_file,
+            stdin=subprocess.DEVNULL,
+            stdout=log_file,
+        )
 
 
 def create_remote_client_ssh_session(
     print_output: bool,
+    output_callback: Union[OutputCallback, None] = None,
+    max_captured_size: Union[int, None] = None,
 ) -> type[asyncssh.SSHClientSession]:
     """Returns a parameterized subclass of asyncssh.SSHClientSession that
     may be passed to asyncssh.SSHClientConnection.create_session()
@@ -116,6 +1488,14 @@ def create_remote_client_ssh_session(
         flag indicating whether output to stdout and stderr of a command
         executed on a remote host shall be printed to stdout and stderr on the
         local host
+    output_callback
+        callable invoked for each chunk of output received from the remote
+        host (arguments: chunk, flag indicating whether the chunk was written
+        to stderr)
+    max_captured_size
+        maximum number of characters of output to be stored (only the tail of
+        the output is stored if it is exceeded; the whole output is stored if
+        None)
 
     Returns
     -------
@@ -131,7 +1511,9 @@ def create_remote_client_ssh_session(
         - Output to stderr of a command executed on a remote host is highlighted
           in red.
         - Output to stdout and stderr of a command executed on a remote host is
-          stored and may be returned by calling get_received_data().
+          stored and may be returned by calling get_received_data(). Received
+          chunks are stored in a list and only joined when requested to avoid
+          quadratic runtime for commands producing a lot of output.
 
           For unknown reasons, output to stdout and stderr is not
           interleaved although it should be:
@@ -142,7 +1524,9 @@ def create_remote_client_ssh_session(
 
         def __init__(self):
             self._channel: Union[asyncssh.SSHClientChannel, None] = None
-            self._received_data = ""
+            self._discarded_size = 0
+            self._received_chunks: collections.deque[str] = collections.deque()
+            self._received_size = 0
 
         def check_exit_status(self):
             """Checks the exit status of a command executed on a remote host and
@@ -166,24 +1550,71 @@ def create_remote_client_ssh_session(
             self._channel = channel
 
         def data_received(self, data, datatype):
-            if datatype == asyncssh.EXTENDED_DATA_STDERR:
-                self._received_data += data
+            is_stderr = datatype == asyncssh.EXTENDED_DATA_STDERR
+
+            self._store(data)
+
+            if output_callback is not None:
+                output_callback(data, is_stderr)
 
-                if print_output:
+            if print_output:
+                if is_stderr:
                     click.echo(
                         colorama.Fore.RED + data + colorama.Fore.RESET,
                         err=True,
                         nl=False,
                     )
-            else:
-                self._received_data += data
-
-                if print_output:
+                else:
                     click.echo(data, nl=False)
 
+        def get_discarded_size(self) -> int:
+            """Returns the number of characters of output that were discarded
+            because the capture limit was exceeded"""
+
+            return self._discarded_size
+
         def get_received_data(self) -> str:
             """see asyncssh.SSHClientSession.get_received_data()"""
 
-            return self._received_data
+            received_data = "".join(self._received_chunks)
+
+            self._received_chunks.clear()
+            self._received_chunks.append(received_data)
+
+            return received_data
+
+        def _store(self, data: str):
+            self._received_chunks.append(data)
+            self._received_size += len(data)
+
+            if max_captured_size is None:
+                return
+
+            # discard the head of the output (tail buffer)
+            while self._received_size > max_captured_size:
+                excess_size = self._received_size - max_captured_size
+                first_chunk = self._received_chunks[0]
+
+                if len(first_chunk) <= excess_size:
+                    self._received_chunks.popleft()
+                    self._discarded_size += len(first_chunk)
+                    self._received_size -= len(first_chunk)
+                else:
+                    self._received_chunks[0] = first_chunk[excess_size:]
+                    self._discarded_size += excess_size
+                    self._received_size -= excess_size
 
     return RemoteClientSSHSession
+
+
+def _get_file_hash(path: pathlib.Path) -> str:
+    file_hash = hashlib.sha256()
+
+    with open(path, "rb") as file:
+        while len(data := file.read(1024 * 1024)) != 0:
+            file_hash.update(data)
+
+    return file_hash.hexdigest()
+
+
+ssh_connection_pool = SSHConnectionPool()
@@ -0,0 +1,420 @@
+#  Copyright 2020 IBM Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import asyncio
+import json
+import logging
+import os
+import pathlib
+import socket
+
+from typing import Any, Final, Union
+
+import asyncssh
+import click
+
+import dg.utils.ssh
+
+from dg.lib.error import DataGateCLIException
+
+SSH_AGENT_CONTROL_USERNAME: Final[str] = "dg-ssh-agent"
+
+
+class SSHAgent:
+    """Persistent SSH agent shared by separate Data Gate CLI processes
+
+    The agent listens on a Unix domain socket for SSH connections from Data
+    Gate CLI processes (see dg.utils.ssh.SSHConnectionPool.use_ssh_agent()).
+    The user name passed by a client identifies a remote host (see
+    dg.utils.ssh.get_ssh_agent_username()) and each session opened by the
+    client (commands and subsystems like SFTP) is forwarded to a session on a pooled
+    connection to that host. Thus, separate Data Gate CLI invocations reuse
+    authenticated connections, similar to an OpenSSH ControlMaster.
+
+    The agent exits if no client was connected for its lifetime or if the
+    "stop" command is sent by the control user (see stop_ssh_agent()).
+    """
+
+    def __init__(
+        self,
+        socket_path: pathlib.Path,
+        lifetime: float = dg.utils.ssh.DEFAULT_SSH_AGENT_LIFETIME,
+        connection_pool: Union[dg.utils.ssh.SSHConnectionPool, None] = None,
+    ):
+        """Constructor
+
+        Parameters
+        ----------
+        socket_path
+            path of the Unix domain socket the agent listens on
+        lifetime
+            number of seconds after which the agent exits if no client is
+            connected (also the idle timeout of pooled connections)
+        connection_pool
+            SSH connection pool holding connections to remote hosts
+        """
+
+        self._client_count = 0
+        self._connection_pool = (
+            connection_pool if connection_pool is not None else dg.utils.ssh.SSHConnectionPool(idle_timeout=lifetime)
+        )
+
+        self._idle_timer: Union[asyncio.TimerHandle, None] = None
+        self._lifetime = lifetime
+        self._server: Union[asyncssh.SSHAcceptor, None] = None
+        self._socket_path = socket_path
+        self._stop_event: Union[asyncio.Event, None] = None
+
+    async def run(self):
+        """Runs the agent until it is stopped"""
+
+        await self.start()
+        await self.wait_stopped()
+
+    async def start(self):
+        """Starts listening on the Unix domain socket"""
+
+        self._socket_path.parent.mkdir(mode=0o700, exist_ok=True, parents=True)
+
+        if self._socket_path.exists():
+            if await get_ssh_agent_status(self._socket_path) is not None:
+                raise DataGateCLIException(f"SSH agent is already listening on {self._socket_path}")
+
+            # remove stale socket of an agent that was killed
+            self._socket_path.unlink()
+
+        agent = self
+        agent_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        umask = os.umask(0o177)
+
+        try:
+            agent_socket.bind(str(self._socket_path))
+        finally:
+            os.umask(umask)
+
+        class SSHServer(asyncssh.SSHServer):
+            def begin_auth(self, username: str) -> bool:
+                # clients are not authenticated as only the current user may
+                # connect to the socket
+                return False
+
+            def connection_lost(self, exc: Union[Exception, None]):
+                agent._on_client_disconnected()
+
+            def connection_made(self, connection: asyncssh.SSHServerConnection):
+                self._connection = connection
+
+                agent._on_client_connected()
+
+            def session_requested(self) -> asyncssh.SSHServerSession:
+                return agent._create_session(self._connection.get_extra_info("username"))
+
+        self._server = await asyncssh.listen(
+            encoding=None,
+            server_factory=SSHServer,
+            server_host_keys=[asyncssh.generate_private_key("ssh-ed25519")],
+            sock=agent_socket,
+        )
+
+        self._idle_timer = asyncio.get_running_loop().call_later(self._lifetime, self.stop)
+        self._stop_event = asyncio.Event()
+
+        logging.info(f"SSH agent is listening on {self._socket_path} (lifetime: {self._lifetime}s)")
+
+    def stop(self):
+        """Stops the agent"""
+
+        if self._stop_event is not None:
+            self._stop_event.set()
+
+    async def wait_stopped(self):
+        """Waits until the agent is stopped and closes all pooled connections"""
+
+        if self._stop_event is None:
+            raise DataGateCLIException("SSH agent is not running")
+
+        try:
+            await self._stop_event.wait()
+        finally:
+            await self._stop()
+
+    def _create_session(self, agent_username: str) -> asyncssh.SSHServerSession:
+        agent = self
+
+        class ForwardingClientSession(asyncssh.SSHClientSession):
+            """Session on a pooled connection to the remote host whose output
+            is forwarded to the client of the agent"""
+
+            def __init__(self, channel: asyncssh.SSHServerChannel):
+                self._server_channel = channel
+
+            def connection_lost(self, exc: Union[Exception, None]):
+                if exc is not None:
+                    self._server_channel.write(f"{exc}\n".encode(), asyncssh.EXTENDED_DATA_STDERR)
+
+            def data_received(self, data: bytes, datatype: asyncssh.DataType):
+                self._server_channel.write(data, datatype)
+
+            def eof_received(self) -> bool:
+                self._server_channel.write_eof()
+
+                return True
+
+            def pause_writing(self):
+                self._server_channel.pause_reading()
+
+            def resume_writing(self):
+                self._server_channel.resume_reading()
+
+        class ForwardingServerSession(asyncssh.SSHServerSession):
+            """Session opened by a client of the agent that is forwarded to a
+            session on a pooled connection to the remote host (commands and
+            subsystems like SFTP are forwarded as a byte stream)"""
+
+            def __init__(self):
+                self._channel: Union[asyncssh.SSHServerChannel, None] = None
+                self._command: Union[str, None] = None
+                self._is_eof_received = False
+                self._pending_input: list[tuple[bytes, asyncssh.DataType]] = []
+                self._remote_channel: Union[asyncssh.SSHClientChannel, None] = None
+                self._subsystem: Union[str, None] = None
+
+            def connection_lost(self, exc: Union[Exception, None]):
+                if self._remote_channel is not None:
+                    self._remote_channel.close()
+
+            def connection_made(self, channel: asyncssh.SSHServerChannel):
+                self._channel = channel
+
+            def data_received(self, data: bytes, datatype: asyncssh.DataType):
+                if self._remote_channel is not None:
+                    self._remote_channel.write(data, datatype)
+                else:
+                    self._pending_input.append((data, datatype))
+
+            def eof_received(self) -> bool:
+                self._is_eof_received = True
+
+                if self._remote_channel is not None:
+                    self._remote_channel.write_eof()
+
+                # keep the channel open until the remote session exits
+                return True
+
+            def exec_requested(self, command: str) -> bool:
+                self._command = command
+
+                return True
+
+            def pause_writing(self):
+                if self._remote_channel is not None:
+                    self._remote_channel.pause_reading()
+
+            def resume_writing(self):
+                if self._remote_channel is not None:
+                    self._remote_channel.resume_reading()
+
+            def session_started(self):
+                if self._channel is None:
+                    return
+
+                if agent_username == SSH_AGENT_CONTROL_USERNAME:
+                    agent._execute_control_command(self._channel, self._command)
+                else:
+                    asyncio.create_task(self._forward(self._channel))
+
+            def subsystem_requested(self, subsystem: str) -> bool:
+                self._subsystem = subsystem
+
+                return True
+
+            async def _forward(self, channel: asyncssh.SSHServerChannel):
+                try:
+                    hostname, username, jump_host = dg.utils.ssh.parse_ssh_agent_username(agent_username)
+                    connection = await agent._connection_pool.acquire(hostname, username, jump_host)
+                except Exception as exception:
+                    channel.write(f"{exception}\n".encode(), asyncssh.EXTENDED_DATA_STDERR)
+                    channel.exit(255)
+
+                    return
+
+                try:
+                    if agent._connection_pool.is_relayed(hostname, username, jump_host):
+                        command: Union[str, None] = dg.utils.ssh.get_relay_command(
+                            hostname, username, self._command, self._subsystem
+                        )
+
+                        subsystem: Union[str, None] = None
+                    else:
+                        command = self._command
+                        subsystem = self._subsystem
+
+                    self._remote_channel, _ = await connection.create_session(
+                        lambda: ForwardingClientSession(channel),
+                        command if command is not None else (),
+                        encoding=None,
+                        subsystem=subsystem if subsystem is not None else (),
+                    )
+
+                    # forward input received before the remote session was
+                    # opened
+                    for data, datatype in self._pending_input:
+                        self._remote_channel.write(data, datatype)
+
+                    self._pending_input.clear()
+
+                    if self._is_eof_received:
+                        self._remote_channel.write_eof()
+
+                    await self._remote_channel.wait_closed()
+
+                    exit_signal = self._remote_channel.get_exit_signal()
+                    exit_status = self._remote_channel.get_exit_status()
+
+                    if exit_signal is not None:
+                        channel.exit_with_signal(*exit_signal)
+                    else:
+                        channel.exit(exit_status if exit_status is not None else 255)
+                except Exception as exception:
+                    logging.error(f"Forwarding session to {agent_username} failed: {exception}")
+
+                    channel.write(f"{exception}\n".encode(), asyncssh.EXTENDED_DATA_STDERR)
+                    channel.exit(255)
+                finally:
+                    agent._connection_pool.release(hostname, username, jump_host)
+
+        return ForwardingServerSession()
+
+    def _execute_control_command(self, channel: asyncssh.SSHServerChannel, command: Union[str, None]):
+        if command == "status":
+            channel.write(json.dumps(self._get_status()).encode())
+            channel.exit(0)
+        elif command == "stop":
+            channel.exit(0)
+            asyncio.get_running_loop().call_soon(self.stop)
+        else:
+            channel.write(f"Unknown command: {command}\n".encode(), asyncssh.EXTENDED_DATA_STDERR)
+            channel.exit(1)
+
+    def _get_status(self) -> dict[str, Any]:
+        return {
+            "clients": self._client_count,
+            "connections": sorted(
+                dg.utils.ssh.get_ssh_agent_username(key[0][0], key[0][1], key[1])
+                for key in self._connection_pool.get_connection_keys()
+            ),
+            "lifetime": self._lifetime,
+            "pid": os.getpid(),
+        }
+
+    def _on_client_connected(self):
+        self._client_count += 1
+
+        if self._idle_timer is not None:
+            self._idle_timer.cancel()
+            self._idle_timer = None
+
+    def _on_client_disconnected(self):
+        self._client_count -= 1
+
+        if self._client_count == 0:
+            self._idle_timer = asyncio.get_running_loop().call_later(self._lifetime, self.stop)
+
+    async def _stop(self):
+        if self._idle_timer is not None:
+            self._idle_timer.cancel()
+            self._idle_timer = None
+
+        if self._server is not None:
+            self._server.close()
+
+            await self._server.wait_closed()
+
+            self._server = None
+
+        await self._connection_pool.close()
+
+        if self._socket_path.exists():
+            self._socket_path.unlink()
+
+        logging.info("SSH agent stopped")
+
+
+async def get_ssh_agent_status(socket_path: pathlib.Path) -> Union[Any, None]:
+    """Returns the status of the Data Gate SSH agent listening on the given
+    Unix domain socket
+
+    Parameters
+    ----------
+    socket_path
+        path of the Unix domain socket the agent listens on
+
+    Returns
+    -------
+    Union[Any, None]
+        status of the agent (process ID, lifetime, number of connected clients,
+        and pooled connections) or None if the agent is not running
+    """
+
+    try:
+        async with await dg.utils.ssh.connect_to_ssh_agent(socket_path, SSH_AGENT_CONTROL_USERNAME) as connection:
+            result = await connection.run("status", check=True)
+    except OSError:
+        return None
+
+    return json.loads(result.stdout)
+
+
+async def stop_ssh_agent(socket_path: pathlib.Path) -> bool:
+    """Stops the Data Gate SSH agent listening on the given Unix domain
+    socket
+
+    Parameters
+    ----------
+    socket_path
+        path of the Unix domain socket the agent listens on
+
+    Returns
+    -------
+    bool
+        true, if the agent was running
+    """
+
+    try:
+        async with await dg.utils.ssh.connect_to_ssh_agent(socket_path, SSH_AGENT_CONTROL_USERNAME) as connection:
+            await connection.run("stop", check=True)
+    except OSError:
+        return False
+
+    return True
+
+
+@click.command()
+@click.option(
+    "--lifetime",
+    default=dg.utils.ssh.DEFAULT_SSH_AGENT_LIFETIME,
+    help="Number of seconds after which the agent exits if it is not used",
+    type=float,
+)
+@click.argument("socket_path")
+def main(lifetime: float, socket_path: str):
+    """Run the Data Gate SSH agent in the foreground"""
+
+    logging.basicConfig(format="%(asctime)s %(levelname)s %(message)s", level=logging.INFO)
+
+    asyncio.run(SSHAgent(pathlib.Path(socket_path), lifetime).run())
+
+
+if __name__ == "__main__":
+    main()
@@ -14,6 +14,7 @@
 
 import os
 import pathlib
+import sys
 import tempfile
 import unittest
 import unittest.mock
@@ -124,6 +125,103 @@ class TestClusterCommands(unittest.TestCase):
                 "cluster1-alias-changed",
             )
 
+    def test_exec_command(self):
+        # create cluster-1 and cluster-2 (logging in to unit test clusters is
+        # not supported)
+        self._add_cluster(self._cluster_1_data())
+        self._add_cluster(self._cluster_2_data())
+
+        runner = click.testing.CliRunner()
+        result = runner.invoke(cli, ["cluster", "exec", "--alias", "cluster1-*", "--", "get", "nodes"])
+
+        self.assertEqual(result.exit_code, 1)
+        self.assertIn("cluster1-alias", result.stdout)
+        self.assertNotIn("cluster2-alias", result.stdout)
+        self.assertIn("failed (1)", result.stdout)
+
+    def test_exec_command_with_oc(self):
+        # create cluster-1, cluster-2, and cluster-3 and execute a fake oc
+        # script recording when it was started and when it terminated
+        for i in range(1, 4):
+            self._add_cluster({"alias": f"cluster{i}-alias", "server": f"cluster{i}.cloud.example.com:12345"})
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            log_file_path = pathlib.Path(temporary_directory) / "oc.log"
+            oc_cli_path = pathlib.Path(temporary_directory) / "oc"
+            oc_cli_path.write_text(f"""#!{sys.executable}
+import sys
+import time
+
+if sys.argv[1] != "login":
+    with open({str(log_file_path)!r}, "a") as log_file:
+        log_file.write(f"start {{time.time()}}\\n")
+
+    time.sleep(0.5)
+    print("line 1")
+    print("line 2")
+
+    with open({str(log_file_path)!r}, "a") as log_file:
+        log_file.write(f"end {{time.time()}}\\n")
+""")
+
+            oc_cli_path.chmod(0o755)
+
+            with unittest.mock.patch.object(
+                dg.config.data_gate_configuration_manager, "get_oc_cli_path", return_value=oc_cli_path
+            ), unittest.mock.patch.object(
+                dg.config.data_gate_configuration_manager,
+                "get_dg_kubeconfig_directory_path",
+                return_value=pathlib.Path(temporary_directory) / "kubeconfig",
+            ), unittest.mock.patch.object(
+                UnitTestCluster, "get_oc_login_args", return_value=["login"]
+            ):
+                runner = click.testing.CliRunner()
+                result = runner.invoke(cli, ["cluster", "exec", "--max-parallelism", "2", "--", "get", "nodes"])
+
+            self.assertEqual(result.exit_code, 0)
+
+            # output lines are prefixed with the alias of the cluster
+            for i in range(1, 4):
+                self.assertIn(f"[cluster{i}-alias] line 1\n", result.stdout)
+                self.assertIn(f"[cluster{i}-alias] line 2\n", result.stdout)
+
+            self.assertEqual(result.stdout.count("OK"), 3)
+
+            # at most two clusters are processed at the same time
+            events = sorted(
+                (float(timestamp), 1 if event == "start" else -1)
+                for event, timestamp in (line.split() for line in log_file_path.read_text().splitlines())
+            )
+
+            parallelism = 0
+            max_parallelism = 0
+
+            for _, delta in events:
+                parallelism += delta
+                max_parallelism = max(max_parallelism, parallelism)
+
+            self.assertEqual(len(events), 6)
+            self.assertEqual(max_parallelism, 2)
+
+    def test_get_clusters(self):
+        cluster_1_data = self._cluster_1_data()
+        cluster_2_data = self._cluster_2_data()
+
+        self._add_cluster(cluster_1_data)
+        self._add_cluster(cluster_2_data)
+
+        self.assertEqual(len(cluster_credentials_manager.get_clusters()), 2)
+        self.assertEqual(len(cluster_credentials_manager.get_clusters(cluster_type="Unit Test")), 2)
+        self.assertEqual(len(cluster_credentials_manager.get_clusters(cluster_type="FYRE")), 0)
+
+        clusters = cluster_credentials_manager.get_clusters("cluster2-*")
+
+        self.assertEqual(len(clusters), 1)
+        self.assertEqual(clusters[0].get_server(), cluster_2_data["server"])
+
+        # server URLs are matched as well
+        self.assertEqual(len(cluster_credentials_manager.get_clusters("cluster1.cloud.*")), 1)
+
     def test_rm_command(self):
         # create cluster-1
         cluster_1_data = self._cluster_1_data()
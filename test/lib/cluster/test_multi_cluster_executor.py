@@ -0,0 +1,66 @@
+#  Copyright 2020 IBM Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import asyncio
+import unittest
+import unittest.mock
+
+import dg.utils.process
+
+from dg.lib.cluster.multi_cluster_executor import CLUSTER_OPERATIONS, MultiClusterExecutor
+
+
+class TestMultiClusterExecutor(unittest.TestCase):
+    def test_execute_version_operation(self):
+        """Tests that the version operation falls back to "oc version" if the
+        ClusterVersion resource does not exist (OpenShift 3)"""
+
+        cluster = unittest.mock.MagicMock()
+        executor = MultiClusterExecutor([cluster])
+        env = {"KUBECONFIG": "kubeconfig"}
+
+        with unittest.mock.patch(
+            "dg.utils.process.execute_command_async",
+            return_value=dg.utils.process.ProcessResult(0, "", '{"status": {"desired": {"version": "4.6.1"}}}'),
+        ) as execute_command_async_mock:
+            self.assertEqual(
+                asyncio.run(executor._execute_operation(cluster, env, CLUSTER_OPERATIONS["version"])), (0, "4.6.1")
+            )
+
+            self.assertEqual(execute_command_async_mock.call_count, 1)
+
+        with unittest.mock.patch(
+            "dg.utils.process.execute_command_async",
+            side_effect=[
+                dg.utils.process.ProcessResult(1, "Error from server (NotFound)", ""),
+                dg.utils.process.ProcessResult(0, "", '{"openshiftVersion": "3.11.306"}'),
+            ],
+        ) as execute_command_async_mock:
+            self.assertEqual(
+                asyncio.run(executor._execute_operation(cluster, env, CLUSTER_OPERATIONS["version"])), (0, "3.11.306")
+            )
+
+            self.assertEqual(execute_command_async_mock.call_args.args[1], ["version", "--output", "json"])
+            self.assertEqual(execute_command_async_mock.call_args.kwargs["env"], env)
+
+        with unittest.mock.patch(
+            "dg.utils.process.execute_command_async",
+            return_value=dg.utils.process.ProcessResult(1, "Unauthorized", ""),
+        ) as execute_command_async_mock:
+            self.assertEqual(
+                asyncio.run(executor._execute_operation(cluster, env, CLUSTER_OPERATIONS["node-readiness"])),
+                (1, "Unauthorized"),
+            )
+
+            self.assertEqual(execute_command_async_mock.call_count, 1)
@@ -0,0 +1,249 @@
+#  Copyright 2020 IBM Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import asyncio
+import pathlib
+import tempfile
+import unittest
+import unittest.mock
+
+import dg.lib.fyre.openshift
+import dg.utils.process
+
+
+class TestFYREOpenShiftUtilities(unittest.TestCase):
+    def test_get_oc_bulk_node_commands(self):
+        """Tests that all nodes are tainted and labeled with a single oc
+        invocation each"""
+
+        nodes = ["worker0.example.com", "worker1.example.com"]
+
+        self.assertEqual(
+            dg.lib.fyre.openshift._get_oc_adm_taint_nodes_command(nodes, "db2wh"),
+            [
+                "adm",
+                "taint",
+                "nodes",
+                "--overwrite",
+                "worker0.example.com",
+                "worker1.example.com",
+                "icp4data=database-db2wh:NoSchedule",
+            ],
+        )
+
+        self.assertEqual(
+            dg.lib.fyre.openshift._get_oc_label_nodes_command(nodes, "db2wh"),
+            ["label", "nodes", "--overwrite", "worker0.example.com", "worker1.example.com", "icp4data=database-db2wh"],
+        )
+
+    def test_get_db2_node_commands(self):
+        """Tests that only missing initialization steps are executed"""
+
+        initialized_node_state = dg.lib.fyre.openshift.NodeState(
+            "container_manage_cgroup=on\n"
+            "file_context=1\n"
+            "storage_path_context=system_u:object_r:container_file_t:s0\n"
+            "storage_path_mode=777\n"
+            "selinux_policy_module=1\n"
+            "selinux_policy_module_hash=abc\n"
+            "selinux_policy_toolchain=rhcos-46.82/19 (compatibility range 19-15)\n"
+        )
+
+        self.assertEqual(dg.lib.fyre.openshift._get_db2_node_commands(initialized_node_state, True), [])
+        self.assertEqual(initialized_node_state.selinux_policy_module_hash, "abc")
+        self.assertEqual(initialized_node_state.selinux_policy_toolchain, "rhcos-46.82/19 (compatibility range 19-15)")
+
+        uninitialized_node_state = dg.lib.fyre.openshift.NodeState(
+            "container_manage_cgroup=off\n"
+            "file_context=0\n"
+            "storage_path_context=\n"
+            "storage_path_mode=\n"
+            "selinux_policy_module=0\n"
+            "selinux_policy_module_hash=\n"
+        )
+
+        self.assertEqual(
+            dg.lib.fyre.openshift._get_db2_node_commands(uninitialized_node_state, False),
+            ["sudo setsebool -P container_manage_cgroup true"],
+        )
+
+        self.assertEqual(len(dg.lib.fyre.openshift._get_db2_node_commands(uninitialized_node_state, True)), 5)
+        self.assertIsNone(uninitialized_node_state.selinux_policy_module_hash)
+
+        # file context rule exists but storage path was not relabeled
+        partially_initialized_node_state = dg.lib.fyre.openshift.NodeState(
+            "container_manage_cgroup=on\nfile_context=1\nstorage_path_context=unlabeled_t\nstorage_path_mode=777\n"
+        )
+
+        self.assertEqual(
+            dg.lib.fyre.openshift._get_db2_node_commands(partially_initialized_node_state, True),
+            [f"sudo restorecon -Rv {dg.lib.fyre.openshift.STORAGE_PATH}"],
+        )
+
+    def test_get_nodes_to_be_tainted_and_labeled(self):
+        """Tests that already tainted and labeled nodes are skipped"""
+
+        node_objects = [
+            {
+                "metadata": {"labels": {"icp4data": "database-db2wh"}, "name": "worker0.example.com"},
+                "spec": {"taints": [{"effect": "NoSchedule", "key": "icp4data", "value": "database-db2wh"}]},
+            },
+            {"metadata": {"name": "worker1.example.com"}, "spec": {}},
+        ]
+
+        nodes = ["worker0.example.com", "worker1.example.com"]
+
+        self.assertEqual(
+            dg.lib.fyre.openshift._get_nodes_to_be_tainted(node_objects, nodes, "db2wh"), ["worker1.example.com"]
+        )
+
+        self.assertEqual(
+            dg.lib.fyre.openshift._get_nodes_to_be_labeled(node_objects, nodes, "db2wh"), ["worker1.example.com"]
+        )
+
+        self.assertEqual(dg.lib.fyre.openshift._get_nodes_to_be_tainted(node_objects, nodes, "db2oltp"), nodes)
+
+    def test_parse_oc_node_results(self):
+        """Tests dg.lib.fyre.openshift._parse_oc_node_results()"""
+
+        oc_command_result = "node/worker0.example.com labeled\nnode/worker1.example.com not labeled\n"
+
+        self.assertEqual(
+            dg.lib.fyre.openshift._parse_oc_node_results(oc_command_result),
+            {"worker0.example.com": "labeled", "worker1.example.com": "not labeled"},
+        )
+
+        self.assertEqual(
+            dg.lib.fyre.openshift._parse_oc_node_names("node/worker0.example.com\nnode/worker1.example.com"),
+            ["worker0.example.com", "worker1.example.com"],
+        )
+
+    def test_execute_oc_node_command(self):
+        """Tests that the results of all nodes are reported if an oc command
+        modifying nodes fails for some of them"""
+
+        nodes = ["worker0.example.com", "worker1.example.com", "worker2.example.com"]
+
+        with unittest.mock.patch(
+            "dg.lib.openshift.execute_oc_command",
+            return_value=dg.utils.process.ProcessResult(
+                1,
+                'Error from server (NotFound): nodes "worker1.example.com" not found\nerror: unknown error',
+                "node/worker0.example.com modified",
+            ),
+        ) as execute_oc_command_mock:
+            taint_results = dg.lib.fyre.openshift._execute_oc_node_command(["adm", "taint", "nodes"] + nodes, nodes)
+
+        self.assertFalse(execute_oc_command_mock.call_args.kwargs["check"])
+        self.assertEqual(
+            taint_results,
+            {
+                "worker0.example.com": "modified",
+                "worker1.example.com": "failed (not found)",
+                "worker2.example.com": "failed",
+            },
+        )
+
+        node_results = {node: dg.lib.fyre.openshift.NodeInitializationResult(0, 1) for node in nodes}
+
+        with self.assertRaisesRegex(Exception, "failed: worker1.example.com, worker2.example.com\\W"):
+            dg.lib.fyre.openshift._raise_if_initialization_failed(node_results, taint_results, {})
+
+
+class TestFYRENodeInitialization(unittest.IsolatedAsyncioTestCase):
+    async def test_initialize_nodes(self):
+        """Tests that nodes are initialized concurrently and that a failure on
+        one node does not abort the initialization of other nodes"""
+
+        running_node_count = 0
+        max_running_node_count = 0
+
+        class NodeClient:
+            def __init__(self, node: str):
+                self.node = node
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, exc_type, exc_value, traceback):
+                pass
+
+        async def initialize_node(nodeClient: NodeClient) -> int:
+            nonlocal max_running_node_count, running_node_count
+
+            running_node_count += 1
+            max_running_node_count = max(max_running_node_count, running_node_count)
+
+            await asyncio.sleep(0.05)
+
+            running_node_count -= 1
+
+            if nodeClient.node == "worker1":
+                raise Exception("step failed")
+
+            return 2
+
+        nodes = [f"worker{i}" for i in range(6)]
+        node_results = await dg.lib.fyre.openshift._initialize_nodes(nodes, NodeClient, initialize_node, 4)
+
+        self.assertEqual(list(node_results.keys()), nodes)
+        self.assertEqual(max_running_node_count, 4)
+        self.assertEqual(node_results["worker0"].get_summary(), "2 step(s) executed")
+        self.assertEqual(node_results["worker1"].get_summary(), "failed (step failed)")
+
+        with self.assertRaisesRegex(Exception, "worker1"):
+            dg.lib.fyre.openshift._raise_if_initialization_failed(node_results)
+
+    async def test_get_selinux_policy_module_package_file_path(self):
+        """Tests that the SELinux policy module package is compiled on a worker
+        node once per type enforcement file hash and toolchain and that only
+        the package is installed on worker nodes"""
+
+        async def compile_package(nodeClient, package_file_path: pathlib.Path):
+            package_file_path.write_text("package")
+
+        with tempfile.TemporaryDirectory() as temporary_directory, unittest.mock.patch(
+            "dg.config.data_gate_configuration_manager.get_dg_cache_directory_path",
+            return_value=pathlib.Path(temporary_directory),
+        ), unittest.mock.patch(
+            "dg.lib.fyre.openshift._compile_selinux_policy_module_package_on_node", side_effect=compile_package
+        ) as compile_mock:
+            get_package_file_path = dg.lib.fyre.openshift.get_selinux_policy_module_package_file_path
+            toolchain = "rhcos-46.82/19 (compatibility range 19-15)"
+            package_file_path = await get_package_file_path(None, "abc", toolchain)
+
+            self.assertEqual(package_file_path.relative_to(temporary_directory).parts[:2], ("selinux", "abc"))
+            self.assertEqual(package_file_path.name, "db2u-nfs.pp")
+            self.assertEqual(package_file_path.read_text(), "package")
+
+            self.assertEqual(await get_package_file_path(None, "abc", toolchain), package_file_path)
+            self.assertNotEqual(await get_package_file_path(None, "def", toolchain), package_file_path)
+
+            # packages compiled by a different toolchain are not reused
+            self.assertNotEqual(
+                await get_package_file_path(None, "abc", "rhcos-47.83/33 (compatibility range 33-15)"),
+                package_file_path,
+            )
+
+            self.assertEqual(compile_mock.call_count, 3)
+            self.assertEqual(list(package_file_path.parent.iterdir()), [package_file_path])
+
+        self.assertEqual(
+            dg.lib.fyre.openshift._get_data_gate_node_commands("abc"),
+            ["sudo semodule --install db2u-nfs.pp", "echo abc > db2u-nfs.sha256"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
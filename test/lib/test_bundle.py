@@ -0,0 +1,129 @@
+#  Copyright 2020 IBM Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import io
+import json
+import pathlib
+import tarfile
+import tempfile
+import unittest
+import unittest.mock
+
+from typing import Union
+
+import semver
+
+import dg.config
+import dg.lib.bundle
+
+from dg.config.binaries_manager import BinariesManager
+from dg.lib.download_manager.download_manager import DownloadManager
+from dg.lib.download_manager.download_manager_plugin import AbstractDownloadManagerPlugIn
+from dg.lib.error import DataGateCLIException
+
+
+class PlugIn(AbstractDownloadManagerPlugIn):
+    def download_binary_version(self, version: semver.VersionInfo) -> Union[str, None]:
+        self.get_binary_file_paths()[0].parent.mkdir(parents=True)
+        self.get_binary_file_paths()[0].write_bytes(b"binary")
+        self.get_binary_file_paths()[0].chmod(0o755)
+
+        return "sha256"
+
+    def get_binary_alias(self) -> str:
+        return "binary"
+
+    def get_binary_file_paths(self) -> list[pathlib.Path]:
+        return [dg.config.data_gate_configuration_manager.get_dg_bin_directory_path() / "binary"]
+
+    def get_latest_binary_version(self) -> semver.VersionInfo:
+        return semver.VersionInfo.parse("1.0.0")
+
+
+class TestBundle(unittest.TestCase):
+    def setUp(self):
+        self._temporary_directory = tempfile.TemporaryDirectory()
+        self._home_directory_path = pathlib.Path(self._temporary_directory.name) / "home"
+        self._bundle_path = pathlib.Path(self._temporary_directory.name) / "bundle.tar.gz"
+
+        patchers = [
+            unittest.mock.patch(
+                "dg.config.data_gate_configuration_manager.get_home_directory_path",
+                return_value=self._home_directory_path,
+            ),
+            unittest.mock.patch("dg.lib.bundle.binaries_manager", BinariesManager()),
+            unittest.mock.patch("dg.lib.download_manager.download_manager.binaries_manager", BinariesManager()),
+        ]
+
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.addCleanup(self._temporary_directory.cleanup)
+
+        download_manager = DownloadManager()
+        download_manager.register_plugin(PlugIn)
+
+        dg.lib.bundle.create_bundle(self._bundle_path, download_manager, [])
+
+        # simulate a new host
+        (self._home_directory_path / ".dg" / "bin" / "binary").unlink()
+        (self._home_directory_path / ".dg" / "binaries.json").unlink()
+
+    def test_install_bundle(self):
+        """Tests that a bundle populates the binaries directory and the
+        binaries file"""
+
+        with unittest.mock.patch("dg.lib.bundle.binaries_manager", BinariesManager()):
+            dg.lib.bundle.install_bundle(self._bundle_path)
+
+        binary_path = self._home_directory_path / ".dg" / "bin" / "binary"
+
+        self.assertEqual(binary_path.read_bytes(), b"binary")
+        self.assertEqual(binary_path.stat().st_mode & 0o777, 0o755)
+        self.assertEqual(
+            json.loads((self._home_directory_path / ".dg" / "binaries.json").read_text()),
+            {"sha256": {"binary": "sha256"}, "versions": {"binary": "1.0.0"}},
+        )
+
+    def test_install_modified_bundle(self):
+        """Tests that files not matching the manifest of a bundle are not
+        installed"""
+
+        members: list[tuple[tarfile.TarInfo, bytes]] = []
+
+        with tarfile.open(self._bundle_path) as tar_file:
+            for member in tar_file.getmembers():
+                extracted_file = tar_file.extractfile(member)
+
+                if extracted_file is not None:
+                    members.append((member, extracted_file.read()))
+
+        with tarfile.open(self._bundle_path, "w:gz") as tar_file:
+            for member, contents in members:
+                if member.name == "home/.dg/bin/binary":
+                    contents = b"modified"
+                    member.size = len(contents)
+
+                tar_file.addfile(member, io.BytesIO(contents))
+
+        with self.assertRaisesRegex(DataGateCLIException, "does not match the manifest"):
+            dg.lib.bundle.install_bundle(self._bundle_path)
+
+        self.assertEqual(list((self._home_directory_path / ".dg" / "bin").iterdir()), [])
+        self.assertFalse((self._home_directory_path / ".dg" / "binaries.json").exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
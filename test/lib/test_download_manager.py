@@ -0,0 +1,125 @@
+#  Copyright 2020 IBM Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import json
+import pathlib
+import tempfile
+import threading
+import time
+import unittest
+import unittest.mock
+
+from typing import Union
+
+import semver
+
+from dg.config.binaries_manager import BinariesManager
+from dg.lib.download_manager.download_manager import DownloadManager
+from dg.lib.download_manager.download_manager_plugin import AbstractDownloadManagerPlugIn
+from dg.lib.error import DataGateCLIException
+
+
+class TestDownloadManager(unittest.TestCase):
+    def test_download_dependencies_if_required(self):
+        """Tests that latest versions are determined concurrently, that
+        outdated dependencies are downloaded in parallel, and that a failure
+        of one plug-in does not abort other downloads"""
+
+        lock = threading.Lock()
+        running_download_count = 0
+        max_running_download_count = 0
+        running_version_query_count = 0
+        max_running_version_query_count = 0
+
+        def create_plugin_class(alias: str, latest_version: str, is_failing: bool = False):
+            class PlugIn(AbstractDownloadManagerPlugIn):
+                def download_binary_version(self, version: semver.VersionInfo) -> Union[str, None]:
+                    nonlocal max_running_download_count, running_download_count
+
+                    with lock:
+                        running_download_count += 1
+                        max_running_download_count = max(max_running_download_count, running_download_count)
+
+                    time.sleep(0.1)
+
+                    with lock:
+                        running_download_count -= 1
+
+                    if is_failing:
+                        raise Exception("download failed")
+
+                    return f"sha256-{alias}"
+
+                def get_binary_alias(self) -> str:
+                    return alias
+
+                def get_binary_file_paths(self) -> list[pathlib.Path]:
+                    return []
+
+                def get_latest_binary_version(self) -> semver.VersionInfo:
+                    nonlocal max_running_version_query_count, running_version_query_count
+
+                    with lock:
+                        running_version_query_count += 1
+                        max_running_version_query_count = max(
+                            max_running_version_query_count, running_version_query_count
+                        )
+
+                    time.sleep(0.1)
+
+                    with lock:
+                        running_version_query_count -= 1
+
+                    return semver.VersionInfo.parse(latest_version)
+
+            return PlugIn
+
+        download_manager = DownloadManager()
+
+        for plugin_class in [
+            create_plugin_class("a", "1.0.0"),
+            create_plugin_class("b", "2.0.0"),
+            create_plugin_class("c", "3.0.0"),
+            create_plugin_class("d", "4.0.0", is_failing=True),
+            create_plugin_class("e", "1.0.0"),
+        ]:
+            download_manager.register_plugin(plugin_class)
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            binaries_file_path = pathlib.Path(temporary_directory) / "binaries.json"
+            # binaries file of a previous version of the Data Gate CLI
+            binaries_file_path.write_text(json.dumps({"e": "1.0.0", "sha256": {"e": "sha256-e"}}))
+            binaries_manager = BinariesManager()
+
+            with unittest.mock.patch(
+                "dg.config.data_gate_configuration_manager.get_dg_directory_path",
+                return_value=pathlib.Path(temporary_directory),
+            ), unittest.mock.patch("dg.lib.download_manager.download_manager.binaries_manager", binaries_manager):
+                with self.assertRaisesRegex(DataGateCLIException, "Downloading dependencies failed: d"):
+                    download_manager.download_dependencies_if_required(max_parallelism=2)
+
+            self.assertEqual(
+                json.loads(binaries_file_path.read_text()),
+                {
+                    "sha256": {"a": "sha256-a", "b": "sha256-b", "c": "sha256-c", "e": "sha256-e"},
+                    "versions": {"a": "1.0.0", "b": "2.0.0", "c": "3.0.0", "e": "1.0.0"},
+                },
+            )
+
+        self.assertEqual(max_running_version_query_count, 5)
+        self.assertEqual(max_running_download_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+#  Copyright 2020 IBM Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import json
+import pathlib
+import tempfile
+import time
+import unittest
+
+from dg.lib.error import DataGateCLIException
+from dg.lib.github import GitHubAPIClient
+from test.utils.local_http_server import LocalHTTPServer
+
+
+class TestGitHubAPIClient(unittest.TestCase):
+    def test_get_pages(self):
+        """Tests that pages are requested lazily and that cached responses are
+        revalidated using their ETag"""
+
+        files = {
+            "/repos/owner/repo/releases": json.dumps([{"name": "v2.0.0"}, {"name": "v1.1.0"}]).encode(),
+            "/repos/owner/repo/releases?page=2": json.dumps([{"name": "v1.0.0"}]).encode(),
+        }
+
+        with tempfile.TemporaryDirectory() as cache_directory_path, LocalHTTPServer(files) as server:
+            server.headers["/repos/owner/repo/releases"] = {
+                "Link": f'<{server.get_url("/repos/owner/repo/releases?page=2").geturl()}>; rel="next"'
+            }
+
+            client = GitHubAPIClient(pathlib.Path(cache_directory_path), "token", server.get_url("").geturl())
+
+            self.assertEqual(next(client.get_releases("owner", "repo")), {"name": "v2.0.0"})
+            self.assertEqual(len(server.requests), 1)
+            self.assertEqual(server.requests[0][1]["Authorization"], "token token")
+
+            self.assertEqual(
+                [release["name"] for release in client.get_releases("owner", "repo")], ["v2.0.0", "v1.1.0", "v1.0.0"]
+            )
+            self.assertEqual(len(server.requests), 3)
+            self.assertEqual(server.requests[1][1]["If-None-Match"], server.get_etag("/repos/owner/repo/releases"))
+            self.assertNotIn("If-None-Match", server.requests[2][1])
+
+            self.assertIsNone(client.get_latest_release("owner", "repo"))
+
+    def test_rate_limit(self):
+        """Tests that no requests are sent while the rate limit is exceeded"""
+
+        files = {
+            "/repos/owner/repo/releases/latest": json.dumps({"name": "v1.0.0"}).encode(),
+            "/repos/owner/repo/releases/tags/v1.0.0": json.dumps({"name": "v1.0.0"}).encode(),
+        }
+
+        headers = {
+            "/repos/owner/repo/releases/latest": {
+                "X-RateLimit-Remaining": "0",
+                "X-RateLimit-Reset": str(int(time.time()) + 3600),
+            }
+        }
+
+        with tempfile.TemporaryDirectory() as cache_directory_path, LocalHTTPServer(files, headers=headers) as server:
+            client = GitHubAPIClient(pathlib.Path(cache_directory_path), api_url=server.get_url("").geturl())
+
+            self.assertEqual(client.get_latest_release("owner", "repo"), {"name": "v1.0.0"})
+
+            # the rate limit state is shared by clients using the same cache
+            # directory
+            client = GitHubAPIClient(pathlib.Path(cache_directory_path), api_url=server.get_url("").geturl())
+
+            self.assertEqual(client.get_latest_release("owner", "repo"), {"name": "v1.0.0"})
+
+            with self.assertRaises(DataGateCLIException):
+                client.get_release_by_tag("owner", "repo", "v1.0.0")
+
+            self.assertEqual(len(server.requests), 1)
+
+            # rate limits of authenticated and unauthenticated requests are
+            # separate
+            client = GitHubAPIClient(pathlib.Path(cache_directory_path), "token", server.get_url("").geturl())
+
+            self.assertEqual(client.get_release_by_tag("owner", "repo", "v1.0.0"), {"name": "v1.0.0"})
+            self.assertEqual(len(server.requests), 2)
@@ -0,0 +1,129 @@
+#  Copyright 2020 IBM Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import json
+import pathlib
+import tempfile
+import unittest
+import unittest.mock
+
+import dg.lib.openshift
+import dg.utils.process
+
+from dg.lib.error import DataGateCLIException
+from test.utils.local_http_server import LocalHTTPServer
+
+
+class TestOpenShiftUtilities(unittest.TestCase):
+    def test_get_kubeconfig_file_path(self):
+        """Tests dg.lib.openshift.get_kubeconfig_file_path()"""
+
+        self.assertEqual(
+            dg.lib.openshift.get_kubeconfig_file_path("https://api.cluster.os.fyre.ibm.com:6443").name,
+            "api.cluster.os.fyre.ibm.com_6443",
+        )
+
+        self.assertEqual(
+            dg.lib.openshift.get_kubeconfig_file_path("cluster1.cloud.example.com:12345").name,
+            "cluster1.cloud.example.com_12345",
+        )
+
+    def test_get_openshift_version(self):
+        """Tests that dg.lib.openshift.get_openshift_version() falls back to
+        "oc version" if the ClusterVersion resource does not exist (OpenShift
+        3)"""
+
+        with unittest.mock.patch(
+            "dg.lib.openshift.get_kubernetes_api_resource",
+            return_value={"status": {"desired": {"version": "4.6.1"}}},
+        ), unittest.mock.patch("dg.lib.openshift.execute_oc_command") as execute_oc_command_mock:
+            self.assertEqual(dg.lib.openshift.get_openshift_version(), "4.6.1")
+            execute_oc_command_mock.assert_not_called()
+
+        with unittest.mock.patch(
+            "dg.lib.openshift.get_kubernetes_api_resource",
+            side_effect=DataGateCLIException("Command 'oc get --raw' failed with return code 1."),
+        ), unittest.mock.patch(
+            "dg.lib.openshift.execute_oc_command",
+            return_value=dg.utils.process.ProcessResult(0, "", '{"openshiftVersion": "3.11.306"}'),
+        ) as execute_oc_command_mock:
+            self.assertEqual(dg.lib.openshift.get_openshift_version(), "3.11.306")
+            execute_oc_command_mock.assert_called_once_with(["version", "--output", "json"], capture_output=True)
+
+    def test_log_in_to_openshift_cluster_with_password(self):
+        """Tests that a stored OAuth access token is only reused if it was
+        issued to the given user"""
+
+        with tempfile.TemporaryDirectory() as temporary_directory_name, LocalHTTPServer(
+            {"/apis/user.openshift.io/v1/users/~": json.dumps({"metadata": {"name": "kubeadmin"}}).encode()}
+        ) as server:
+            kubeconfig_file_path = pathlib.Path(temporary_directory_name) / "kubeconfig"
+            kubeconfig_file_path.write_text(
+                "contexts:\n"
+                "- context:\n"
+                "    user: kubeadmin/cluster-1\n"
+                "  name: context-1\n"
+                "current-context: context-1\n"
+                "users:\n"
+                "- name: kubeadmin/cluster-1\n"
+                "  user:\n"
+                "    token: token-1\n"
+            )
+
+            server_url = server.get_url("").geturl()
+
+            self.assertEqual(dg.lib.openshift.get_token_user_name(server_url, "token-1"), "kubeadmin")
+
+            with unittest.mock.patch(
+                "dg.lib.openshift.use_kubeconfig_file", return_value=kubeconfig_file_path
+            ), unittest.mock.patch("dg.lib.openshift.execute_oc_command") as execute_oc_command_mock:
+                dg.lib.openshift.log_in_to_openshift_cluster_with_password(server_url, "kubeadmin", "password")
+                execute_oc_command_mock.assert_not_called()
+
+                # different user
+                dg.lib.openshift.log_in_to_openshift_cluster_with_password(server_url, "developer", "password")
+                execute_oc_command_mock.assert_called_once_with(
+                    dg.lib.openshift.get_oc_login_args_with_password(server_url, "developer", "password")
+                )
+
+    def test_get_token_from_kubeconfig_file(self):
+        """Tests dg.lib.openshift.get_token_from_kubeconfig_file()"""
+
+        with tempfile.TemporaryDirectory() as temporary_directory_name:
+            kubeconfig_file_path = pathlib.Path(temporary_directory_name) / "kubeconfig"
+
+            self.assertIsNone(dg.lib.openshift.get_token_from_kubeconfig_file(kubeconfig_file_path))
+
+            kubeconfig_file_path.write_text(
+                "apiVersion: v1\n"
+                "contexts:\n"
+                "- context:\n"
+                "    cluster: cluster-1\n"
+                "    user: kubeadmin/cluster-1\n"
+                "  name: context-1\n"
+                "current-context: context-1\n"
+                "users:\n"
+                "- name: kubeadmin/cluster-2\n"
+                "  user:\n"
+                "    token: token-2\n"
+                "- name: kubeadmin/cluster-1\n"
+                "  user:\n"
+                "    token: token-1\n"
+            )
+
+            self.assertEqual(dg.lib.openshift.get_token_from_kubeconfig_file(kubeconfig_file_path), "token-1")
+
+
+if __name__ == "__main__":
+    unittest.main()
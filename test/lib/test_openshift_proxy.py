@@ -0,0 +1,113 @@
+#  Copyright 2020 IBM Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import os
+import pathlib
+import stat
+import sys
+import tempfile
+import unittest
+
+from dg.lib.error import DataGateCLIException
+from dg.lib.openshift_proxy import OpenShiftProxy
+
+# stand-in for "oc proxy" serving a single JSON document (FAKE_OC_MODE may be
+# set to "warning", "silent", or "fail")
+FAKE_OC_CLI = f"""#!{sys.executable}
+import http.server
+import json
+import os
+import sys
+import time
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = json.dumps({{"path": self.path}}).encode()
+
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+mode = os.environ.get("FAKE_OC_MODE")
+
+if mode == "warning":
+    print("WARNING: kubeconfig file is group-readable", file=sys.stderr, flush=True)
+    print("Flag --port has been deprecated", flush=True)
+elif mode == "silent":
+    time.sleep(60)
+elif mode == "fail":
+    print("error: unable to load kubeconfig", file=sys.stderr, flush=True)
+    sys.exit(1)
+
+server = http.server.HTTPServer(("127.0.0.1", 0), Handler)
+print(f"Starting to serve on 127.0.0.1:{{server.server_port}}", flush=True)
+server.serve_forever()
+"""
+
+
+@unittest.skipIf(sys.platform == "win32", "requires a POSIX shebang")
+class TestOpenShiftProxy(unittest.TestCase):
+    def test_get(self):
+        """Tests that requests are sent through the proxy process"""
+
+        with tempfile.TemporaryDirectory() as temporary_directory_name:
+            oc_cli_path = self._create_fake_oc_cli(pathlib.Path(temporary_directory_name))
+
+            with OpenShiftProxy(oc_cli_path) as openshift_proxy:
+                self.assertTrue(openshift_proxy.is_running())
+                self.assertEqual(openshift_proxy.get("/api/v1/nodes"), {"path": "/api/v1/nodes"})
+
+            self.assertFalse(openshift_proxy.is_running())
+
+            with self.assertRaisesRegex(DataGateCLIException, "oc proxy is not running"):
+                openshift_proxy.get("/api/v1/nodes")
+
+    def test_start(self):
+        """Tests that output preceding the address the proxy listens on is
+        skipped and that the start of the proxy process times out"""
+
+        with tempfile.TemporaryDirectory() as temporary_directory_name:
+            oc_cli_path = self._create_fake_oc_cli(pathlib.Path(temporary_directory_name))
+
+            with OpenShiftProxy(oc_cli_path, dict(os.environ, FAKE_OC_MODE="warning")) as openshift_proxy:
+                self.assertEqual(openshift_proxy.get("/api/v1/nodes"), {"path": "/api/v1/nodes"})
+
+            openshift_proxy = OpenShiftProxy(oc_cli_path, dict(os.environ, FAKE_OC_MODE="silent"), start_timeout=0.5)
+
+            with self.assertRaisesRegex(DataGateCLIException, "oc proxy did not start within 0.5 seconds"):
+                openshift_proxy.start()
+
+            self.assertFalse(openshift_proxy.is_running())
+
+            openshift_proxy = OpenShiftProxy(oc_cli_path, dict(os.environ, FAKE_OC_MODE="fail"))
+
+            with self.assertRaisesRegex(DataGateCLIException, "could not be started(.|\\n)*unable to load kubeconfig"):
+                openshift_proxy.start()
+
+    def _create_fake_oc_cli(self, directory_path: pathlib.Path) -> pathlib.Path:
+        oc_cli_path = directory_path / "oc"
+        oc_cli_path.write_text(FAKE_OC_CLI)
+        os.chmod(oc_cli_path, os.stat(oc_cli_path).st_mode | stat.S_IXUSR)
+
+        return oc_cli_path
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,209 @@
+#  Copyright 2020 IBM Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import gzip
+import hashlib
+import http.server
+import re as regex
+import threading
+import time
+import urllib.parse
+
+from typing import Union
+
+import dg.utils.http
+
+
+class LocalHTTPServer:
+    """HTTP server listening on localhost for testing purposes
+
+    Files are served from memory. Range requests and ETags (based on the
+    SHA-256 hash of a file) are supported unless disabled. Responses may be
+    gzip-encoded (ranges then refer to encoded bytes). Latency and
+    per-connection bandwidth may be shaped to simulate remote servers.
+    """
+
+    def __init__(
+        self,
+        files: dict[str, bytes],
+        support_ranges: bool = True,
+        headers: Union[dict[str, dict[str, str]], None] = None,
+        latency: float = 0,
+        bandwidth: Union[int, None] = None,
+        gzip_encoding: bool = False,
+    ):
+        """Constructor
+
+        Parameters
+        ----------
+        files
+            dictionary associating URL paths with file contents
+        support_ranges
+            flag indicating whether range requests shall be supported
+        headers
+            dictionary associating URL paths with additional response headers
+        latency
+            number of seconds each response is delayed
+        bandwidth
+            maximum number of bytes per second sent on each connection
+            (unlimited if None)
+        gzip_encoding
+            flag indicating whether responses shall be gzip-encoded if the
+            client accepts it
+        """
+
+        self.bandwidth = bandwidth
+        self.files = files
+        self.gzip_encoding = gzip_encoding
+        self.headers = headers if headers is not None else {}
+        self.latency = latency
+        self.requests: list[tuple[str, dict[str, str]]] = []
+        self.support_ranges = support_ranges
+
+        self._server: Union[http.server.ThreadingHTTPServer, None] = None
+        self._thread: Union[threading.Thread, None] = None
+
+    def __enter__(self):
+        self.start()
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def get_etag(self, path: str) -> str:
+        return '"' + hashlib.sha256(self.files[path]).hexdigest() + '"'
+
+    def get_url(self, path: str) -> urllib.parse.SplitResult:
+        if self._server is None:
+            raise Exception("Server is not running")
+
+        return urllib.parse.urlsplit(f"http://127.0.0.1:{self._server.server_address[1]}{path}")
+
+    def start(self):
+        local_http_server = self
+
+        class RequestHandler(http.server.BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                local_http_server.requests.append((self.path, dict(self.headers.items())))
+
+                if local_http_server.latency != 0:
+                    time.sleep(local_http_server.latency)
+
+                if self.path not in local_http_server.files:
+                    self.send_error(404)
+
+                    return
+
+                content = local_http_server.files[self.path]
+                is_gzip_encoded = local_http_server.gzip_encoding and (
+                    "gzip" in self.headers.get("Accept-Encoding", "")
+                )
+
+                if is_gzip_encoded:
+                    content = gzip.compress(content, mtime=0)
+
+                etag = local_http_server.get_etag(self.path)
+
+                if self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self._send_additional_headers()
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+
+                    return
+
+                start, end = 0, len(content)
+                range_header = self.headers.get("Range")
+                search_result = regex.match("bytes=(\\d+)-(\\d*)$", range_header) if range_header is not None else None
+
+                if (
+                    local_http_server.support_ranges
+                    and (search_result is not None)
+                    and (self.headers.get("If-Range", etag) == etag)
+                ):
+                    start = int(search_result.group(1))
+                    end = int(search_result.group(2)) + 1 if search_result.group(2) != "" else len(content)
+
+                    self.send_response(206)
+                    self.send_header("Content-Range", f"bytes {start}-{end - 1}/{len(content)}")
+                else:
+                    self.send_response(200)
+
+                if local_http_server.support_ranges:
+                    self.send_header("Accept-Ranges", "bytes")
+
+                if is_gzip_encoded:
+                    self.send_header("Content-Encoding", "gzip")
+
+                self.send_header("Content-Length", str(end - start))
+                self.send_header("ETag", etag)
+                self._send_additional_headers()
+                self.end_headers()
+
+                try:
+                    self._write_content(memoryview(content)[start:end])
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+
+            def log_message(self, format, *args):
+                pass
+
+            def _write_content(self, content: memoryview):
+                if local_http_server.bandwidth is None:
+                    self.wfile.write(content)
+
+                    return
+
+                chunk_size = 65536
+                start_time = time.perf_counter()
+
+                for offset in range(0, len(content), chunk_size):
+                    chunk_end = min(offset + chunk_size, len(content))
+
+                    self.wfile.write(content[offset:chunk_end])
+
+                    # sleep until the bandwidth is not exceeded anymore
+                    delay = start_time + chunk_end / local_http_server.bandwidth - time.perf_counter()
+
+                    if delay > 0:
+                        time.sleep(delay)
+
+            def _send_additional_headers(self):
+                for key, value in local_http_server.headers.get(self.path, {}).items():
+                    self.send_header(key, value)
+
+        class HTTPServer(http.server.ThreadingHTTPServer):
+            def handle_error(self, request, client_address):
+                # clients may close connections before reading a response
+                # (e.g., when resuming downloads)
+                pass
+
+        self._server = HTTPServer(("127.0.0.1", 0), RequestHandler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+            # pooled connections of the shared HTTP sessions to the server
+            # would otherwise be left open
+            dg.utils.http.close_http_sessions()
@@ -0,0 +1,115 @@
+#  Copyright 2020 IBM Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import asyncio
+import pathlib
+
+from typing import Union
+
+import asyncssh
+
+
+class LocalSSHServer:
+    """SSH server listening on localhost for testing purposes
+
+    Commands are executed by a local shell within the given root directory,
+    which is also the root directory of the SFTP server. Clients are not
+    authenticated.
+    """
+
+    def __init__(self, root_directory_path: pathlib.Path):
+        self.root_directory_path = root_directory_path
+
+        self._server: Union[asyncssh.SSHAcceptor, None] = None
+
+    async def __aenter__(self):
+        await self.start()
+
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.stop()
+
+    def get_connect_options(self) -> dict:
+        """Returns options to be passed to asyncssh.connect()"""
+
+        return {"known_hosts": None, "port": self.get_port()}
+
+    def get_port(self) -> int:
+        if self._server is None:
+            raise Exception("Server is not running")
+
+        return self._server.get_port()
+
+    async def start(self):
+        root_directory_path = self.root_directory_path
+
+        class SSHServer(asyncssh.SSHServer):
+            def begin_auth(self, username: str) -> bool:
+                return False
+
+        class SFTPServer(asyncssh.SFTPServer):
+            def __init__(self, channel: asyncssh.SSHServerChannel):
+                super().__init__(channel, chroot=str(root_directory_path).encode())
+
+        self._server = await asyncssh.create_server(
+            SSHServer,
+            "127.0.0.1",
+            0,
+            encoding=None,
+            process_factory=self._execute,
+            server_host_keys=[asyncssh.generate_private_key("ssh-ed25519")],
+            sftp_factory=SFTPServer,
+        )
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+
+            await self._server.wait_closed()
+
+            self._server = None
+
+    async def _execute(self, process: asyncssh.SSHServerProcess):
+        local_process = await asyncio.create_subprocess_shell(
+            process.command,
+            cwd=self.root_directory_path,
+            stderr=asyncio.subprocess.PIPE,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+        )
+
+        async def forward_input():
+            while len(data := await process.stdin.read(65536)) != 0:
+                local_process.stdin.write(data)
+
+                await local_process.stdin.drain()
+
+            local_process.stdin.close()
+
+        async def forward_output(stream: asyncio.StreamReader, writer: asyncssh.SSHWriter):
+            while len(data := await stream.read(65536)) != 0:
+                writer.write(data)
+
+        input_task = asyncio.create_task(forward_input())
+
+        await asyncio.gather(
+            forward_output(local_process.stdout, process.stdout),
+            forward_output(local_process.stderr, process.stderr),
+        )
+
+        return_code = await local_process.wait()
+        input_task.cancel()
+
+        process.exit(return_code)
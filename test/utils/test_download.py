@@ -0,0 +1,441 @@
+#  Copyright 2020 IBM Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import hashlib
+import io
+import json
+import multiprocessing
+import os
+import pathlib
+import tarfile
+import tempfile
+import unittest
+import unittest.mock
+import zipfile
+
+import dg.utils.download
+import dg.utils.download_cache
+
+from test.utils.local_http_server import LocalHTTPServer
+
+
+@unittest.mock.patch("dg.utils.download.MIN_SEGMENT_SIZE", 1000)
+class TestDownload(unittest.TestCase):
+    def setUp(self):
+        # the download cache may have been set by other tests invoking the CLI
+        dg.utils.download_cache.set_download_cache(None)
+
+    def test_download_file(self):
+        """Tests that files are downloaded in segments if the server supports
+        range requests and using a single request otherwise"""
+
+        content = os.urandom(10000)
+
+        for support_ranges, expected_request_count in [(True, 4), (False, 1)]:
+            with tempfile.TemporaryDirectory() as temporary_directory, LocalHTTPServer(
+                {"/archive.tar.gz": content}, support_ranges=support_ranges
+            ) as server:
+                path = dg.utils.download.download_file(
+                    server.get_url("/archive.tar.gz"), target_directory_path=pathlib.Path(temporary_directory)
+                )
+
+                self.assertEqual(path, pathlib.Path(temporary_directory) / "archive.tar.gz")
+                self.assertEqual(path.read_bytes(), content)
+                self.assertEqual(len(server.requests), expected_request_count)
+
+                if support_ranges:
+                    self.assertEqual(
+                        sorted(headers.get("Range", "") for _, headers in server.requests),
+                        ["", "bytes=2500-4999", "bytes=5000-7499", "bytes=7500-9999"],
+                    )
+
+                    self.assertEqual(server.requests[1][1]["If-Range"], server.get_etag("/archive.tar.gz"))
+
+                self.assertEqual(list(pathlib.Path(temporary_directory).iterdir()), [path])
+
+    def test_download_gzip_encoded_file(self):
+        """Tests that gzip-encoded responses are not truncated to their
+        Content-Length (i.e., the size of the encoded body)"""
+
+        content = b"a" * 100000
+
+        with tempfile.TemporaryDirectory() as temporary_directory, LocalHTTPServer(
+            {"/index.yaml": content}, gzip_encoding=True
+        ) as server:
+            path = dg.utils.download.download_file(
+                server.get_url("/index.yaml"),
+                expected_sha256=hashlib.sha256(content).hexdigest(),
+                target_directory_path=pathlib.Path(temporary_directory),
+            )
+
+            self.assertEqual(path.read_bytes(), content)
+            self.assertEqual(len(server.requests), 1)
+            self.assertEqual(list(pathlib.Path(temporary_directory).iterdir()), [path])
+
+    def test_resume_download(self):
+        """Tests that interrupted downloads are resumed if the file did not
+        change and restarted otherwise"""
+
+        content = os.urandom(10000)
+
+        with tempfile.TemporaryDirectory() as temporary_directory, LocalHTTPServer(
+            {"/archive.tar.gz": content}
+        ) as server:
+            url = server.get_url("/archive.tar.gz")
+            path = pathlib.Path(temporary_directory) / "archive.tar.gz"
+
+            for etag, expected_ranges in [
+                (server.get_etag("/archive.tar.gz"), ["", "bytes=4000-4999", "bytes=9000-9999"]),
+                ('"changed"', ["", "bytes=5000-9999"]),
+            ]:
+                # simulate a download interrupted after 4000 bytes of the first
+                # segment and 4000 bytes of the second segment were received
+                part_path = path.with_name("archive.tar.gz.part")
+                part_path.write_bytes(content[:4000] + bytes(1000) + content[5000:9000] + bytes(1000))
+                path.with_name("archive.tar.gz.part.json").write_text(
+                    json.dumps(
+                        {
+                            "url": url.geturl(),
+                            "validator": etag,
+                            "size": len(content),
+                            "segments": [[0, 5000, 4000], [5000, 10000, 4000]],
+                        }
+                    )
+                )
+
+                server.requests.clear()
+
+                # bytes received before the download was resumed are hashed
+                self.assertEqual(
+                    dg.utils.download.download_file(
+                        url,
+                        connection_count=2,
+                        expected_sha256=hashlib.sha256(content).hexdigest(),
+                        target_directory_path=temporary_directory,
+                    ),
+                    path,
+                )
+
+                self.assertEqual(path.read_bytes(), content)
+                self.assertEqual(sorted(headers.get("Range", "") for _, headers in server.requests), expected_ranges)
+                self.assertEqual(list(pathlib.Path(temporary_directory).iterdir()), [path])
+
+    def test_save_partial_download(self):
+        """Tests that the number of received bytes is recorded if a download
+        fails"""
+
+        content = os.urandom(10000)
+
+        with tempfile.TemporaryDirectory() as temporary_directory, LocalHTTPServer(
+            {"/archive.tar.gz": content}
+        ) as server, unittest.mock.patch(
+            "dg.utils.download.PartialDownload.complete", side_effect=Exception("interrupted")
+        ):
+            with self.assertRaisesRegex(Exception, "interrupted"):
+                dg.utils.download.download_file(
+                    server.get_url("/archive.tar.gz"), target_directory_path=temporary_directory
+                )
+
+            sidecar = json.loads((pathlib.Path(temporary_directory) / "archive.tar.gz.part.json").read_text())
+
+            self.assertEqual(sidecar["validator"], server.get_etag("/archive.tar.gz"))
+            self.assertEqual(sum(segment[2] for segment in sidecar["segments"]), len(content))
+
+    def test_remove_partial_download(self):
+        """Tests that the .part file is removed if a download which cannot be
+        resumed fails"""
+
+        with tempfile.TemporaryDirectory() as temporary_directory, LocalHTTPServer(
+            {"/archive.tar.gz": os.urandom(10000)}, support_ranges=False
+        ) as server, unittest.mock.patch("dg.utils.download._download_segments", side_effect=Exception("interrupted")):
+            with self.assertRaisesRegex(Exception, "interrupted"):
+                dg.utils.download.download_file(
+                    server.get_url("/archive.tar.gz"), target_directory_path=temporary_directory
+                )
+
+            self.assertEqual(list(pathlib.Path(temporary_directory).iterdir()), [])
+
+    def test_download_and_extract_archive(self):
+        """Tests that tar.gz archives are extracted while they are downloaded
+        and that member filters are applied"""
+
+        archive = _create_tar_gz_archive({"cpd-cli-linux-EE-3.5.2-1/cpd-cli": b"cpd-cli", "README.md": b"README"})
+
+        with tempfile.TemporaryDirectory() as temporary_directory, LocalHTTPServer(
+            {"/cpd-cli-linux-EE-3.5.2.tar.gz": archive}
+        ) as server, unittest.mock.patch("dg.utils.download.download_file") as download_file_mock:
+            self.assertEqual(
+                dg.utils.download.download_and_extract_archive(
+                    server.get_url("/cpd-cli-linux-EE-3.5.2.tar.gz"),
+                    pathlib.Path(temporary_directory),
+                    directoryPathToStartExtraction="cpd-cli-linux-EE-\\d+.\\d+.\\d+-\\d+",
+                ),
+                "cpd-cli-linux-EE-3.5.2.tar.gz",
+            )
+
+            download_file_mock.assert_not_called()
+            self.assertEqual(
+                list(pathlib.Path(temporary_directory).iterdir()), [pathlib.Path(temporary_directory) / "cpd-cli"]
+            )
+            self.assertEqual((pathlib.Path(temporary_directory) / "cpd-cli").read_bytes(), b"cpd-cli")
+
+    def test_verify_sha256(self):
+        """Tests that SHA-256 hashes are computed while files are downloaded
+        and that files are removed if their hash does not match"""
+
+        content = os.urandom(10000)
+        sha256 = hashlib.sha256(content).hexdigest()
+        archive = _create_tar_gz_archive({"oc": b"oc"})
+
+        with tempfile.TemporaryDirectory() as temporary_directory, LocalHTTPServer(
+            {
+                "/archive.tar.gz": content,
+                "/oc.tar.gz": archive,
+                "/sha256sum.txt": f"{sha256}  archive.tar.gz\n{'0' * 64}  oc.tar.gz\n".encode(),
+            }
+        ) as server:
+            for connection_count in [1, 4]:
+                sha256_hashes: list[str] = []
+                path = dg.utils.download.download_file(
+                    server.get_url("/archive.tar.gz"),
+                    connection_count=connection_count,
+                    expected_sha256=dg.utils.download.get_sha256_from_checksum_file(
+                        server.get_url("/sha256sum.txt"), "archive.tar.gz"
+                    ),
+                    sha256_func=sha256_hashes.append,
+                    target_directory_path=temporary_directory,
+                )
+
+                self.assertEqual(sha256_hashes, [sha256])
+
+                path.unlink()
+
+                with self.assertRaisesRegex(Exception, "SHA-256 hash of downloaded file does not match"):
+                    dg.utils.download.download_file(
+                        server.get_url("/archive.tar.gz"),
+                        connection_count=connection_count,
+                        expected_sha256="0" * 64,
+                        target_directory_path=temporary_directory,
+                    )
+
+                self.assertEqual(list(pathlib.Path(temporary_directory).iterdir()), [])
+
+            with self.assertRaisesRegex(Exception, "SHA-256 hash of downloaded file does not match"):
+                dg.utils.download.download_and_extract_archive(
+                    server.get_url("/oc.tar.gz"),
+                    pathlib.Path(temporary_directory),
+                    expected_sha256=dg.utils.download.get_sha256_from_checksum_file(
+                        server.get_url("/sha256sum.txt"), "oc.tar.gz"
+                    ),
+                )
+
+            self.assertEqual(list(pathlib.Path(temporary_directory).iterdir()), [])
+
+            dg.utils.download.download_and_extract_archive(
+                server.get_url("/oc.tar.gz"),
+                pathlib.Path(temporary_directory),
+                expected_sha256=hashlib.sha256(archive).hexdigest(),
+            )
+
+            self.assertEqual(
+                list(pathlib.Path(temporary_directory).iterdir()), [pathlib.Path(temporary_directory) / "oc"]
+            )
+
+
+class TestDownloadCache(unittest.TestCase):
+    def test_download_cache(self):
+        """Tests that unchanged files are not downloaded again"""
+
+        content = os.urandom(10000)
+
+        with tempfile.TemporaryDirectory() as temporary_directory, LocalHTTPServer(
+            {"/archive.tar.gz": content, "/repo.yaml": b"registry: []"}
+        ) as server:
+            download_cache = dg.utils.download_cache.DownloadCache(pathlib.Path(temporary_directory) / "cache")
+            target_directory_path = pathlib.Path(temporary_directory) / "target"
+            target_directory_path.mkdir()
+
+            dg.utils.download_cache.set_download_cache(download_cache)
+            self.addCleanup(dg.utils.download_cache.set_download_cache, None)
+
+            for _ in range(2):
+                path = dg.utils.download.download_file(
+                    server.get_url("/archive.tar.gz"), target_directory_path=target_directory_path
+                )
+
+                self.assertEqual(path.read_bytes(), content)
+
+                blob_path = download_cache.get_blob_path(
+                    download_cache.get_entry(server.get_url("/archive.tar.gz").geturl())
+                )
+
+                # downloaded files may be modified without modifying cached
+                # files
+                blob_mode = blob_path.stat().st_mode
+
+                self.assertFalse(os.path.samefile(path, blob_path))
+                os.chmod(path, 0o700)
+                self.assertEqual(blob_path.stat().st_mode, blob_mode)
+
+                with io.BytesIO() as buffer:
+                    self.assertEqual(
+                        dg.utils.download.download_file_into_buffer(server.get_url("/repo.yaml"), buffer), "repo.yaml"
+                    )
+
+                    self.assertEqual(buffer.getvalue(), b"registry: []")
+
+            self.assertEqual(
+                [headers.get("If-None-Match") for _, headers in server.requests],
+                [None, None, server.get_etag("/archive.tar.gz"), server.get_etag("/repo.yaml")],
+            )
+
+            self.assertEqual(download_cache.get_size(), len(content) + len(b"registry: []"))
+            self.assertEqual(list(download_cache.get_temporary_directory_path().iterdir()), [])
+
+    def test_download_and_extract_cached_archive(self):
+        """Tests that archives are written into the download cache instead of
+        the temporary directory and that cached archives are extracted
+        directly from the cache"""
+
+        with io.BytesIO() as buffer:
+            with zipfile.ZipFile(buffer, "w") as zip_file:
+                zip_file.writestr("terraform", b"terraform")
+
+            zip_archive = buffer.getvalue()
+
+        tar_gz_archive = _create_tar_gz_archive({"cpd-cli": b"cpd-cli"})
+
+        for file_name, archive, extracted_file_name in [
+            ("terraform.zip", zip_archive, "terraform"),
+            ("cpd-cli.tar.gz", tar_gz_archive, "cpd-cli"),
+        ]:
+            with self.subTest(
+                file_name=file_name
+            ), tempfile.TemporaryDirectory() as temporary_directory, LocalHTTPServer(
+                {"/" + file_name: archive}
+            ) as server:
+                download_cache = dg.utils.download_cache.DownloadCache(pathlib.Path(temporary_directory) / "cache")
+                target_directory_path = pathlib.Path(temporary_directory) / "target"
+
+                dg.utils.download_cache.set_download_cache(download_cache)
+                self.addCleanup(dg.utils.download_cache.set_download_cache, None)
+
+                for _ in range(2):
+                    with unittest.mock.patch(
+                        "tempfile.NamedTemporaryFile", wraps=tempfile.NamedTemporaryFile
+                    ) as named_temporary_file_mock:
+                        self.assertEqual(
+                            dg.utils.download.download_and_extract_archive(
+                                server.get_url("/" + file_name),
+                                target_directory_path,
+                                expected_sha256=hashlib.sha256(archive).hexdigest(),
+                            ),
+                            file_name,
+                        )
+
+                    self.assertEqual(
+                        (target_directory_path / extracted_file_name).read_bytes(), extracted_file_name.encode()
+                    )
+
+                    for call in named_temporary_file_mock.call_args_list:
+                        self.assertIsNotNone(call.kwargs.get("dir"))
+                        self.assertTrue(pathlib.Path(call.kwargs["dir"]).is_relative_to(download_cache.directory_path))
+
+                    self.assertEqual(list(download_cache.get_temporary_directory_path().iterdir()), [])
+                    self.assertEqual(download_cache.get_size(), len(archive))
+
+                self.assertEqual(
+                    [headers.get("If-None-Match") for _, headers in server.requests],
+                    [None, server.get_etag("/" + file_name)],
+                )
+
+    def test_prune(self):
+        """Tests that least recently used files are evicted and that files
+        downloaded from different URLs are stored once"""
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            download_cache = dg.utils.download_cache.DownloadCache(pathlib.Path(temporary_directory), max_size=2500)
+
+            for name, content in [("a", b"a" * 1000), ("b", b"b" * 1000), ("c", b"a" * 1000)]:
+                path = pathlib.Path(temporary_directory) / name
+                path.write_bytes(content)
+                download_cache.store(
+                    f"https://example.com/{name}", f"https://example.com/{name}", path, name, '"e"', None
+                )
+
+            self.assertEqual(download_cache.get_size(), 2000)
+
+            download_cache.touch("https://example.com/a")
+            path = pathlib.Path(temporary_directory) / "d"
+            path.write_bytes(b"d" * 1000)
+            download_cache.store("https://example.com/d", "https://example.com/d", path, "d", '"e"', None)
+
+            self.assertEqual(
+                sorted(download_cache.get_entries().keys()),
+                ["https://example.com/a", "https://example.com/c", "https://example.com/d"],
+            )
+
+            self.assertEqual(download_cache.get_size(), 2000)
+            self.assertEqual(download_cache.prune(0), 2)
+            self.assertEqual(download_cache.get_entries(), {})
+
+    def test_store_concurrently(self):
+        """Tests that entries stored by several processes at the same time
+        are not lost"""
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            processes = [
+                multiprocessing.get_context("fork").Process(
+                    target=_store_files, args=(pathlib.Path(temporary_directory), name)
+                )
+                for name in ["a", "b", "c", "d"]
+            ]
+
+            for process in processes:
+                process.start()
+
+            for process in processes:
+                process.join()
+                self.assertEqual(process.exitcode, 0)
+
+            self.assertEqual(
+                len(dg.utils.download_cache.DownloadCache(pathlib.Path(temporary_directory) / "cache").get_entries()),
+                4 * 25,
+            )
+
+
+def _store_files(directory_path: pathlib.Path, name: str):
+    download_cache = dg.utils.download_cache.DownloadCache(directory_path / "cache")
+
+    for index in range(25):
+        path = directory_path / f"{name}{index}"
+        path.write_bytes(f"{name}{index}".encode())
+        download_cache.store(
+            f"https://example.com/{path.name}", f"https://example.com/{path.name}", path, name, None, None
+        )
+
+
+def _create_tar_gz_archive(files: dict[str, bytes]) -> bytes:
+    with io.BytesIO() as buffer:
+        with tarfile.open(fileobj=buffer, mode="w:gz") as tar_file:
+            for name, content in files.items():
+                tar_info = tarfile.TarInfo(name)
+                tar_info.size = len(content)
+                tar_file.addfile(tar_info, io.BytesIO(content))
+
+        return buffer.getvalue()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+#  Copyright 2020 IBM Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import unittest
+import unittest.mock
+
+import requests
+
+from dg.utils.http import DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT, HTTPSession, get_http_session
+from test.utils.local_http_server import LocalHTTPServer
+
+
+class TestHTTPSession(unittest.TestCase):
+    def test_connection_reuse(self):
+        """Tests that subsequent requests to the same host reuse a pooled
+        connection"""
+
+        with LocalHTTPServer({"/a": b"a", "/b": b"b"}) as server, HTTPSession() as session:
+            self.assertEqual(session.get(server.get_url("/a").geturl()).content, b"a")
+            self.assertEqual(session.get(server.get_url("/b").geturl()).content, b"b")
+
+            pools = session.get_adapter(server.get_url("/a").geturl()).poolmanager.pools
+            connection_pools = [pools[key] for key in pools.keys()]
+
+            self.assertEqual(len(connection_pools), 1)
+            self.assertEqual(connection_pools[0].num_connections, 1)
+            self.assertEqual(connection_pools[0].num_requests, 2)
+
+    def test_cookies(self):
+        """Tests that cookies are neither stored nor sent"""
+
+        with LocalHTTPServer(
+            {"/a": b"a", "/b": b"b"}, headers={"/a": {"Set-Cookie": "session=secret; Path=/"}}
+        ) as server, HTTPSession() as session:
+            session.get(server.get_url("/a").geturl())
+            session.get(server.get_url("/b").geturl())
+
+            self.assertEqual(len(session.cookies), 0)
+            self.assertNotIn("Cookie", server.requests[1][1])
+
+    def test_request_defaults(self):
+        """Tests that timeouts and the TLS verification policy of a session
+        are applied unless they are passed explicitly"""
+
+        with unittest.mock.patch.object(requests.Session, "request") as request:
+            get_http_session(verify=False).get("https://example.com")
+
+            self.assertEqual(request.call_args.kwargs["timeout"], (DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT))
+            self.assertFalse(request.call_args.kwargs["verify"])
+
+            get_http_session().get("https://example.com", timeout=1)
+
+            self.assertEqual(request.call_args.kwargs["timeout"], 1)
+            self.assertTrue(request.call_args.kwargs["verify"])
+
+        self.assertIs(get_http_session(), get_http_session())
+        self.assertIsNot(get_http_session(), get_http_session(verify=False))
+
+
+if __name__ == "__main__":
+    unittest.main()
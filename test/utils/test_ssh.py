@@ -0,0 +1,497 @@
+#  Copyright 2020 IBM Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import asyncio
+import os
+import pathlib
+import shlex
+import subprocess
+import sys
+import tempfile
+import unittest
+import unittest.mock
+
+import asyncssh
+
+import dg.utils.ssh
+import dg.utils.ssh_agent
+
+from test.utils.local_ssh_server import LocalSSHServer
+
+
+class TestSSHConnectionPool(unittest.IsolatedAsyncioTestCase):
+    async def test_connection_reuse(self):
+        """Tests that clients for the same host and user share a single
+        connection and that idle connections are closed"""
+
+        connection_pool = dg.utils.ssh.SSHConnectionPool(idle_timeout=0.05)
+
+        with unittest.mock.patch("asyncssh.connect") as connect_mock:
+            connect_mock.side_effect = lambda *args, **kwargs: self._create_connection_mock()
+
+            async with dg.utils.ssh.RemoteClient("host1", connection_pool=connection_pool) as remote_client_1:
+                async with dg.utils.ssh.RemoteClient("host1", connection_pool=connection_pool) as remote_client_2:
+                    await asyncio.gather(remote_client_1.connect(), remote_client_2.connect())
+
+                    async with dg.utils.ssh.RemoteClient("host2", connection_pool=connection_pool) as remote_client_3:
+                        await remote_client_3.connect()
+
+            self.assertEqual(connect_mock.call_count, 2)
+
+            connection = await connection_pool.acquire("host1")
+
+            self.assertEqual(connect_mock.call_count, 2)
+
+            connection_pool.release("host1")
+
+            await asyncio.sleep(0.1)
+
+            connection.close.assert_called_once()
+
+            await connection_pool.acquire("host1")
+
+            self.assertEqual(connect_mock.call_count, 3)
+
+            await connection_pool.close()
+
+    async def test_tunnelled_connection(self):
+        """Tests that connections to worker nodes are tunnelled through the
+        pooled connection to the jump host"""
+
+        connection_pool = dg.utils.ssh.SSHConnectionPool(idle_timeout=0.05)
+
+        async def load_jump_host_known_hosts(self, pooled_connection, jump_host):
+            pooled_connection.is_known_hosts_loaded = True
+            pooled_connection.known_hosts = unittest.mock.MagicMock()
+
+        with unittest.mock.patch("asyncssh.connect") as connect_mock, unittest.mock.patch.object(
+            dg.utils.ssh.SSHConnectionPool, "_load_jump_host_known_hosts", load_jump_host_known_hosts
+        ):
+            connect_mock.side_effect = lambda *args, **kwargs: self._create_connection_mock()
+
+            async with dg.utils.ssh.RemoteClient("infrastructure", connection_pool=connection_pool) as remote_client:
+                await remote_client.connect()
+
+                node_clients = [
+                    remote_client.create_tunnelled_client(node) for node in ["worker0", "worker1", "worker0"]
+                ]
+
+                await asyncio.gather(*[node_client.connect() for node_client in node_clients])
+
+                jump_host_connection = await connection_pool.acquire("infrastructure")
+                connection_pool.release("infrastructure")
+
+                self.assertEqual(connect_mock.call_count, 3)
+
+                for call in connect_mock.call_args_list[1:]:
+                    self.assertIs(call.kwargs["tunnel"], jump_host_connection)
+                    self.assertEqual(call.kwargs["username"], "core")
+
+                for node_client in node_clients:
+                    await node_client.disconnect()
+
+            await asyncio.sleep(0.2)
+
+            # the connection to the jump host is closed after the tunnelled
+            # connections were closed
+            jump_host_connection.close.assert_called_once()
+
+    @unittest.skipIf(sys.platform == "win32", "requires a POSIX shell")
+    async def test_load_jump_host_known_hosts(self):
+        """Tests that host keys of tunnelled connections are checked against
+        the known hosts of the user on the jump host (private keys are not
+        read from the jump host)"""
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            host_key = asyncssh.generate_private_key("ssh-ed25519")
+            (pathlib.Path(temporary_directory) / ".ssh").mkdir()
+            (pathlib.Path(temporary_directory) / ".ssh" / "known_hosts").write_bytes(
+                b"worker0 " + host_key.export_public_key()
+            )
+
+            async with LocalSSHServer(pathlib.Path(temporary_directory)) as server:
+                async with dg.utils.ssh.SSHConnectionPool(
+                    connect_options=server.get_connect_options()
+                ) as connection_pool:
+                    jump_host = ("127.0.0.1", "root")
+                    jump_host_connection = await connection_pool.acquire(*jump_host)
+
+                    with unittest.mock.patch("asyncssh.connect") as connect_mock:
+                        connect_mock.side_effect = lambda *args, **kwargs: self._create_connection_mock()
+
+                        await connection_pool.acquire("worker0", "core", jump_host)
+
+                        self.assertEqual(connect_mock.call_count, 1)
+                        self.assertIs(connect_mock.call_args.kwargs["tunnel"], jump_host_connection)
+                        self.assertNotIn("client_keys", connect_mock.call_args.kwargs)
+                        self.assertFalse(connection_pool.is_relayed("worker0", "core", jump_host))
+                        self.assertEqual(
+                            [
+                                key.public_data
+                                for key in connect_mock.call_args.kwargs["known_hosts"].match("worker0", "", None)[0]
+                            ],
+                            [host_key.public_data],
+                        )
+
+                        connection_pool.release("worker0", "core", jump_host)
+
+                    connection_pool.release(*jump_host)
+
+    async def _create_connection_mock(self) -> unittest.mock.MagicMock:
+        connection_mock = unittest.mock.MagicMock()
+        connection_mock.is_closed.return_value = False
+        connection_mock.wait_closed = unittest.mock.AsyncMock()
+
+        return connection_mock
+
+
+@unittest.skipIf(sys.platform == "win32", "requires a POSIX shell")
+class TestRemoteClient(unittest.IsolatedAsyncioTestCase):
+    async def test_upload(self):
+        """Tests that identical files are skipped and that directories may be
+        uploaded with and without compression"""
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            local_directory_path = pathlib.Path(temporary_directory) / "local"
+            remote_root_directory_path = pathlib.Path(temporary_directory) / "remote"
+
+            (local_directory_path / "subdirectory").mkdir(parents=True)
+            (local_directory_path / "file.txt").write_text("file")
+            (local_directory_path / "subdirectory" / "nested file.txt").write_text("nested file")
+            remote_root_directory_path.mkdir()
+
+            async with LocalSSHServer(remote_root_directory_path) as server:
+                async with dg.utils.ssh.SSHConnectionPool(
+                    connect_options=server.get_connect_options()
+                ) as connection_pool:
+                    async with dg.utils.ssh.RemoteClient("127.0.0.1", connection_pool=connection_pool) as remote_client:
+                        await remote_client.connect()
+
+                        # single file
+                        self.assertEqual(await remote_client.upload(local_directory_path / "file.txt"), 1)
+                        self.assertEqual(await remote_client.upload(local_directory_path / "file.txt"), 0)
+                        self.assertEqual((remote_root_directory_path / "file.txt").read_text(), "file")
+
+                        (local_directory_path / "file.txt").write_text("elif")
+
+                        self.assertEqual(await remote_client.upload(local_directory_path / "file.txt"), 1)
+                        self.assertEqual((remote_root_directory_path / "file.txt").read_text(), "elif")
+
+                        # directory
+                        self.assertEqual(await remote_client.upload(local_directory_path, "uncompressed"), 2)
+                        self.assertEqual(await remote_client.upload(local_directory_path, "uncompressed"), 0)
+                        self.assertEqual(
+                            (
+                                remote_root_directory_path / "uncompressed" / "subdirectory" / "nested file.txt"
+                            ).read_text(),
+                            "nested file",
+                        )
+
+                        self.assertEqual(
+                            await remote_client.upload(local_directory_path, "compressed", compress=True), 2
+                        )
+                        self.assertEqual(
+                            await remote_client.upload(local_directory_path, "compressed", compress=True), 0
+                        )
+                        self.assertEqual(
+                            (
+                                remote_root_directory_path / "compressed" / "subdirectory" / "nested file.txt"
+                            ).read_text(),
+                            "nested file",
+                        )
+
+                        # download
+                        await remote_client.download("uncompressed/file.txt", local_directory_path / "downloaded.txt")
+
+                        self.assertEqual((local_directory_path / "downloaded.txt").read_text(), "elif")
+
+                        # batch
+                        batch = dg.utils.ssh.RemoteBatch()
+                        batch.add_payload_file(local_directory_path / "file.txt")
+                        batch.add_step("read payload", "cat file.txt")
+                        batch.add_step("fail", "exit 3")
+
+                        result = await remote_client.execute_batch(batch, print_output=False, check=False)
+
+                        self.assertEqual(result.get_failed_step_name(), "fail")
+                        self.assertEqual(result.output, "elif")
+
+    async def test_relayed_commands(self):
+        """Tests that commands are relayed through ssh on the jump host if the
+        user on the jump host has no known hosts file or if no private key of
+        the local user is authorized"""
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            bin_directory_path = pathlib.Path(temporary_directory) / "bin"
+            local_directory_path = pathlib.Path(temporary_directory) / "local"
+            remote_root_directory_path = pathlib.Path(temporary_directory) / "remote"
+            ssh_log_file_path = pathlib.Path(temporary_directory) / "ssh.log"
+
+            for directory_path in [bin_directory_path, local_directory_path, remote_root_directory_path]:
+                directory_path.mkdir()
+
+            # fake ssh client executing the command locally
+            (bin_directory_path / "ssh").write_text(
+                "#!/bin/sh\n"
+                f'echo "$*" >> {shlex.quote(str(ssh_log_file_path))}\n'
+                'while [ "$1" != "${1#-}" ]; do [ "$1" = "-o" ] && shift; shift; done\n'
+                "shift\n"
+                'exec sh -c "$1"\n'
+            )
+
+            (bin_directory_path / "ssh").chmod(0o755)
+            (local_directory_path / "file.txt").write_text("file")
+
+            async with LocalSSHServer(remote_root_directory_path) as server:
+                with unittest.mock.patch.dict(
+                    os.environ, {"PATH": f"{bin_directory_path}{os.pathsep}{os.environ['PATH']}"}
+                ):
+                    async with dg.utils.ssh.SSHConnectionPool(
+                        connect_options=server.get_connect_options()
+                    ) as connection_pool:
+                        async with dg.utils.ssh.RemoteClient(
+                            "127.0.0.1", connection_pool=connection_pool
+                        ) as remote_client:
+                            await remote_client.connect()
+
+                            # no known hosts file
+                            async with remote_client.create_tunnelled_client("worker0") as node_client:
+                                await node_client.connect()
+
+                                self.assertTrue(connection_pool.is_relayed("worker0", "core", ("127.0.0.1", "root")))
+                                self.assertEqual(
+                                    await node_client.execute("cat", input="input", print_output=False), "input"
+                                )
+                                self.assertEqual(await node_client.upload(local_directory_path / "file.txt"), 1)
+                                self.assertEqual((remote_root_directory_path / "file.txt").read_text(), "file")
+
+                                await node_client.download("file.txt", local_directory_path / "downloaded.txt")
+
+                                self.assertEqual((local_directory_path / "downloaded.txt").read_text(), "file")
+
+                                batch = dg.utils.ssh.RemoteBatch()
+                                batch.add_payload_file(local_directory_path / "file.txt")
+                                batch.add_step("read payload", "cat file.txt")
+                                batch.add_step("fail", "exit 3")
+
+                                result = await node_client.execute_batch(batch, print_output=False, check=False)
+
+                                self.assertEqual(result.get_failed_step_name(), "fail")
+                                self.assertEqual(result.output, "file")
+
+                    # no authorized private key
+                    (remote_root_directory_path / ".ssh").mkdir()
+                    (remote_root_directory_path / ".ssh" / "known_hosts").write_bytes(
+                        b"worker1 " + asyncssh.generate_private_key("ssh-ed25519").export_public_key()
+                    )
+
+                    async with dg.utils.ssh.SSHConnectionPool(
+                        connect_options=server.get_connect_options()
+                    ) as connection_pool:
+                        async with dg.utils.ssh.RemoteClient(
+                            "127.0.0.1", connection_pool=connection_pool
+                        ) as remote_client:
+                            await remote_client.connect()
+
+                            with unittest.mock.patch(
+                                "asyncssh.connect", side_effect=asyncssh.PermissionDenied("Permission denied")
+                            ) as connect_mock:
+                                async with remote_client.create_tunnelled_client("worker1") as node_client:
+                                    await node_client.connect()
+
+                                    connect_mock.assert_called_once()
+                                    self.assertEqual(
+                                        await node_client.execute("echo worker1", print_output=False), "worker1\n"
+                                    )
+
+            ssh_log_lines = ssh_log_file_path.read_text().splitlines()
+
+            self.assertTrue(all(line.startswith("-q -o BatchMode=yes core@worker") for line in ssh_log_lines))
+            self.assertEqual(ssh_log_lines[-1], "-q -o BatchMode=yes core@worker1 echo worker1")
+
+    async def test_recorder(self):
+        """Tests that commands and batch steps are recorded and that the output
+        of each host is written to its own log file"""
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            remote_root_directory_path = pathlib.Path(temporary_directory) / "remote"
+            remote_root_directory_path.mkdir()
+            recorder = dg.utils.ssh.RemoteExecutionRecorder(pathlib.Path(temporary_directory) / "run")
+
+            async with LocalSSHServer(remote_root_directory_path) as server:
+                async with dg.utils.ssh.SSHConnectionPool(
+                    connect_options=server.get_connect_options()
+                ) as connection_pool:
+                    async with dg.utils.ssh.RemoteClient(
+                        "127.0.0.1", connection_pool=connection_pool, recorder=recorder
+                    ) as remote_client:
+                        await remote_client.connect()
+                        await remote_client.execute("cat", input="input", print_output=False)
+
+                        with self.assertRaises(asyncssh.ProcessError):
+                            await remote_client.execute("sleep 0.2; exit 2", print_output=False)
+
+                        batch = dg.utils.ssh.RemoteBatch()
+                        batch.add_step("step", "echo step")
+
+                        await remote_client.execute_batch(batch, print_output=False)
+
+            self.assertEqual(
+                [(record.command, record.exit_code) for record in recorder.records],
+                [("cat", 0), ("sleep 0.2; exit 2", 2), ("batch (1 step(s))", 0), ("step", 0)],
+            )
+
+            self.assertEqual((recorder.records[0].input_size, recorder.records[0].output_size), (5, 5))
+            self.assertTrue(recorder.get_summary(1).splitlines()[-1].startswith("127.0.0.1  sleep 0.2; exit 2"))
+
+            log = recorder.get_log_file_path("127.0.0.1").read_text()
+
+            self.assertIn("] cat\ninput\n<== exit code 0", log)
+            self.assertIn("] batch (1 step(s)): step\nstep\n", log)
+
+
+@unittest.skipIf(sys.platform == "win32", "requires Unix domain sockets")
+class TestSSHAgent(unittest.IsolatedAsyncioTestCase):
+    async def test_ssh_agent(self):
+        """Tests that sessions and SFTP channels are forwarded by the SSH agent
+        to a pooled connection shared by separate connection pools"""
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            remote_root_directory_path = pathlib.Path(temporary_directory) / "remote"
+            remote_root_directory_path.mkdir()
+            socket_path = pathlib.Path(temporary_directory) / "ssh-agent.sock"
+
+            async with LocalSSHServer(remote_root_directory_path) as server:
+                agent = dg.utils.ssh_agent.SSHAgent(
+                    socket_path, 60, dg.utils.ssh.SSHConnectionPool(connect_options=server.get_connect_options())
+                )
+
+                await agent.start()
+
+                agent_task = asyncio.create_task(agent.wait_stopped())
+
+                for i in range(2):
+                    # each connection pool represents a separate Data Gate CLI
+                    # process
+                    async with dg.utils.ssh.SSHConnectionPool() as connection_pool:
+                        connection_pool.use_ssh_agent(socket_path)
+
+                        async with dg.utils.ssh.RemoteClient(
+                            "127.0.0.1", connection_pool=connection_pool
+                        ) as remote_client:
+                            await remote_client.connect()
+
+                            self.assertEqual(
+                                await remote_client.execute("cat; exit 0", print_output=False, input=f"input {i}"),
+                                f"input {i}",
+                            )
+
+                            (
+                                await remote_client.download("file.txt", pathlib.Path(temporary_directory) / "file.txt")
+                                if (i == 1)
+                                else (remote_root_directory_path / "file.txt").write_text("file")
+                            )
+
+                            with self.assertRaises(asyncssh.ProcessError):
+                                await remote_client.execute("exit 3", print_output=False)
+
+                self.assertEqual((pathlib.Path(temporary_directory) / "file.txt").read_text(), "file")
+
+                agent_status = await dg.utils.ssh_agent.get_ssh_agent_status(socket_path)
+
+                self.assertEqual(agent_status["connections"], ["root@127.0.0.1"])
+
+                self.assertTrue(await dg.utils.ssh_agent.stop_ssh_agent(socket_path))
+
+                await agent_task
+
+                self.assertFalse(socket_path.exists())
+                self.assertFalse(await dg.utils.ssh_agent.stop_ssh_agent(socket_path))
+
+        self.assertEqual(
+            dg.utils.ssh.parse_ssh_agent_username(
+                dg.utils.ssh.get_ssh_agent_username("worker0", "core", ("infrastructure", "root"))
+            ),
+            ("worker0", "core", ("infrastructure", "root")),
+        )
+
+
+class TestRemoteClientSSHSession(unittest.TestCase):
+    def test_output_capture(self):
+        """Tests that output is streamed to callbacks and that only the tail
+        of the output is stored if the capture limit is exceeded"""
+
+        chunks: list[tuple[str, bool]] = []
+        session = dg.utils.ssh.create_remote_client_ssh_session(
+            False, lambda chunk, is_stderr: chunks.append((chunk, is_stderr)), 10
+        )()
+
+        for i in range(1000):
+            session.data_received(f"{i % 10}", None)
+
+        session.data_received("error", asyncssh.EXTENDED_DATA_STDERR)
+
+        self.assertEqual(len(chunks), 1001)
+        self.assertEqual(chunks[-1], ("error", True))
+        self.assertEqual(session.get_received_data(), "56789error")
+        self.assertEqual(session.get_discarded_size(), 995)
+
+        session = dg.utils.ssh.create_remote_client_ssh_session(False)()
+
+        for i in range(1000):
+            session.data_received("line\n", None)
+
+        self.assertEqual(session.get_received_data(), "line\n" * 1000)
+        self.assertEqual(session.get_discarded_size(), 0)
+
+
+@unittest.skipIf(sys.platform == "win32", "requires a POSIX shell")
+class TestRemoteBatch(unittest.TestCase):
+    def test_remote_batch(self):
+        """Tests that steps and payload files are executed in a single session
+        and that the failed step is reported"""
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            payload_file_path = pathlib.Path(temporary_directory) / "payload.txt"
+            payload_file_path.write_text("payload")
+
+            working_directory_path = pathlib.Path(temporary_directory) / "remote"
+            working_directory_path.mkdir()
+
+            batch = dg.utils.ssh.RemoteBatch()
+            batch.add_payload_file(payload_file_path)
+            batch.add_step("read payload", "cat payload.txt")
+            batch.add_step("quoting", "echo \"'quoted'\" | tr a-z A-Z")
+            batch.add_step("fail", "exit 3")
+            batch.add_step("not executed", "touch not-executed")
+
+            completed_process = subprocess.run(
+                ["sh", "-c", batch.get_command()],
+                capture_output=True,
+                cwd=working_directory_path,
+                input=batch.get_input(),
+                text=True,
+            )
+
+            result = batch.parse_output(completed_process.returncode, completed_process.stdout)
+
+            self.assertEqual(result.exit_code, 3)
+            self.assertEqual(result.get_failed_step_name(), "fail")
+            self.assertEqual([step_result.exit_code for step_result in result.step_results], [0, 0, 3])
+            self.assertEqual(result.output, "payload'QUOTED'\n")
+            self.assertEqual(sorted(path.name for path in working_directory_path.iterdir()), ["payload.txt"])
+
+
+if __name__ == "__main__":
+    unittest.main()